@@ -0,0 +1,58 @@
+import typing
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+from src.utilities.core.profiler import is_admin_token, list_profiles, load_report
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+class ProfileListResponse(BaseModel):
+    request_ids: list[str]
+
+
+async def require_admin(x_admin_token: typing.Optional[str] = Header(default=None)) -> None:
+    # Without a configured token the admin endpoints do not exist.
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+
+@router.get(
+    "/profiles",
+    name="admin:list-profiles",
+    response_model=ProfileListResponse,
+    dependencies=[Depends(require_admin)],
+)
+async def get_profiles() -> ProfileListResponse:
+    """
+    Lists the request ids of stored profiles, most recent first.
+    """
+    return ProfileListResponse(request_ids=list_profiles())
+
+
+@router.get(
+    "/profiles/{request_id}",
+    name="admin:get-profile",
+    dependencies=[Depends(require_admin)],
+)
+async def get_profile(
+    request_id: str,
+    format: typing.Literal["text", "pstats"] = Query(default="text"),
+    limit: int = Query(default=50, ge=1, le=1000),
+) -> Response:
+    """
+    Returns the profile of a request: the functions with the most cumulative time as text, or
+    the merged pstats file, which snakeviz or flameprof render as a flame graph.
+    """
+    report = load_report(request_id, as_text=format == "text", limit=limit)
+    if report is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    if format == "text":
+        return Response(content=report, media_type="text/plain; charset=utf-8")
+    return Response(
+        content=report,
+        media_type="application/octet-stream",
+        headers={"Content-Disposition": f'attachment; filename="{request_id}.pstats"'},
+    )
@@ -4,6 +4,7 @@ from src.repository.crud.account import AccountCRUDRepository
 from src.utilities.exceptions.exceptions import EntityAlreadyExistsException, EntityDoesNotExistException
 import fastapi
 from src.api.dependencies.repository import get_repository
+from src.utilities.common.password import PasswordHasherBusy
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -51,6 +52,8 @@ async def signup(
 
     except EntityAlreadyExistsException as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except PasswordHasherBusy as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
@@ -79,5 +82,7 @@ async def signin(
 
     except EntityDoesNotExistException as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Invalid email or password.")
+    except PasswordHasherBusy as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal Server Error")
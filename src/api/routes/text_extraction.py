@@ -1,37 +1,121 @@
 from fastapi import Depends, HTTPException, Request
 from jose import JWTError
-from src.securities.authorizations.jwt import jwt_generator
+from src.securities.authorizations.principal import principal_cache
 from src.models.db.user import User
 from src.utilities.exceptions.exceptions import AuthorizationHeaderException
-import os
-from typing import Optional
-from fastapi import APIRouter, HTTPException, Depends, status, Request
-from pydantic import BaseModel
+import typing
+from datetime import datetime
+from typing import Literal, Optional
+from fastapi import APIRouter, HTTPException, Depends, Query, status, Request
+from pydantic import BaseModel, Field, field_validator
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.models.db.user import Document
-from src.utilities.common.text_extraction import extract_text_from_pdf, extract_text_from_docx, extract_text_from_doc, download_file_from_url
-from fastapi.responses import JSONResponse
+from src.models.db.user import TaskStatus
+from src.repository.crud.document import DocumentCRUDRepository
+from src.repository.crud.document_page import DocumentPageCRUDRepository
+from src.utilities.common.byte_range import parse_byte_range
+from src.utilities.common.cursor import decode_cursor, encode_cursor
+from src.repository.database import async_db
+from src.utilities.extraction.jobs import extraction_job_queue
+from src.utilities.extraction.options import ExtractionOptions, parse_page_ranges
+from src.utilities.extraction.chunks import PAGE_SEPARATOR_BYTES, body_spans, iter_page_chunks
+from src.utilities.extraction.executor import StageTimer, extraction_executor
+from src.utilities.extraction.pipeline import ExtractionOutcome, extraction_pipeline
+from src.utilities.extraction.stream import NDJSON_MEDIA_TYPE, SSE_MEDIA_TYPE, encode_record, iter_text_chunks
+from src.utilities.extraction.text_codec import decode_text, encode_text
+from src.utilities.extraction.upload import iter_uploaded_documents
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from src.api.dependencies.session import get_async_session
 from sqlalchemy.future import select
-from urllib.parse import urlparse
 from typing import List, Optional
-import requests
-from bs4 import BeautifulSoup
-from src.utilities.email.mailer import Mailer, get_mailer
+from loguru import logger
+from src.utilities.email.outbox import email_outbox
 
 router = APIRouter(prefix="/documents", tags=["Documents"])
 
+STORE_FAILED_ERROR = "The extraction result could not be stored."
+
 class FilePathOrUrlRequest(BaseModel):
     file_paths_or_urls: List[str]  
+    main_content_only: bool = False
+    extraction_mode: Literal["standard", "fast", "fidelity"] = "standard"
+    pages: Optional[str] = Field(None, description='1-based page selection, e.g. "1-5,8,10-".')
+    max_chars: Optional[int] = Field(None, ge=0)
+    time_budget_ms: Optional[int] = Field(None, gt=0)
+
+    @field_validator("pages")
+    @classmethod
+    def validate_pages(cls, pages: Optional[str]) -> Optional[str]:
+        if pages is not None:
+            parse_page_ranges(pages)
+        return pages
+
+    def extraction_options(self) -> ExtractionOptions:
+        return ExtractionOptions(
+            main_content_only=self.main_content_only,
+            extraction_mode=self.extraction_mode,
+            pages=self.pages,
+            max_chars=self.max_chars,
+            time_budget_ms=self.time_budget_ms,
+        )
 
 
 class ExtractionResultResponse(BaseModel):
-    task_id: int
+    task_id: Optional[int]
     status: str
     extracted_text: str
+    partial: bool = False
+    error: Optional[str] = None
+
+
+class ExtractionJobResponse(BaseModel):
+    task_id: int
+    status: str
+
+
+class DocumentStatusResponse(BaseModel):
+    task_id: int
+    status: str
+    file_path: Optional[str] = None
+    error: Optional[str] = None
+    partial: bool = False
+    extraction_mode: Optional[str] = None
+    extracted_text: Optional[str] = None
+
+
+class DocumentSummaryResponse(BaseModel):
+    task_id: int
+    status: str
+    file_path: Optional[str] = None
+    file_format: Optional[str] = None
+    uploaded_at: Optional[datetime] = None
+    partial: bool = False
+    extraction_mode: Optional[str] = None
+    error: Optional[str] = None
+
+
+class DocumentListResponse(BaseModel):
+    documents: List[DocumentSummaryResponse]
+    next_cursor: Optional[str] = None
+
+
+class SearchHitResponse(BaseModel):
+    task_id: int
+    file_path: Optional[str] = None
+    uploaded_at: Optional[datetime] = None
+    rank: float
+    snippet: Optional[str] = None
+
+
+class SearchResponse(BaseModel):
+    hits: List[SearchHitResponse]
+    next_cursor: Optional[str] = None
 
 
 def get_user_from_token(request: Request) -> User:
+    """
+    Authenticates the request through the principal cache. The returned transient `User` carries
+    the id from the token claims when it has one, so `_get_user_id` needs no query.
+    """
     try:
         token = request.headers.get("Authorization")
         if token is None:
@@ -40,95 +124,451 @@ def get_user_from_token(request: Request) -> User:
         if token.startswith("Bearer "):
             token = token[7:]
 
-        payload = jwt_generator.retrieve_details_from_token(token)
-        if len(payload) < 1:
-            raise HTTPException(status_code=401, detail="Invalid token payload.")
-        email = payload
-        user = User(email=email[0])
-
-        return user
+        principal = principal_cache.authenticate(token)
+        return User(id=principal.user_id, email=principal.email)
 
+    except HTTPException:
+        raise
     except JWTError:
         raise AuthorizationHeaderException(detail="Invalid or expired token.")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+async def _get_user_id(async_session: AsyncSession, user: User) -> int:
+    if user.id is not None:
+        return user.id
+    user_from_db = await async_session.execute(select(User).filter(User.email == user.email))
+    user_record = user_from_db.scalar_one_or_none()
+    if not user_record:
+        raise HTTPException(status_code=404, detail="User not found.")
+    return user_record.id
+
+
+def _document_values(outcome: ExtractionOutcome, user_id: int, options: ExtractionOptions) -> dict:
+    return dict(
+        file_path=outcome.file_path or outcome.source,
+        content_sha256=outcome.sha256,
+        file_format=outcome.file_format,
+        **encode_text(outcome.extracted_text),
+        plain_text=outcome.extracted_text,
+        extraction_status=TaskStatus.completed if outcome.succeeded else TaskStatus.failed,
+        error_message=outcome.error,
+        extraction_options=options.to_dict(),
+        extraction_mode=options.extraction_mode,
+        is_partial=outcome.partial,
+        user_id=user_id,
+    )
+
+
+def _documents_values(outcomes: List[ExtractionOutcome], user_id: int, options: ExtractionOptions) -> list[dict]:
+    return [_document_values(outcome, user_id, options) for outcome in outcomes]
+
+
+def _result_status(outcome: ExtractionOutcome, document_id: Optional[int]) -> tuple[str, Optional[str]]:
+    if document_id is None:
+        return "failed", STORE_FAILED_ERROR
+    return ("completed" if outcome.succeeded else "failed"), outcome.error
+
+
+def _queue_completion_email(
+    user: User, user_id: int, succeeded: int, failed: int, async_session: AsyncSession
+) -> None:
+    # Only queued here: the outbox sends it in the background once the session is committed.
+    if not failed:
+        subject = "Document Extraction Completed"
+        summary = f"Your document extraction has been successfully completed ({succeeded} document(s))."
+    elif succeeded:
+        subject = "Document Extraction Completed With Errors"
+        summary = f"Your document extraction has completed: {succeeded} document(s) succeeded and {failed} failed."
+    else:
+        subject = "Document Extraction Failed"
+        summary = f"Your document extraction has failed for all {failed} document(s)."
+    body = f"Dear {user.email},\n\n{summary}\n\nThanks & regards"
+    email_outbox.enqueue(
+        async_session, to_email=user.email, subject=subject, body=body, kind="extraction_completed", user_id=user_id
+    )
+
+
+async def _store_extraction_results(
+    outcomes: List[ExtractionOutcome],
+    options: ExtractionOptions,
+    user: User,
+    user_id: int,
+    async_session: AsyncSession,
+    timer: StageTimer,
+) -> JSONResponse:
+    # Compressing the texts is CPU work on large strings, so it runs off the event loop.
+    rows = await extraction_executor.run_io("compress", _documents_values, outcomes, user_id, options, timer=timer)
+    with timer.stage("persist"):
+        document_ids = await DocumentCRUDRepository(async_session=async_session).create_many(rows)
+
+        extraction_results = []
+        for outcome, document_id in zip(outcomes, document_ids):
+            result_status, error = _result_status(outcome, document_id)
+            extraction_results.append(
+                ExtractionResultResponse(
+                    task_id=document_id,
+                    status=result_status,
+                    extracted_text=outcome.extracted_text or "",
+                    partial=outcome.partial,
+                    error=error,
+                )
+            )
+
+        # Counted from what was stored, so documents that could not be saved are reported as failed.
+        succeeded = sum(1 for result in extraction_results if result.status == "completed")
+        _queue_completion_email(user, user_id, succeeded, len(extraction_results) - succeeded, async_session)
+        await async_session.commit()
+
+    logger.info(f"Extraction timings for {len(outcomes)} file(s) | {timer.summary()}")
+
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content=[result.dict() for result in extraction_results]
+    )
+
+
+async def _stream_extraction_results(
+    file_paths_or_urls: List[str],
+    options: ExtractionOptions,
+    user: User,
+    user_id: int,
+    timer: StageTimer,
+    sse: bool,
+    page_chunks: bool,
+) -> typing.AsyncIterator[bytes]:
+    """
+    Emits one `document` record per input as soon as it is extracted and stored, in completion
+    order; `index` refers to the position in the request. With `page_chunks` the text follows in
+    `page` records instead of being inlined, and an `end` record closes the stream.
+    """
+    # The request's session is closed before a streaming body runs, so the stream uses its own.
+    async with async_db.async_session_factory() as async_session:
+        repository = DocumentCRUDRepository(async_session=async_session)
+        succeeded = 0
+        async for index, outcome in extraction_pipeline.iter_many(file_paths_or_urls, timer=timer, options=options):
+            [values] = await extraction_executor.run_io(
+                "compress", _documents_values, [outcome], user_id, options, timer=timer
+            )
+            with timer.stage("persist"):
+                [document_id] = await repository.create_many([values])
+            result_status, error = _result_status(outcome, document_id)
+            succeeded += result_status == "completed"
+
+            yield encode_record(
+                {
+                    "type": "document",
+                    "index": index,
+                    "task_id": document_id,
+                    "file_path": values["file_path"],
+                    "status": result_status,
+                    "error": error,
+                    "partial": outcome.partial,
+                    "extracted_text": None if page_chunks else outcome.extracted_text or "",
+                },
+                sse=sse,
+            )
+            if page_chunks and outcome.extracted_text:
+                for page, text in enumerate(iter_text_chunks(outcome.extracted_text), start=1):
+                    yield encode_record(
+                        {"type": "page", "index": index, "task_id": document_id, "page": page, "text": text},
+                        sse=sse,
+                    )
+
+        _queue_completion_email(user, user_id, succeeded, len(file_paths_or_urls) - succeeded, async_session)
+        await async_session.commit()
+
+    logger.info(f"Extraction timings for {len(file_paths_or_urls)} streamed file(s) | {timer.summary()}")
+    yield encode_record({"type": "end", "documents": len(file_paths_or_urls)}, sse=sse)
+
+
 @router.post("/extract", response_model=List[ExtractionResultResponse])
 async def extract_text_from_documents(
     request: FilePathOrUrlRequest,\
     user: User = Depends(get_user_from_token),
     async_session: AsyncSession = Depends(get_async_session),
-    mailer: Mailer = Depends(get_mailer),
+    mode: Literal["sync", "async"] = Query("sync"),
+    stream: Optional[Literal["ndjson", "sse"]] = Query(None),
+    page_chunks: bool = Query(False),
 ):
-    try:
-        user_from_db = await async_session.execute(select(User).filter(User.email == user.email))
-        user_record = user_from_db.scalar_one_or_none()
-        if not user_record:
-            raise HTTPException(status_code=404, detail="User not found.")
-        user_id = user_record.id
+    """
+    In `sync` mode the extracted text is returned directly. In `async` mode pending documents are
+    created and their ids returned at once; poll `GET /documents/{task_id}` for the result.
 
-        extraction_results = []
+    With `stream`, sync results are sent as NDJSON lines or server-sent events, one per document as
+    it finishes, instead of a single JSON array; `page_chunks` splits each text into per-page records.
+    """
+    try:
+        user_id = await _get_user_id(async_session, user)
 
-        for file_path_or_url in request.file_paths_or_urls:
-            print(">>>>>>>>>",file_path_or_url)
-            file_path = None
-            extracted_text = None
-            file_format = None
-
-            if file_path_or_url:
-                # If it's a URL, we download the file
-                if urlparse(file_path_or_url).scheme in ["http", "https", "ftp"]:  # Check if it's a valid URL
-                    file_path = download_file_from_url(file_path_or_url, "temp/")
-                    file_format = file_path.split('.')[-1].lower()
-                # Else, we assume it's a local file path
-                elif os.path.exists(file_path_or_url):
-                    file_path = file_path_or_url
-                    file_format = file_path.split('.')[-1].lower()
-                else:
-                    raise HTTPException(status_code=400, detail="Invalid file path or URL.")
-
-            if not file_format:
-                raise HTTPException(status_code=400, detail="Unable to detect file format.")
-
-            if file_format == "pdf":
-                extracted_text = extract_text_from_pdf(file_path)
-            elif file_format == "docx":
-                extracted_text = extract_text_from_docx(file_path)
-            elif file_format == "doc":
-                extracted_text = extract_text_from_doc(file_path)
-            else:
-                print("file_format - ",file_format)
-                response = requests.get(file_path_or_url)
-                soup = BeautifulSoup(response.content, 'html.parser')
-                extracted_text = soup.get_text()
-
-            document = Document(
-                file_path=file_path,
-                extracted_text=extracted_text,
-                extraction_status="completed",
-                user_id=user_id,
+        if mode == "async":
+            documents = await DocumentCRUDRepository(async_session=async_session).create_pending(
+                user_id, request.file_paths_or_urls, request.extraction_options()
+            )
+            await extraction_job_queue.submit([document.id for document in documents])
+            return JSONResponse(
+                status_code=status.HTTP_202_ACCEPTED,
+                content=[
+                    ExtractionJobResponse(task_id=document.id, status="pending").dict()
+                    for document in documents
+                ],
             )
-            async_session.add(document)
-            await async_session.commit()
-            await async_session.refresh(document)
 
-            extraction_results.append(
-                ExtractionResultResponse(
-                    task_id=document.id,
-                    status="completed",
-                    extracted_text=extracted_text,
-                )
+        timer = StageTimer()
+        options = request.extraction_options()
+        if stream:
+            return StreamingResponse(
+                _stream_extraction_results(
+                    request.file_paths_or_urls,
+                    options,
+                    user,
+                    user_id,
+                    timer,
+                    sse=stream == "sse",
+                    page_chunks=page_chunks,
+                ),
+                media_type=SSE_MEDIA_TYPE if stream == "sse" else NDJSON_MEDIA_TYPE,
             )
 
-        subject = "Document Extraction Completed"
-        body = f"Dear {user.email},\n\nYour document extraction has been successfully completed.\n\Thanks & regards"
-        await mailer.send_email(to_email=user.email, subject=subject, body=body)
+        outcomes = await extraction_pipeline.extract_many(request.file_paths_or_urls, timer=timer, options=options)
+
+        return await _store_extraction_results(outcomes, options, user, user_id, async_session, timer)
 
-        return JSONResponse(
-            status_code=status.HTTP_200_OK,
-            content=[result.dict() for result in extraction_results]
+    except ValueError as e:
+        raise HTTPException(status_code=500, detail=f"Error processing file: {e}")
+
+
+@router.post("/upload", response_model=List[ExtractionResultResponse])
+async def upload_and_extract_documents(
+    request: Request,
+    user: User = Depends(get_user_from_token),
+    async_session: AsyncSession = Depends(get_async_session),
+    main_content_only: bool = Query(False),
+    extraction_mode: Literal["standard", "fast", "fidelity"] = Query("standard"),
+    pages: Optional[str] = Query(None),
+    max_chars: Optional[int] = Query(None, ge=0),
+    time_budget_ms: Optional[int] = Query(None, gt=0),
+):
+    """
+    Accepts files as multipart/form-data and streams each one into the extraction pipeline
+    while it is being received.
+    """
+    try:
+        options = ExtractionOptions(
+            main_content_only=main_content_only,
+            extraction_mode=extraction_mode,
+            pages=pages,
+            max_chars=max_chars,
+            time_budget_ms=time_budget_ms,
         )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        user_id = await _get_user_id(async_session, user)
+
+        timer = StageTimer()
+        outcomes = await extraction_pipeline.extract_uploads(
+            iter_uploaded_documents(request), timer=timer, options=options
+        )
+        if not outcomes:
+            raise HTTPException(status_code=400, detail="No files were uploaded.")
+
+        return await _store_extraction_results(outcomes, options, user, user_id, async_session, timer)
 
     except ValueError as e:
         raise HTTPException(status_code=500, detail=f"Error processing file: {e}")
+
+
+@router.get("", response_model=DocumentListResponse)
+async def list_documents(
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = Query(None),
+    status: Optional[Literal["pending", "in_progress", "completed", "failed"]] = Query(None),
+    file_format: Optional[Literal["pdf", "doc", "docx", "html"]] = Query(None),
+    user: User = Depends(get_user_from_token),
+    async_session: AsyncSession = Depends(get_async_session),
+) -> DocumentListResponse:
+    """
+    Lists the caller's documents, newest first, without their texts. Pass `next_cursor` back as
+    `cursor` for the following page; it is None on the last one.
+    """
+    try:
+        after = None
+        if cursor:
+            uploaded_at, document_id = decode_cursor(cursor, 2)
+            after = (datetime.fromisoformat(uploaded_at), int(document_id))
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+    user_id = await _get_user_id(async_session, user)
+    rows = await DocumentCRUDRepository(async_session=async_session).list_for_user(
+        user_id,
+        limit + 1,
+        after,
+        status=TaskStatus(status) if status else None,
+        file_format=file_format,
+    )
+    rows, more = rows[:limit], len(rows) > limit
+
+    return DocumentListResponse(
+        documents=[
+            DocumentSummaryResponse(
+                task_id=row.id,
+                status=row.extraction_status.value,
+                file_path=row.file_path,
+                file_format=row.file_format,
+                uploaded_at=row.uploaded_at,
+                partial=bool(row.is_partial),
+                extraction_mode=row.extraction_mode,
+                error=row.error_message,
+            )
+            for row in rows
+        ],
+        next_cursor=encode_cursor(rows[-1].uploaded_at, rows[-1].id) if more else None,
+    )
+
+
+@router.get("/search", response_model=SearchResponse)
+async def search_documents(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    user: User = Depends(get_user_from_token),
+    async_session: AsyncSession = Depends(get_async_session),
+) -> SearchResponse:
+    """
+    Full-text search over the caller's extracted documents, best matches first. Pass `next_cursor`
+    back as `cursor` for the following page; it is None on the last one.
+    """
+    try:
+        after = None
+        if cursor:
+            rank, document_id = decode_cursor(cursor, 2)
+            if not isinstance(rank, (int, float)) or not isinstance(document_id, int):
+                raise ValueError("Invalid cursor.")
+            after = (float(rank), document_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+    user_id = await _get_user_id(async_session, user)
+    repository = DocumentCRUDRepository(async_session=async_session)
+    rows = await repository.search_for_user(user_id, q, limit + 1, after)
+    rows, more = rows[:limit], len(rows) > limit
+
+    snippets = [row.snippet for row in rows]
+    compressed = [index for index, row in enumerate(rows) if row.compressed_text is not None]
+    if compressed:
+        texts = await extraction_executor.run_io(
+            "decompress",
+            lambda: [decode_text(None, rows[index].compressed_text, rows[index].text_codec) for index in compressed],
+        )
+        for index, snippet in zip(compressed, await repository.headlines(q, texts)):
+            snippets[index] = snippet
+
+    return SearchResponse(
+        hits=[
+            SearchHitResponse(
+                task_id=row.id, file_path=row.file_path, uploaded_at=row.uploaded_at, rank=row.rank, snippet=snippet
+            )
+            for row, snippet in zip(rows, snippets)
+        ],
+        next_cursor=encode_cursor(rows[-1].rank, rows[-1].id) if more else None,
+    )
+
+
+@router.get("/{document_id}", response_model=DocumentStatusResponse)
+async def get_document_status(
+    document_id: int,
+    include_text: bool = Query(False),
+    user: User = Depends(get_user_from_token),
+    async_session: AsyncSession = Depends(get_async_session),
+) -> DocumentStatusResponse:
+    user_id = await _get_user_id(async_session, user)
+
+    document = await DocumentCRUDRepository(async_session=async_session).find_for_user(
+        document_id, user_id, include_text=include_text
+    )
+    if document is None:
+        raise HTTPException(status_code=404, detail="Document not found.")
+
+    return DocumentStatusResponse(
+        task_id=document.id,
+        status=document.extraction_status.value,
+        file_path=document.file_path,
+        error=document.error_message,
+        partial=bool(document.is_partial),
+        extraction_mode=document.extraction_mode,
+        extracted_text=document.decoded_text if include_text else None,
+    )
+
+
+@router.get("/{document_id}/text")
+async def get_document_text(
+    document_id: int,
+    request: Request,
+    pages: Optional[str] = Query(None),
+    user: User = Depends(get_user_from_token),
+    async_session: AsyncSession = Depends(get_async_session),
+) -> Response:
+    """
+    Serves a document's extracted text as UTF-8, or only the selected `pages` (1-based, e.g. `10-20`,
+    counting the pages of the stored text) joined by form feeds. A single `Range: bytes=...` header
+    is served from that body with a 206; either way only the page chunks overlapping the requested
+    bytes are read from the database.
+    """
+    try:
+        options = ExtractionOptions(pages=pages)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    page_ranges = options.page_ranges if pages else None
+
+    user_id = await _get_user_id(async_session, user)
+    repository = DocumentCRUDRepository(async_session=async_session)
+    document = await repository.find_for_user(document_id, user_id)
+    if document is None:
+        raise HTTPException(status_code=404, detail="Document not found.")
+    if document.extraction_status != TaskStatus.completed:
+        raise HTTPException(status_code=409, detail="Document extraction has not completed.")
+
+    page_repository = DocumentPageCRUDRepository(async_session=async_session)
+    layout = await page_repository.find_layout(document_id, page_ranges)
+    contents: dict[int, bytes] = {}
+    # An empty layout either means no stored page falls in `pages`, which leaves an empty body, or
+    # that the document was stored without page chunks, which are then split from its full text.
+    if not layout and (page_ranges is None or not await page_repository.has_chunks(document_id)):
+        document = await repository.find_for_user(document_id, user_id, include_text=True)
+        chunks = [
+            chunk
+            for chunk in iter_page_chunks(document.decoded_text or "")
+            if pages is None or options.selects_page(chunk.page_number - 1)
+        ]
+        layout = [(chunk.chunk_index, chunk.page_number, len(chunk.content)) for chunk in chunks]
+        contents = {chunk.chunk_index: chunk.content for chunk in chunks}
+
+    spans, size = body_spans(layout)
+    try:
+        byte_range = parse_byte_range(request.headers.get("range"), size)
+    except ValueError as e:
+        raise HTTPException(status_code=416, detail=str(e), headers={"Content-Range": f"bytes */{size}"})
+    first, last = byte_range or (0, size - 1)
+
+    wanted = [span for span in spans if span.start <= last and span.start + span.length > first]
+    missing = [span.chunk_index for span in wanted if span.chunk_index is not None and span.chunk_index not in contents]
+    if missing:
+        contents.update(await page_repository.find_contents(document_id, missing))
+    body = b"".join(PAGE_SEPARATOR_BYTES if span.chunk_index is None else contents[span.chunk_index] for span in wanted)
+    if wanted:
+        body = body[first - wanted[0].start:last - wanted[0].start + 1]
+
+    headers = {"Accept-Ranges": "bytes"}
+    if byte_range is None:
+        return Response(content=body, media_type="text/plain; charset=utf-8", headers=headers)
+    headers["Content-Range"] = f"bytes {first}-{last}/{size}"
+    return Response(
+        content=body,
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type="text/plain; charset=utf-8",
+        headers=headers,
+    )
@@ -6,15 +6,35 @@ from sqlalchemy.ext.asyncio import AsyncEngine
 
 from src.repository.database import async_db
 from src.repository.events import dispose_db_connection, initialize_db_connection
+from src.utilities.common.password import password_hasher
+from src.utilities.core.metrics import runtime_monitor
+from src.utilities.email.outbox import email_outbox
+from src.utilities.extraction.downloader import http_downloader
+from src.utilities.extraction.executor import extraction_executor
+from src.utilities.extraction.jobs import extraction_job_queue
 
 def execute_backend_server_event_handler(backend_app: fastapi.FastAPI) -> typing.Any:
     async def launch_backend_server_events() -> None:
         await initialize_db_connection(backend_app=backend_app)
+        runtime_monitor.start(async_db.async_engine.pool)
+        extraction_executor.start()
+        password_hasher.start()
+        backend_app.state.extraction_executor = extraction_executor
+        backend_app.state.http_client = await http_downloader.start()
+        await extraction_job_queue.start()
+        backend_app.state.extraction_job_queue = extraction_job_queue
+        await email_outbox.start()
     return launch_backend_server_events
 
 
 def terminate_backend_server_event_handler(backend_app: fastapi.FastAPI) -> typing.Any:
     @loguru.logger.catch
     async def stop_backend_server_events() -> None:
+        await extraction_job_queue.stop()
+        await email_outbox.stop()
         await dispose_db_connection(backend_app=backend_app)
+        await http_downloader.close()
+        extraction_executor.shutdown()
+        password_hasher.shutdown()
+        await runtime_monitor.stop()
     return stop_backend_server_events
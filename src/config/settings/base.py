@@ -73,12 +73,67 @@ class BackendBaseSettings(BaseSettings):
     HASHING_ALGORITHM_LAYER_2: str = config("HASHING_ALGORITHM_LAYER_2", cast=str) 
     HASHING_SALT: str = config("HASHING_SALT", cast=str) 
     JWT_ALGORITHM: str = config("JWT_ALGORITHM", cast=str) 
+    PRINCIPAL_CACHE_TTL_SECONDS: float = config("PRINCIPAL_CACHE_TTL_SECONDS", default=300.0, cast=float) 
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = config("PRINCIPAL_CACHE_MAX_ENTRIES", default=10000, cast=int) 
+    PASSWORD_BCRYPT_ROUNDS: int = config("PASSWORD_BCRYPT_ROUNDS", default=12, cast=int) 
+    PASSWORD_HASH_WORKERS: int = config("PASSWORD_HASH_WORKERS", default=2, cast=int) 
+    PASSWORD_HASH_MAX_QUEUE_DEPTH: int = config("PASSWORD_HASH_MAX_QUEUE_DEPTH", default=32, cast=int) 
+    PASSWORD_HASH_QUEUE_TIMEOUT: float = config("PASSWORD_HASH_QUEUE_TIMEOUT", default=5.0, cast=float) 
     SMTP_SERVER: str = config("SMTP_SERVER", cast=str) 
     SMTP_PORT: int = config("SMTP_PORT", default=587, cast=int) 
     SMTP_USERNAME: str = config("SMTP_USERNAME", cast=str) 
     SMTP_PASSWORD: str = config("SMTP_PASSWORD", cast=str) 
     SMTP_USE_TLS: bool = config("SMTP_USE_TLS", default=True, cast=bool) 
     SMTP_FROM_EMAIL: str = config("SMTP_FROM_EMAIL", default="no-reply@test.com", cast=str) 
+    SMTP_TIMEOUT: float = config("SMTP_TIMEOUT", default=30.0, cast=float) 
+    EMAIL_SMTP_POOL_SIZE: int = config("EMAIL_SMTP_POOL_SIZE", default=2, cast=int) 
+    EMAIL_OUTBOX_BATCH_SIZE: int = config("EMAIL_OUTBOX_BATCH_SIZE", default=50, cast=int) 
+    EMAIL_OUTBOX_POLL_SECONDS: float = config("EMAIL_OUTBOX_POLL_SECONDS", default=5.0, cast=float) 
+    EMAIL_OUTBOX_LEASE_SECONDS: float = config("EMAIL_OUTBOX_LEASE_SECONDS", default=300.0, cast=float) 
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = config("EMAIL_OUTBOX_MAX_ATTEMPTS", default=8, cast=int) 
+    EMAIL_RETRY_BASE_SECONDS: float = config("EMAIL_RETRY_BASE_SECONDS", default=30.0, cast=float) 
+    EMAIL_RETRY_MAX_SECONDS: float = config("EMAIL_RETRY_MAX_SECONDS", default=3600.0, cast=float) 
+    EMAIL_DIGEST_WINDOW_SECONDS: float = config("EMAIL_DIGEST_WINDOW_SECONDS", default=30.0, cast=float) 
+    METRICS_SAMPLE_SECONDS: float = config("METRICS_SAMPLE_SECONDS", default=1.0, cast=float) 
+    METRICS_MULTIPROC_DIR: str = config("METRICS_MULTIPROC_DIR", default="/tmp/prometheus-multiproc", cast=str) 
+    PROFILER_ADMIN_TOKEN: str = config("PROFILER_ADMIN_TOKEN", default="", cast=str) 
+    PROFILER_SAMPLE_RATE: float = config("PROFILER_SAMPLE_RATE", default=0.0, cast=float) 
+    PROFILER_OUTPUT_DIR: str = config("PROFILER_OUTPUT_DIR", default="/tmp/request-profiles", cast=str) 
+    PROFILER_MAX_PROFILES: int = config("PROFILER_MAX_PROFILES", default=200, cast=int) 
+    EXTRACTION_PROCESS_WORKERS: int = config("EXTRACTION_PROCESS_WORKERS", default=os.cpu_count() or 1, cast=int) 
+    EXTRACTION_THREAD_WORKERS: int = config("EXTRACTION_THREAD_WORKERS", default=16, cast=int) 
+    EXTRACTION_MAX_QUEUE_DEPTH: int = config("EXTRACTION_MAX_QUEUE_DEPTH", default=64, cast=int) 
+    EXTRACTION_REQUEST_CONCURRENCY: int = config("EXTRACTION_REQUEST_CONCURRENCY", default=8, cast=int) 
+    EXTRACTION_GLOBAL_CONCURRENCY: int = config("EXTRACTION_GLOBAL_CONCURRENCY", default=32, cast=int) 
+    HTTP_CONNECT_TIMEOUT: float = config("HTTP_CONNECT_TIMEOUT", default=5.0, cast=float) 
+    HTTP_READ_TIMEOUT: float = config("HTTP_READ_TIMEOUT", default=30.0, cast=float) 
+    HTTP_MAX_CONNECTIONS: int = config("HTTP_MAX_CONNECTIONS", default=100, cast=int) 
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = config("HTTP_MAX_KEEPALIVE_CONNECTIONS", default=20, cast=int) 
+    HTTP_KEEPALIVE_EXPIRY: float = config("HTTP_KEEPALIVE_EXPIRY", default=30.0, cast=float) 
+    HTTP_ENABLE_HTTP2: bool = config("HTTP_ENABLE_HTTP2", default=True, cast=bool) 
+    DOWNLOAD_MAX_BYTES: int = config("DOWNLOAD_MAX_BYTES", default=100 * 1024 * 1024, cast=int) 
+    DOWNLOAD_CHUNK_SIZE: int = config("DOWNLOAD_CHUNK_SIZE", default=256 * 1024, cast=int) 
+    EXTRACTION_CACHE_ENABLED: bool = config("EXTRACTION_CACHE_ENABLED", default=True, cast=bool) 
+    EXTRACTION_CACHE_MAX_BYTES: int = config("EXTRACTION_CACHE_MAX_BYTES", default=256 * 1024 * 1024, cast=int) 
+    EXTRACTION_SPOOL_MAX_BYTES: int = config("EXTRACTION_SPOOL_MAX_BYTES", default=32 * 1024 * 1024, cast=int) 
+    EXTRACTION_TEMP_DIR: str = config("EXTRACTION_TEMP_DIR", default=str(ROOT_DIR / "temp"), cast=str) 
+    EXTRACTION_STREAM_SPILL_BYTES: int = config("EXTRACTION_STREAM_SPILL_BYTES", default=1024 * 1024, cast=int) 
+    UPLOAD_MAX_BYTES: int = config("UPLOAD_MAX_BYTES", default=100 * 1024 * 1024, cast=int) 
+    EXTRACTION_JOB_BACKEND: str = config("EXTRACTION_JOB_BACKEND", default="local", cast=str) 
+    EXTRACTION_JOB_WORKERS: int = config("EXTRACTION_JOB_WORKERS", default=4, cast=int) 
+    EXTRACTION_JOB_LEASE_SECONDS: float = config("EXTRACTION_JOB_LEASE_SECONDS", default=1800.0, cast=float) 
+    CELERY_BROKER_URL: str = config("CELERY_BROKER_URL", default="redis://localhost:6379/0", cast=str) 
+    PDF_PAGE_CHUNK_SIZE: int = config("PDF_PAGE_CHUNK_SIZE", default=25, cast=int) 
+    EXTRACTION_INLINE_COST_MS: float = config("EXTRACTION_INLINE_COST_MS", default=5.0, cast=float) 
+    STREAM_CHUNK_MAX_CHARS: int = config("STREAM_CHUNK_MAX_CHARS", default=1024 * 1024, cast=int) 
+    DB_COPY_MIN_ROWS: int = config("DB_COPY_MIN_ROWS", default=500, cast=int) 
+    TEXT_COMPRESSION: str = config("TEXT_COMPRESSION", default="none", cast=str) 
+    TEXT_COMPRESSION_LEVEL: int = config("TEXT_COMPRESSION_LEVEL", default=3, cast=int) 
+    TEXT_COMPRESSION_MIN_BYTES: int = config("TEXT_COMPRESSION_MIN_BYTES", default=4096, cast=int) 
+    SEARCH_TEXT_CONFIG: str = config("SEARCH_TEXT_CONFIG", default="english", cast=str) 
+    SEARCH_INDEX_MAX_CHARS: int = config("SEARCH_INDEX_MAX_CHARS", default=262144, cast=int) 
+    DOCUMENT_CHUNK_MAX_BYTES: int = config("DOCUMENT_CHUNK_MAX_BYTES", default=256 * 1024, cast=int) 
+    DOCUMENT_ERROR_MAX_CHARS: int = config("DOCUMENT_ERROR_MAX_CHARS", default=1000, cast=int) 
     ROOT_DIR: pathlib.Path = ROOT_DIR 
 
     class Config: 
@@ -11,11 +11,14 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)) + "/../")
 from fastapi.exceptions import RequestValidationError
 from loguru import logger
 from src.api.public_endpoints import router as public_api_endpoint_router
+from src.api.routes.metrics import router as metrics_router
 from src.config.events import (
     execute_backend_server_event_handler,
     terminate_backend_server_event_handler,
 )
 from src.config.manager import settings
+from src.utilities.core.metrics import prepare_multiprocess_dir
+from src.utilities.core.profiler import ProfilerMiddleware, profiling_enabled
 from src.utilities.core.exception_handlers import (
     generic_exception_handler,
     http_exception_handler,
@@ -66,6 +69,10 @@ def initialize_backend_application() -> fastapi.FastAPI:
         allow_headers=settings.ALLOWED_HEADERS,
     )
 
+    # Only installed when configured, so requests pay nothing for profiling otherwise.
+    if profiling_enabled():
+        app.add_middleware(ProfilerMiddleware)
+
     app.add_event_handler(
         "startup",
         execute_backend_server_event_handler(backend_app=app),
@@ -83,6 +90,8 @@ def initialize_backend_application() -> fastapi.FastAPI:
 
     # public router
     app.include_router(router=public_api_endpoint_router, prefix=settings.API_PREFIX)
+    # Served at the root, where Prometheus scrapes by default.
+    app.include_router(router=metrics_router)
 
     app.openapi = lambda: custom_openapi(app)
 
@@ -92,6 +101,7 @@ def initialize_backend_application() -> fastapi.FastAPI:
 backend_app: fastapi.FastAPI = initialize_backend_application()
 
 if __name__ == "__main__":
+    prepare_multiprocess_dir(settings.SERVER_WORKERS)
     uvicorn.run(
         app="main:backend_app",
         host=settings.SERVER_HOST,
@@ -1,3 +1,6 @@
 from src.models.db.user import User, Document
+from src.models.db.document_page import DocumentPage
+from src.models.db.email_outbox import OutboxEmail
+from src.models.db.extraction_cache import ExtractionCacheEntry
 
-__all__ = ["User", "Document"]
+__all__ = ["User", "Document", "DocumentPage", "OutboxEmail", "ExtractionCacheEntry"]
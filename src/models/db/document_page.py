@@ -0,0 +1,23 @@
+from sqlalchemy import BigInteger, Column, ForeignKey, Index, Integer, LargeBinary, String
+
+from src.repository.table import Base
+
+
+class DocumentPage(Base):
+    """
+    One page, or a fixed-size slice of a long page, of a document's extracted text, stored as UTF-8
+    bytes so that `byte_offset` and `byte_length` address the text exactly as served over HTTP.
+    `content` is compressed with `codec` when one is set; the offsets and length still count the
+    uncompressed bytes.
+    """
+
+    __tablename__ = "document_pages"
+    __table_args__ = (Index("ix_document_pages_page", "document_id", "page_number"),)
+
+    document_id = Column(Integer, ForeignKey("documents.id", ondelete="CASCADE"), primary_key=True)
+    chunk_index = Column(Integer, primary_key=True)
+    page_number = Column(Integer, nullable=False)
+    byte_offset = Column(BigInteger, nullable=False)
+    byte_length = Column(Integer, nullable=False)
+    content = Column(LargeBinary, nullable=False)
+    codec = Column(String(16), nullable=True)
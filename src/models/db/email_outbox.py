@@ -0,0 +1,35 @@
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer, String, Text
+from datetime import datetime
+import enum
+
+from src.repository.table import Base
+
+
+class EmailStatus(enum.Enum):
+    pending = "pending"
+    sent = "sent"
+    failed = "failed"
+
+
+class OutboxEmail(Base):
+    """
+    An email waiting to be sent by the background sender. Pending rows are sent once
+    `next_attempt_at` has passed; a row being sent has it pushed out by a lease, so a sender that
+    dies mid-send leaves the row to be picked up again.
+    """
+
+    __tablename__ = "email_outbox"
+    __table_args__ = (Index("ix_email_outbox_due", "status", "next_attempt_at"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    to_email = Column(String, nullable=False)
+    subject = Column(String, nullable=False)
+    body = Column(Text, nullable=False)
+    kind = Column(String(32), nullable=False)
+    status = Column(Enum(EmailStatus, name="email_statuses"), nullable=False, default=EmailStatus.pending)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    sent_at = Column(DateTime, nullable=True)
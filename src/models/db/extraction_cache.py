@@ -0,0 +1,14 @@
+from sqlalchemy import Column, DateTime, String, Text
+from datetime import datetime
+
+from src.repository.table import Base
+
+
+class ExtractionCacheEntry(Base):
+    __tablename__ = "extraction_cache"
+
+    sha256 = Column(String(64), primary_key=True)
+    extractor_version = Column(String(64), primary_key=True)
+    file_format = Column(String(16), nullable=True)
+    extracted_text = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
@@ -2,11 +2,15 @@ from sqlalchemy import Enum, ForeignKey, String
 from sqlalchemy.orm import relationship
 
 from src.repository.table import Base
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, Enum, DateTime
-from sqlalchemy.orm import relationship
+from sqlalchemy import Boolean, Column, Integer, String, Text, ForeignKey, Enum, DateTime, JSON, LargeBinary, Index
+from sqlalchemy import false
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 from datetime import datetime
 import enum
 
+from src.utilities.extraction.text_codec import decode_text
+
 
 class TaskStatus(enum.Enum):
     pending = "pending"
@@ -27,12 +31,48 @@ class User(Base):
 
 class Document(Base):
     __tablename__ = "documents"
+    __table_args__ = (
+        Index("ix_documents_search_vector", "search_vector", postgresql_using="gin"),
+        # Backs the keyset-paginated listing, which it covers: every listed column is included, so pages
+        # are index-only scans. Index rows are capped at about 2.7kB, hence `DOCUMENT_ERROR_MAX_CHARS`.
+        Index(
+            "ix_documents_user_uploaded",
+            "user_id",
+            "uploaded_at",
+            "id",
+            postgresql_include=[
+                "extraction_status",
+                "file_format",
+                "file_path",
+                "extraction_mode",
+                "is_partial",
+                "error_message",
+            ],
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     file_path = Column(String, nullable=True)
-    file_format = Column(Enum("pdf", "doc", "docx", name="file_formats"))
+    file_format = Column(Enum("pdf", "doc", "docx", "html", name="file_formats"), nullable=True)
+    content_sha256 = Column(String(64), nullable=True, index=True)
     uploaded_at = Column(DateTime, default=datetime.utcnow)
-    extracted_text = Column(Text, nullable=True)
+    # The text columns are only loaded on request (`undefer_group("text")`), and raise instead of
+    # lazy loading when touched otherwise; read the text through `decoded_text`.
+    extracted_text = deferred(Column(Text, nullable=True), group="text", raiseload=True)
+    compressed_text = deferred(Column(LargeBinary, nullable=True), group="text", raiseload=True)
+    text_codec = Column(String(16), nullable=True)
+    # Maintained on write from the plain text, since compressed text cannot be indexed by Postgres.
+    search_vector = deferred(Column(TSVECTOR, nullable=True), raiseload=True)
     extraction_status = Column(Enum(TaskStatus), default=TaskStatus.pending)
+    # When a job worker last claimed the row; in_progress rows whose lease ran out are claimed again.
+    claimed_at = Column(DateTime, nullable=True)
+    error_message = Column(Text, nullable=True)
+    extraction_options = Column(JSON, nullable=True)
+    is_partial = Column(Boolean, nullable=False, default=False, server_default=false())
+    extraction_mode = Column(String(16), nullable=True)
     user_id = Column(Integer, ForeignKey("users.id"))    
     owner = relationship("User", back_populates="documents")
+
+    @property
+    def decoded_text(self):
+        return decode_text(self.extracted_text, self.compressed_text, self.text_codec)
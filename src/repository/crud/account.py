@@ -1,11 +1,12 @@
 from datetime import timedelta, datetime
 from typing import Optional
 
+from loguru import logger
 from sqlalchemy import select
 from src.models.db.user import User
 from src.repository.crud.base import BaseCRUDRepository
 from src.securities.authorizations.jwt import jwt_generator
-from src.utilities.common.password import hash_password, verify_password
+from src.utilities.common.password import password_hasher
 from src.utilities.exceptions.exceptions import (
     EntityAlreadyExistsException,
     EntityDoesNotExistException,
@@ -33,7 +34,7 @@ class AccountCRUDRepository(BaseCRUDRepository):
     async def create_account(
         self, email: str, password: str
     ) -> User:
-        hashed_password = hash_password(password)
+        hashed_password = await password_hasher.hash(password)
 
         new_user = User(
             email=email,
@@ -68,10 +69,15 @@ class AccountCRUDRepository(BaseCRUDRepository):
     ) -> tuple[User, str, str]:
        
         user = await self.find_one(filters={"email": email})
+        if user is None:
+            raise EntityDoesNotExistException("Invalid email or password.")
 
-        if not verify_password(password, user.hashed_password):
+        if not await password_hasher.verify(password, user.hashed_password):
             raise ValueError("Invalid email or password.")
 
+        if password_hasher.needs_rehash(user.hashed_password):
+            await self._rehash_password(user, password)
+
         access_token = jwt_generator.generate_access_token(user)
         refresh_token = jwt_generator.generate_refresh_token(user)
 
@@ -83,9 +89,22 @@ class AccountCRUDRepository(BaseCRUDRepository):
         if not user:
             raise EntityDoesNotExistException("User not found.")
 
-        user.hashed_password = hash_password(new_password)
+        user.hashed_password = await password_hasher.hash(new_password)
 
         self.async_session.add(user)
         await self.async_session.commit()
         await self.async_session.refresh(user)
         return user
+
+    async def _rehash_password(self, user: User, password: str) -> None:
+        """
+        Upgrades a hash made with another cost factor on login, when the plain password is at hand.
+        A failure only logs: the login itself already succeeded.
+        """
+        try:
+            user.hashed_password = await password_hasher.hash(password)
+            self.async_session.add(user)
+            await self.async_session.commit()
+        except Exception as e:
+            await self.async_session.rollback()
+            logger.warning(f"Could not rehash the password of user {user.id} | {e}")
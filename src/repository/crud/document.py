@@ -0,0 +1,370 @@
+import enum
+import json
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from loguru import logger
+from sqlalchemy import JSON, REAL, Column, Enum, Row, and_, bindparam, cast, func, insert, or_, select, text, tuple_, update
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import undefer_group
+
+from src.config.manager import settings
+from src.models.db.user import Document, TaskStatus
+from src.repository.crud.base import BaseCRUDRepository
+from src.repository.crud.document_page import DocumentPageCRUDRepository
+from src.utilities.extraction.options import ExtractionOptions
+from src.utilities.extraction.text_codec import encode_text
+
+# Rows passed to `create_many` may carry the plain extracted text under this key; it is not
+# stored as such but fills `search_vector` and the page chunks, which compressed text could not.
+PLAIN_TEXT = "plain_text"
+SEARCH_HEADLINE_OPTIONS = "MaxFragments=2, MinWords=10, MaxWords=30"
+
+
+def _indexed_text(text_: Optional[str]) -> str:
+    # A tsvector is limited to 1MB, so only the head of very long texts is indexed; Postgres text cannot hold NULs.
+    return (text_ or "")[:settings.SEARCH_INDEX_MAX_CHARS].replace("\x00", " ")
+
+
+def _error_text(error_message: Optional[str]) -> Optional[str]:
+    # Error messages are part of the covering listing index, whose rows have a size limit.
+    return error_message[:settings.DOCUMENT_ERROR_MAX_CHARS] if error_message else error_message
+
+
+def _text_config() -> Any:
+    return cast(settings.SEARCH_TEXT_CONFIG, REGCONFIG)
+
+
+def _claim_expired(claimed_before: datetime) -> Any:
+    # Rows claimed before claims were recorded have no `claimed_at` and count as expired.
+    return or_(Document.claimed_at.is_(None), Document.claimed_at < claimed_before)
+
+
+def _copy_value(column: Column, row: dict[str, Any]) -> Any:
+    """
+    Converts a row value into what asyncpg's COPY expects, applying the column default when
+    the row has none: COPY bypasses SQLAlchemy's own type processing and defaults.
+    """
+    if column.name in row:
+        value = row[column.name]
+    elif column.default.is_callable:
+        value = column.default.arg(None)
+    else:
+        value = column.default.arg
+
+    if isinstance(column.type, Enum) and isinstance(value, enum.Enum):
+        return value.name
+    if isinstance(column.type, JSON) and value is not None:
+        return json.dumps(value)
+    return value
+
+
+class DocumentCRUDRepository(BaseCRUDRepository):
+    async def create_many(
+        self, rows: list[dict[str, Any]], copy_min_rows: int = settings.DB_COPY_MIN_ROWS
+    ) -> list[Optional[int]]:
+        """
+        Inserts finished documents in a single transaction and returns their ids in input order.
+
+        Batches of `copy_min_rows` or more are written with COPY, using ids drawn from the sequence
+        up front; smaller ones with multi-row INSERT ... RETURNING. When the batch is rejected, its
+        rows are retried one by one under savepoints of the same transaction, so a bad row only
+        loses itself and gets None as id. All rows must have the same keys.
+        """
+        if not rows:
+            return []
+        if "error_message" in rows[0]:
+            rows = [{**row, "error_message": _error_text(row["error_message"])} for row in rows]
+
+        try:
+            async with self.async_session.begin_nested():
+                if len(rows) >= copy_min_rows:
+                    ids: list[Optional[int]] = await self._copy_rows(rows)
+                else:
+                    ids = await self._insert_rows(rows)
+        except Exception as e:
+            # Log the driver error only: the statement parameters include the extracted texts.
+            logger.warning(
+                f"Bulk insert of {len(rows)} documents failed, retrying row by row | {getattr(e, 'orig', e)}"
+            )
+            ids = []
+            for row in rows:
+                try:
+                    async with self.async_session.begin_nested():
+                        ids.extend(await self._insert_rows([row]))
+                except SQLAlchemyError as row_error:
+                    logger.error(f"Could not store document {row.get('file_path')} | {getattr(row_error, 'orig', row_error)}")
+                    ids.append(None)
+
+        if PLAIN_TEXT in rows[0]:
+            await self._store_pages(
+                [
+                    (document_id, row[PLAIN_TEXT])
+                    for document_id, row in zip(ids, rows)
+                    if document_id is not None and row[PLAIN_TEXT]
+                ]
+            )
+
+        await self.async_session.commit()
+        return ids
+
+    async def _store_pages(self, texts: list[tuple[int, str]]) -> None:
+        # Documents without page chunks are still served from their full text, so a failure here only logs.
+        try:
+            async with self.async_session.begin_nested():
+                await DocumentPageCRUDRepository(async_session=self.async_session).store(texts)
+        except Exception as e:
+            logger.error(f"Could not store the pages of {len(texts)} documents | {getattr(e, 'orig', e)}")
+
+    async def _insert_rows(self, rows: list[dict[str, Any]]) -> list[int]:
+        stmt = insert(Document)
+        if PLAIN_TEXT in rows[0]:
+            stmt = stmt.values(search_vector=func.to_tsvector(_text_config(), bindparam(PLAIN_TEXT)))
+            rows = [{**row, PLAIN_TEXT: _indexed_text(row[PLAIN_TEXT])} for row in rows]
+        # Executed as batched multi-row VALUES; sort_by_parameter_order keeps RETURNING aligned with `rows`.
+        result = await self.async_session.execute(
+            stmt.returning(Document.id, sort_by_parameter_order=True), rows
+        )
+        return list(result.scalars().all())
+
+    async def _copy_rows(self, rows: list[dict[str, Any]]) -> list[int]:
+        table = Document.__table__
+        result = await self.async_session.execute(
+            text("SELECT nextval(pg_get_serial_sequence(:table_name, 'id')) FROM generate_series(1, :count)"),
+            {"table_name": table.name, "count": len(rows)},
+        )
+        ids = list(result.scalars().all())
+
+        columns = [table.c[name] for name in rows[0] if name != PLAIN_TEXT] + [
+            column
+            for column in table.c
+            if column.name not in rows[0] and column.name != "id" and column.default is not None
+        ]
+        records = [
+            (document_id, *(_copy_value(column, row) for column in columns)) for document_id, row in zip(ids, rows)
+        ]
+
+        connection = await self.async_session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            table.name, records=records, columns=["id", *(column.name for column in columns)]
+        )
+
+        if PLAIN_TEXT in rows[0]:
+            await self.async_session.execute(
+                text(
+                    "UPDATE documents SET search_vector = to_tsvector(CAST(:config AS regconfig), s.search_text) "
+                    "FROM unnest(CAST(:ids AS integer[]), CAST(:texts AS text[])) AS s(id, search_text) "
+                    "WHERE documents.id = s.id"
+                ),
+                {
+                    "config": settings.SEARCH_TEXT_CONFIG,
+                    "ids": ids,
+                    "texts": [_indexed_text(row[PLAIN_TEXT]) for row in rows],
+                },
+            )
+        return ids
+
+    async def create_pending(
+        self, user_id: int, file_paths_or_urls: list[str], options: ExtractionOptions = ExtractionOptions()
+    ) -> list[Document]:
+        documents = [
+            Document(
+                file_path=file_path_or_url,
+                extraction_status=TaskStatus.pending,
+                extraction_options=options.to_dict(),
+                extraction_mode=options.extraction_mode,
+                user_id=user_id,
+            )
+            for file_path_or_url in file_paths_or_urls
+        ]
+        self.async_session.add_all(documents)
+        await self.async_session.commit()
+        return documents
+
+    async def find_for_user(self, document_id: int, user_id: int, include_text: bool = False) -> Optional[Document]:
+        stmt = select(Document).where(Document.id == document_id, Document.user_id == user_id)
+        if include_text:
+            stmt = stmt.options(undefer_group("text"))
+        result = await self.async_session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def list_for_user(
+        self,
+        user_id: int,
+        limit: int,
+        after: Optional[tuple[datetime, int]] = None,
+        status: Optional[TaskStatus] = None,
+        file_format: Optional[str] = None,
+    ) -> list[Row]:
+        """
+        Returns up to `limit` of the user's documents, newest first, without their texts. `after` is the
+        `(uploaded_at, id)` of the last row of the previous page, so each page is an index-only range
+        scan of `ix_documents_user_uploaded` however many documents the user has.
+        """
+        stmt = select(
+            Document.id,
+            Document.file_path,
+            Document.file_format,
+            Document.uploaded_at,
+            Document.extraction_status,
+            Document.extraction_mode,
+            Document.is_partial,
+            Document.error_message,
+        ).where(Document.user_id == user_id)
+        if after is not None:
+            stmt = stmt.where(tuple_(Document.uploaded_at, Document.id) < tuple_(*after))
+        if status is not None:
+            stmt = stmt.where(Document.extraction_status == status)
+        if file_format is not None:
+            stmt = stmt.where(Document.file_format == file_format)
+        stmt = stmt.order_by(Document.uploaded_at.desc(), Document.id.desc()).limit(limit)
+        result = await self.async_session.execute(stmt)
+        return list(result.all())
+
+    async def search_for_user(
+        self, user_id: int, query: str, limit: int, after: Optional[tuple[float, int]] = None
+    ) -> list[Row]:
+        """
+        Returns up to `limit` of the user's documents matching the web-search style `query`, best first,
+        as rows of `(id, file_path, uploaded_at, rank, snippet, compressed_text, text_codec)`. `after` is
+        the `(rank, id)` of the last hit of the previous page.
+
+        Snippets are only made for the returned page, and only from plain text: rows stored compressed
+        come back with a None snippet and their compressed text, for `headlines`.
+        """
+        tsquery = func.websearch_to_tsquery(_text_config(), query)
+        rank = func.ts_rank_cd(Document.search_vector, tsquery)
+        hits = select(Document.id, rank.label("rank")).where(
+            Document.user_id == user_id, Document.search_vector.op("@@")(tsquery)
+        )
+        if after is not None:
+            hits = hits.where(tuple_(rank, Document.id) < tuple_(cast(after[0], REAL), after[1]))
+        hits = hits.order_by(rank.desc(), Document.id.desc()).limit(limit).subquery()
+
+        snippet = func.ts_headline(
+            _text_config(),
+            func.left(Document.extracted_text, settings.SEARCH_INDEX_MAX_CHARS),
+            tsquery,
+            SEARCH_HEADLINE_OPTIONS,
+        )
+        stmt = (
+            select(
+                Document.id,
+                Document.file_path,
+                Document.uploaded_at,
+                hits.c.rank,
+                snippet.label("snippet"),
+                Document.compressed_text,
+                Document.text_codec,
+            )
+            .join(hits, hits.c.id == Document.id)
+            .order_by(hits.c.rank.desc(), Document.id.desc())
+        )
+        result = await self.async_session.execute(stmt)
+        return list(result.all())
+
+    async def headlines(self, query: str, texts: list[str]) -> list[str]:
+        """
+        Returns the `ts_headline` snippet of `query` in each of `texts`, in order.
+        """
+        result = await self.async_session.execute(
+            text(
+                "SELECT ts_headline(CAST(:config AS regconfig), t.text, "
+                "websearch_to_tsquery(CAST(:config AS regconfig), :query), :options) "
+                "FROM unnest(CAST(:texts AS text[])) WITH ORDINALITY AS t(text, position) ORDER BY t.position"
+            ),
+            {
+                "config": settings.SEARCH_TEXT_CONFIG,
+                "query": query,
+                "options": SEARCH_HEADLINE_OPTIONS,
+                "texts": [_indexed_text(text_) for text_ in texts],
+            },
+        )
+        return list(result.scalars().all())
+
+    async def find_recoverable_ids(
+        self, pending_before: datetime, claimed_before: datetime, limit: int = 1000
+    ) -> list[int]:
+        """
+        Returns documents left pending since before `pending_before`, and in_progress documents
+        whose claim is older than `claimed_before`, i.e. whose worker most likely died.
+        """
+        stmt = (
+            select(Document.id)
+            .where(
+                or_(
+                    and_(Document.extraction_status == TaskStatus.pending, Document.uploaded_at < pending_before),
+                    and_(Document.extraction_status == TaskStatus.in_progress, _claim_expired(claimed_before)),
+                )
+            )
+            .order_by(Document.id)
+            .limit(limit)
+        )
+        result = await self.async_session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def claim(self, document_id: int, lease_seconds: float = settings.EXTRACTION_JOB_LEASE_SECONDS) -> Optional[Row]:
+        """
+        Atomically moves a pending document, or an in_progress one whose lease of `lease_seconds`
+        ran out, to in_progress and returns its `(file_path, extraction_options)`, or None when
+        another worker holds it.
+        """
+        now = datetime.utcnow()
+        stmt = (
+            update(Document)
+            .where(
+                Document.id == document_id,
+                or_(
+                    Document.extraction_status == TaskStatus.pending,
+                    and_(
+                        Document.extraction_status == TaskStatus.in_progress,
+                        _claim_expired(now - timedelta(seconds=lease_seconds)),
+                    ),
+                ),
+            )
+            .values(extraction_status=TaskStatus.in_progress, claimed_at=now)
+            .returning(Document.file_path, Document.extraction_options)
+        )
+        result = await self.async_session.execute(stmt)
+        claimed = result.one_or_none()
+        await self.async_session.commit()
+        return claimed
+
+    async def fail(self, document_id: int, error_message: str) -> None:
+        stmt = (
+            update(Document)
+            .where(Document.id == document_id, Document.extraction_status == TaskStatus.in_progress)
+            .values(extraction_status=TaskStatus.failed, error_message=_error_text(error_message))
+        )
+        await self.async_session.execute(stmt)
+        await self.async_session.commit()
+
+    async def finish(
+        self,
+        document_id: int,
+        extracted_text: Optional[str],
+        content_sha256: Optional[str],
+        error_message: Optional[str],
+        is_partial: bool = False,
+        file_format: Optional[str] = None,
+    ) -> None:
+        stmt = (
+            update(Document)
+            .where(Document.id == document_id)
+            .values(
+                **encode_text(extracted_text),
+                search_vector=func.to_tsvector(_text_config(), _indexed_text(extracted_text)),
+                content_sha256=content_sha256,
+                file_format=file_format,
+                error_message=_error_text(error_message),
+                is_partial=is_partial,
+                extraction_status=TaskStatus.failed if error_message else TaskStatus.completed,
+            )
+        )
+        await self.async_session.execute(stmt)
+        await DocumentPageCRUDRepository(async_session=self.async_session).delete_for_document(document_id)
+        if extracted_text:
+            await self._store_pages([(document_id, extracted_text)])
+        await self.async_session.commit()
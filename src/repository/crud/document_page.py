@@ -0,0 +1,91 @@
+from typing import Optional
+
+from sqlalchemy import Row, and_, delete, exists, or_, select
+
+from src.models.db.document_page import DocumentPage
+from src.repository.crud.base import BaseCRUDRepository
+from src.utilities.extraction.chunks import iter_page_chunks
+from src.utilities.extraction.executor import extraction_executor
+from src.utilities.extraction.options import PageRanges
+from src.utilities.extraction.text_codec import decompress_bytes, encode_chunk
+
+COPY_COLUMNS = ["document_id", "chunk_index", "page_number", "byte_offset", "byte_length", "content", "codec"]
+
+
+def _page_records(texts: list[tuple[int, str]]) -> list[tuple]:
+    return [
+        (
+            document_id,
+            chunk.chunk_index,
+            chunk.page_number,
+            chunk.byte_offset,
+            len(chunk.content),
+            *encode_chunk(chunk.content),
+        )
+        for document_id, text in texts
+        for chunk in iter_page_chunks(text)
+    ]
+
+
+def _decode_contents(rows: list[Row]) -> dict[int, bytes]:
+    return {
+        row.chunk_index: decompress_bytes(row.content, row.codec) if row.codec else row.content for row in rows
+    }
+
+
+class DocumentPageCRUDRepository(BaseCRUDRepository):
+    async def store(self, texts: list[tuple[int, str]]) -> None:
+        """
+        Writes the page chunks of each `(document_id, text)` with COPY. Does not commit, so the
+        chunks land in the same transaction as their documents.
+        """
+        if not texts:
+            return
+        # Splitting and compressing whole texts would stall the event loop.
+        records = await extraction_executor.run_io("compress", _page_records, texts)
+        if not records:
+            return
+        connection = await self.async_session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            DocumentPage.__tablename__, records=records, columns=COPY_COLUMNS
+        )
+
+    async def delete_for_document(self, document_id: int) -> None:
+        await self.async_session.execute(delete(DocumentPage).where(DocumentPage.document_id == document_id))
+
+    async def has_chunks(self, document_id: int) -> bool:
+        stmt = select(exists().where(DocumentPage.document_id == document_id))
+        return bool(await self.async_session.scalar(stmt))
+
+    async def find_layout(self, document_id: int, page_ranges: Optional[PageRanges] = None) -> list[Row]:
+        """
+        Returns `(chunk_index, page_number, byte_length)` of the document's chunks on the selected
+        pages, in text order, without their contents.
+        """
+        stmt = select(DocumentPage.chunk_index, DocumentPage.page_number, DocumentPage.byte_length).where(
+            DocumentPage.document_id == document_id
+        )
+        if page_ranges is not None:
+            stmt = stmt.where(
+                or_(
+                    *(
+                        and_(DocumentPage.page_number > start, DocumentPage.page_number <= stop)
+                        if stop is not None
+                        else DocumentPage.page_number > start
+                        for start, stop in page_ranges
+                    )
+                )
+            )
+        result = await self.async_session.execute(stmt.order_by(DocumentPage.chunk_index))
+        return list(result.all())
+
+    async def find_contents(self, document_id: int, chunk_indexes: list[int]) -> dict[int, bytes]:
+        stmt = select(DocumentPage.chunk_index, DocumentPage.content, DocumentPage.codec).where(
+            DocumentPage.document_id == document_id, DocumentPage.chunk_index.in_(chunk_indexes)
+        )
+        result = await self.async_session.execute(stmt)
+        rows = list(result.all())
+        if any(row.codec for row in rows):
+            return await extraction_executor.run_io("decompress", _decode_contents, rows)
+        return _decode_contents(rows)
@@ -0,0 +1,87 @@
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import Row, select, update
+
+from src.models.db.email_outbox import EmailStatus, OutboxEmail
+from src.repository.crud.base import BaseCRUDRepository
+
+
+class EmailOutboxCRUDRepository(BaseCRUDRepository):
+    def add(
+        self,
+        to_email: str,
+        subject: str,
+        body: str,
+        kind: str,
+        user_id: Optional[int] = None,
+        delay_seconds: float = 0.0,
+    ) -> None:
+        """
+        Adds an email to the session without committing, so it is stored in the caller's transaction.
+        """
+        self.async_session.add(
+            OutboxEmail(
+                user_id=user_id,
+                to_email=to_email,
+                subject=subject,
+                body=body,
+                kind=kind,
+                next_attempt_at=datetime.utcnow() + timedelta(seconds=delay_seconds),
+            )
+        )
+
+    async def claim_due(self, limit: int, lease_seconds: float) -> list[Row]:
+        """
+        Leases up to `limit` due emails to this sender and returns them, oldest first, as rows of
+        `(id, user_id, to_email, subject, body, kind, attempts)`. SKIP LOCKED keeps concurrent
+        senders from claiming the same rows.
+        """
+        now = datetime.utcnow()
+        due = (
+            select(OutboxEmail.id)
+            .where(OutboxEmail.status == EmailStatus.pending, OutboxEmail.next_attempt_at <= now)
+            .order_by(OutboxEmail.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(OutboxEmail)
+            .where(OutboxEmail.id.in_(due))
+            .values(attempts=OutboxEmail.attempts + 1, next_attempt_at=now + timedelta(seconds=lease_seconds))
+            .returning(
+                OutboxEmail.id,
+                OutboxEmail.user_id,
+                OutboxEmail.to_email,
+                OutboxEmail.subject,
+                OutboxEmail.body,
+                OutboxEmail.kind,
+                OutboxEmail.attempts,
+            )
+        )
+        result = await self.async_session.execute(stmt)
+        claimed = sorted(result.all(), key=lambda row: row.id)
+        await self.async_session.commit()
+        return claimed
+
+    async def mark_sent(self, email_ids: list[int]) -> None:
+        stmt = (
+            update(OutboxEmail)
+            .where(OutboxEmail.id.in_(email_ids))
+            .values(status=EmailStatus.sent, sent_at=datetime.utcnow(), last_error=None)
+        )
+        await self.async_session.execute(stmt)
+        await self.async_session.commit()
+
+    async def mark_failed(self, email_ids: list[int], error: str, retry_at: Optional[datetime]) -> None:
+        """
+        Schedules the emails for another attempt at `retry_at`, or gives up on them when it is None.
+        """
+        values = {"last_error": error}
+        if retry_at is None:
+            values["status"] = EmailStatus.failed
+        else:
+            values["next_attempt_at"] = retry_at
+        await self.async_session.execute(update(OutboxEmail).where(OutboxEmail.id.in_(email_ids)).values(**values))
+        await self.async_session.commit()
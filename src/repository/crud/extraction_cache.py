@@ -0,0 +1,33 @@
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from src.models.db.extraction_cache import ExtractionCacheEntry
+from src.repository.crud.base import BaseCRUDRepository
+
+
+class ExtractionCacheCRUDRepository(BaseCRUDRepository):
+    async def find_text(self, sha256: str, extractor_version: str) -> Optional[str]:
+        stmt = select(ExtractionCacheEntry.extracted_text).where(
+            ExtractionCacheEntry.sha256 == sha256,
+            ExtractionCacheEntry.extractor_version == extractor_version,
+        )
+        result = await self.async_session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def save_text(
+        self, sha256: str, extractor_version: str, file_format: Optional[str], extracted_text: str
+    ) -> None:
+        stmt = (
+            insert(ExtractionCacheEntry)
+            .values(
+                sha256=sha256,
+                extractor_version=extractor_version,
+                file_format=file_format,
+                extracted_text=extracted_text,
+            )
+            .on_conflict_do_nothing(index_elements=["sha256", "extractor_version"])
+        )
+        await self.async_session.execute(stmt)
+        await self.async_session.commit()
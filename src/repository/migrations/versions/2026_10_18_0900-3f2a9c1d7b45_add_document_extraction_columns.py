@@ -0,0 +1,81 @@
+"""add document extraction columns
+
+Brings a `documents` table created before content hashing, job mode, partial extraction,
+compression, search and listing up to the current model. The app still runs
+`Base.metadata.create_all` on startup, which creates new tables but never alters existing ones,
+so every statement here is written to be a no-op on a database it already created. On a fresh
+database, where this may run before the app ever started, there is nothing to alter yet and
+`create_all` builds the current schema.
+
+Revision ID: 3f2a9c1d7b45
+Revises:
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from src.config.manager import settings
+
+
+# revision identifiers, used by Alembic.
+revision = '3f2a9c1d7b45'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _has_documents_table() -> bool:
+    return sa.inspect(op.get_bind()).has_table("documents")
+
+
+def upgrade() -> None:
+    if not _has_documents_table():
+        return
+
+    # ADD VALUE cannot run inside a transaction block before PostgreSQL 12.
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE file_formats ADD VALUE IF NOT EXISTS 'html'")
+
+    op.execute("ALTER TABLE documents ADD COLUMN IF NOT EXISTS content_sha256 VARCHAR(64)")
+    op.execute("ALTER TABLE documents ADD COLUMN IF NOT EXISTS error_message TEXT")
+    op.execute("ALTER TABLE documents ADD COLUMN IF NOT EXISTS extraction_options JSON")
+    op.execute("ALTER TABLE documents ADD COLUMN IF NOT EXISTS is_partial BOOLEAN NOT NULL DEFAULT false")
+    op.execute("ALTER TABLE documents ADD COLUMN IF NOT EXISTS extraction_mode VARCHAR(16)")
+    op.execute("ALTER TABLE documents ADD COLUMN IF NOT EXISTS compressed_text BYTEA")
+    op.execute("ALTER TABLE documents ADD COLUMN IF NOT EXISTS text_codec VARCHAR(16)")
+    op.execute("ALTER TABLE documents ADD COLUMN IF NOT EXISTS search_vector TSVECTOR")
+
+    op.execute("CREATE INDEX IF NOT EXISTS ix_documents_content_sha256 ON documents (content_sha256)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_documents_search_vector ON documents USING gin (search_vector)")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_documents_user_uploaded ON documents (user_id, uploaded_at, id) "
+        "INCLUDE (extraction_status, file_format)"
+    )
+
+    # Documents extracted before search existed become searchable, indexed as new ones are.
+    op.execute(
+        sa.text(
+            "UPDATE documents SET search_vector = to_tsvector(CAST(:config AS regconfig), left(extracted_text, :max_chars)) "
+            "WHERE search_vector IS NULL AND extracted_text IS NOT NULL"
+        ).bindparams(config=settings.SEARCH_TEXT_CONFIG, max_chars=settings.SEARCH_INDEX_MAX_CHARS)
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_documents_user_uploaded", table_name="documents", if_exists=True)
+    op.drop_index("ix_documents_search_vector", table_name="documents", if_exists=True)
+    op.drop_index("ix_documents_content_sha256", table_name="documents", if_exists=True)
+
+    for column in (
+        "search_vector",
+        "text_codec",
+        "compressed_text",
+        "extraction_mode",
+        "is_partial",
+        "extraction_options",
+        "error_message",
+        "content_sha256",
+    ):
+        op.execute(f"ALTER TABLE IF EXISTS documents DROP COLUMN IF EXISTS {column}")
+    # Enum values cannot be dropped; 'html' stays in file_formats.
@@ -0,0 +1,26 @@
+"""add document claimed_at
+
+Records when a job worker claimed a document, so claims of crashed workers can expire.
+
+Revision ID: 8c41e07a5d12
+Revises: 3f2a9c1d7b45
+Create Date: 2026-10-18 09:30:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '8c41e07a5d12'
+down_revision = '3f2a9c1d7b45'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # documents itself is created by create_all on startup, possibly after this runs.
+    op.execute("ALTER TABLE IF EXISTS documents ADD COLUMN IF NOT EXISTS claimed_at TIMESTAMP WITHOUT TIME ZONE")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE IF EXISTS documents DROP COLUMN IF EXISTS claimed_at")
@@ -0,0 +1,26 @@
+"""add document page codec
+
+Page chunks are compressed like the documents' texts; rows without a codec stay plain.
+
+Revision ID: b7d3f2a96e80
+Revises: 8c41e07a5d12
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d3f2a96e80'
+down_revision = '8c41e07a5d12'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # document_pages itself is created by create_all on startup, possibly after this runs.
+    op.execute("ALTER TABLE IF EXISTS document_pages ADD COLUMN IF NOT EXISTS codec VARCHAR(16)")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE IF EXISTS document_pages DROP COLUMN IF EXISTS codec")
@@ -0,0 +1,55 @@
+"""cover document listing
+
+Rebuilds `ix_documents_user_uploaded` with every column the listing returns, so its pages are
+index-only scans. Error messages longer than `DOCUMENT_ERROR_MAX_CHARS` are cut first, since
+index rows are limited to about 2.7kB.
+
+Revision ID: d4e8b1c07f23
+Revises: b7d3f2a96e80
+Create Date: 2026-10-18 10:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from src.config.manager import settings
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4e8b1c07f23'
+down_revision = 'b7d3f2a96e80'
+branch_labels = None
+depends_on = None
+
+
+def _has_documents_table() -> bool:
+    return sa.inspect(op.get_bind()).has_table("documents")
+
+
+def upgrade() -> None:
+    # On a fresh database create_all builds the table and this index on startup.
+    if not _has_documents_table():
+        return
+
+    op.execute(
+        sa.text(
+            "UPDATE documents SET error_message = left(error_message, :max_chars) "
+            "WHERE length(error_message) > :max_chars"
+        ).bindparams(max_chars=settings.DOCUMENT_ERROR_MAX_CHARS)
+    )
+    op.execute("DROP INDEX IF EXISTS ix_documents_user_uploaded")
+    op.execute(
+        "CREATE INDEX ix_documents_user_uploaded ON documents (user_id, uploaded_at, id) "
+        "INCLUDE (extraction_status, file_format, file_path, extraction_mode, is_partial, error_message)"
+    )
+
+
+def downgrade() -> None:
+    if not _has_documents_table():
+        return
+
+    op.execute("DROP INDEX IF EXISTS ix_documents_user_uploaded")
+    op.execute(
+        "CREATE INDEX ix_documents_user_uploaded ON documents (user_id, uploaded_at, id) "
+        "INCLUDE (extraction_status, file_format)"
+    )
@@ -20,6 +20,8 @@ class JWToken(pydantic.BaseModel):
     sub: str
 
 class JWTAccount(pydantic.BaseModel):
+    # Tokens issued before the id was carried have none; their user is looked up by email.
+    id: int | None = None
     email: pydantic.EmailStr
 
 
@@ -113,6 +115,19 @@ class JWTGenerator:
         print("--------------------")
         return [jwt_account.email]
 
+    def retrieve_account_from_token(self, token: str) -> tuple[JWTAccount, datetime.datetime]:
+        """
+        Verifies the JWT token and returns its account claims and expiration time.
+        Invalid or expired tokens raise python-jose's JWTError.
+        """
+        payload = jose_jwt.decode(
+            token=token,
+            key=settings.JWT_SECRET_KEY,
+            algorithms=[settings.JWT_ALGORITHM],
+        )
+        account = JWTAccount(id=payload.get("id"), email=payload["email"])
+        return account, datetime.datetime.fromtimestamp(payload["exp"], datetime.timezone.utc)
+
     def validate_token_expiration(self, token: str) -> bool:
         """
         Validates if the token has expired.
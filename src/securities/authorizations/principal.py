@@ -0,0 +1,77 @@
+import collections
+import dataclasses
+import hashlib
+import threading
+import time
+
+from src.config.manager import settings
+from src.securities.authorizations.jwt import JWTGenerator, jwt_generator
+
+
+@dataclasses.dataclass(frozen=True)
+class Principal:
+    """
+    The authenticated caller of a request, as verified from its access token.
+    `user_id` is None for tokens issued before the id was carried in the claims.
+    """
+
+    email: str
+    user_id: int | None
+    expires_at: float
+
+
+class PrincipalCache:
+    """
+    Remembers verified tokens so repeated requests with the same token skip the signature check.
+
+    Entries are keyed by a hash of the token, so raw tokens are never held in memory, and expire
+    after `ttl_seconds` or when the token itself does, whichever comes first. The least recently
+    used entry is evicted once `max_entries` is reached.
+    """
+
+    def __init__(
+        self,
+        generator: JWTGenerator = jwt_generator,
+        ttl_seconds: float = settings.PRINCIPAL_CACHE_TTL_SECONDS,
+        max_entries: int = settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ):
+        self.generator = generator
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        # token hash -> (principal, entry expiry)
+        self._entries: collections.OrderedDict[bytes, tuple[Principal, float]] = collections.OrderedDict()
+        # Sync dependencies run on the thread pool, so lookups can race.
+        self._lock = threading.Lock()
+
+    def authenticate(self, token: str) -> Principal:
+        """
+        Returns the principal of `token`, verifying it only when it is not cached.
+        Invalid or expired tokens raise python-jose's JWTError.
+        """
+        key = hashlib.sha256(token.encode("utf-8")).digest()
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if now < entry[1]:
+                    self._entries.move_to_end(key)
+                    return entry[0]
+                del self._entries[key]
+
+        account, expires_at = self.generator.retrieve_account_from_token(token)
+        principal = Principal(email=account.email, user_id=account.id, expires_at=expires_at.timestamp())
+
+        if self.max_entries > 0:
+            with self._lock:
+                self._entries[key] = (principal, min(now + self.ttl_seconds, principal.expires_at))
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return principal
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+principal_cache: PrincipalCache = PrincipalCache()
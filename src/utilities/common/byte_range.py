@@ -0,0 +1,34 @@
+import re
+from typing import Optional
+
+BYTE_RANGE = re.compile(r"^\s*bytes\s*=\s*(\d*)\s*-\s*(\d*)\s*$")
+
+
+def parse_byte_range(header: Optional[str], size: int) -> Optional[tuple[int, int]]:
+    """
+    Parses a single-range HTTP `Range` header against a representation of `size` bytes.
+
+    Returns:
+        Optional[tuple[int, int]]: The inclusive (first, last) byte positions, or None when the
+        header is absent, malformed or asks for several ranges, in which case it is ignored.
+
+    Raises:
+        ValueError: If the range cannot be satisfied.
+    """
+    match = BYTE_RANGE.match(header) if header else None
+    if not match or not any(match.groups()):
+        return None
+    first, last = match.groups()
+    if not first:
+        # Suffix range: the last `last` bytes.
+        length = int(last)
+        if length == 0 or size == 0:
+            raise ValueError("Range not satisfiable.")
+        return max(0, size - length), size - 1
+    first_position = int(first)
+    last_position = min(int(last), size - 1) if last else size - 1
+    if last and int(last) < first_position:
+        return None
+    if first_position >= size:
+        raise ValueError("Range not satisfiable.")
+    return first_position, last_position
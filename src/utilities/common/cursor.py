@@ -0,0 +1,30 @@
+import base64
+import binascii
+
+import orjson
+
+
+def encode_cursor(*values: object) -> str:
+    """
+    Encodes the sort key of the last returned row into an opaque, URL-safe keyset pagination cursor.
+
+    Returns:
+        str: The cursor to pass back for the next page.
+    """
+    return base64.urlsafe_b64encode(orjson.dumps(values)).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list:
+    """
+    Decodes a cursor made by `encode_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed or does not hold `size` values.
+    """
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, orjson.JSONDecodeError, UnicodeError) as e:
+        raise ValueError("Invalid cursor.") from e
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor.")
+    return values
@@ -1,17 +1,27 @@
+import asyncio
+import concurrent.futures
+import dataclasses
+import time
+
 import bcrypt
+from loguru import logger
+
+from src.config.manager import settings
+from src.utilities.core.metrics import PASSWORD_HASH_JOBS, PASSWORD_HASH_REJECTED, PASSWORD_HASH_WAIT_SECONDS
 
 
-def hash_password(password: str) -> str:
+def hash_password(password: str, rounds: int = settings.PASSWORD_BCRYPT_ROUNDS) -> str:
     """
     Hashes a password using bcrypt.
 
     Args:
         password (str): The plain text password to hash.
+        rounds (int): The bcrypt cost factor.
 
     Returns:
         str: The hashed password.
     """
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=rounds)
     hashed_password = bcrypt.hashpw(password.encode("utf-8"), salt)
     return hashed_password.decode("utf-8")
 
@@ -28,3 +38,136 @@ def verify_password(password: str, hashed_password: str) -> bool:
         bool: True if the password matches, False otherwise.
     """
     return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
+
+
+def hash_rounds(hashed_password: str) -> int | None:
+    """
+    Returns the cost factor a bcrypt hash was made with, or None if it is not a bcrypt hash.
+    """
+    parts = hashed_password.split("$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+class PasswordHasherBusy(Exception):
+    """
+    Raised when a hashing job waited longer than the queue timeout for a slot.
+    """
+
+
+@dataclasses.dataclass
+class PasswordHasherStats:
+    # Jobs waiting for a slot, and jobs holding one (queued in or running on the pool).
+    waiting: int = 0
+    in_flight: int = 0
+    completed: int = 0
+    rejected: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+    run_seconds_total: float = 0.0
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt off the event loop, on a thread pool of its own so that login storms cannot take
+    the threads extraction needs (bcrypt releases the GIL while hashing).
+
+    At most `max_queue_depth` jobs are queued or running; callers that cannot get a slot within
+    `queue_timeout` seconds get `PasswordHasherBusy` instead of piling up behind a slow queue.
+    Queue depth, wait times and rejections are exported as `password_hash_*` metrics.
+    """
+
+    def __init__(
+        self,
+        workers: int = settings.PASSWORD_HASH_WORKERS,
+        max_queue_depth: int = settings.PASSWORD_HASH_MAX_QUEUE_DEPTH,
+        queue_timeout: float = settings.PASSWORD_HASH_QUEUE_TIMEOUT,
+        rounds: int = settings.PASSWORD_BCRYPT_ROUNDS,
+    ):
+        self.workers = max(1, workers)
+        self.max_queue_depth = max(1, max_queue_depth)
+        self.queue_timeout = queue_timeout
+        self.rounds = rounds
+        self.stats = PasswordHasherStats()
+        self._pool: concurrent.futures.ThreadPoolExecutor | None = None
+        self._slots: asyncio.Semaphore | None = None
+
+    @property
+    def pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="password-hash"
+            )
+        return self._pool
+
+    @property
+    def slots(self) -> asyncio.Semaphore:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_queue_depth)
+        return self._slots
+
+    def start(self) -> None:
+        self.pool
+        logger.info(
+            f"Password Hasher --- Started with {self.workers} threads, queue depth {self.max_queue_depth} "
+            f"and cost {self.rounds}"
+        )
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+        self._slots = None
+        logger.info(f"Password Hasher --- Stopped | {self.stats}")
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password, self.rounds)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return hash_rounds(hashed_password) != self.rounds
+
+    async def _run(self, func, *args):
+        queued_at = time.perf_counter()
+        acquired = False
+        self._count("waiting", 1)
+        try:
+            async with asyncio.timeout(self.queue_timeout):
+                await self.slots.acquire()
+                acquired = True
+        except TimeoutError:
+            self.stats.rejected += 1
+            PASSWORD_HASH_REJECTED.inc()
+            raise PasswordHasherBusy("Too many password hashing requests, try again later.")
+        except BaseException:
+            # Cancelled right after getting a slot: give it back, or the pool shrinks for good.
+            if acquired:
+                self.slots.release()
+            raise
+        finally:
+            self._count("waiting", -1)
+            waited = time.perf_counter() - queued_at
+            PASSWORD_HASH_WAIT_SECONDS.observe(waited)
+
+        self.stats.wait_seconds_total += waited
+        self.stats.wait_seconds_max = max(self.stats.wait_seconds_max, waited)
+        self._count("in_flight", 1)
+        started = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.pool, func, *args)
+        finally:
+            self._count("in_flight", -1)
+            self.stats.completed += 1
+            self.stats.run_seconds_total += time.perf_counter() - started
+            self.slots.release()
+            logger.debug(f"Password hashing | queued={waited * 1000:.1f}ms, {self.stats}")
+
+    def _count(self, state: str, delta: int) -> None:
+        setattr(self.stats, state, getattr(self.stats, state) + delta)
+        PASSWORD_HASH_JOBS.labels(state=state).set(getattr(self.stats, state))
+
+
+password_hasher: PasswordHasher = PasswordHasher()
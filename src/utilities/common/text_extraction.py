@@ -1,38 +1,36 @@
-import fitz
-import docx
 import requests
 import os
+import tempfile
 from typing import Optional
+from urllib.parse import urlparse
 from fastapi import HTTPException
+from src.utilities.extraction.doc_reader import read_doc_text
+from src.utilities.extraction.docx_reader import read_docx_text
+from src.utilities.extraction.formats import detect_format
+from src.utilities.extraction.pdf_engine import pdf_engine
+from src.utilities.extraction.registry import extractor_registry
+from src.utilities.extraction.source import DocumentSource, Payload
 
-def extract_text_from_pdf(file_path: str) -> str:
+def extract_text_from_pdf(file_path: Payload) -> str:
     text = ""
     try:
-        doc = fitz.open(file_path)
-        text = "\n".join([page.get_text() for page in doc])
+        text = pdf_engine.extract(file_path).text
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error extracting PDF text: {e}")
     return text
 
-def extract_text_from_docx(file_path: str) -> str:
+def extract_text_from_docx(file_path: Payload) -> str:
     text = ""
     try:
-        doc = docx.Document(file_path)
-        text = "\n".join([para.text for para in doc.paragraphs])
+        text = read_docx_text(file_path)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error extracting DOCX text: {e}")
     return text
 
-def extract_text_from_doc(file_path: str) -> str:
-    import win32com.client
+def extract_text_from_doc(file_path: Payload) -> str:
     text = ""
     try:
-        word = win32com.client.Dispatch("Word.Application")
-        word.Visible = False
-        doc = word.Documents.Open(file_path)
-        text = doc.Content.Text
-        doc.Close()
-        word.Quit()
+        text = read_doc_text(file_path)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error extracting DOC text: {e}")
     return text
@@ -41,9 +39,9 @@ def download_file_from_url(url: str, download_dir: str) -> str:
     try:
         response = requests.get(url, stream=True)
         response.raise_for_status()
-        filename = url.split("/")[-1]
-        file_path = os.path.join(download_dir, filename)
-        with open(file_path, 'wb') as f:
+        suffix = os.path.splitext(urlparse(url).path)[1]
+        fd, file_path = tempfile.mkstemp(prefix="extract-", suffix=suffix, dir=download_dir)
+        with os.fdopen(fd, 'wb') as f:
             for chunk in response.iter_content(chunk_size=8192):
                 f.write(chunk)
         return file_path
@@ -54,26 +52,24 @@ def extract_text_from_file(file_url: Optional[str] = None, file_path: Optional[s
     if not os.path.exists(download_dir):
         os.makedirs(download_dir)
 
+    downloaded_path = None
     try:
         if file_url:
-            file_path = download_file_from_url(file_url, download_dir)
+            file_path = downloaded_path = download_file_from_url(file_url, download_dir)
 
-        if file_path:
-            file_format = file_path.split('.')[-1].lower()
-        else:
+        if not file_path:
             raise HTTPException(status_code=400, detail="No file provided or file URL provided.")
 
-        if file_format == "pdf":
-            return extract_text_from_pdf(file_path)
-        elif file_format == "docx":
-            return extract_text_from_docx(file_path)
-        elif file_format == "doc":
-            return extract_text_from_doc(file_path)
-        else:
-            raise HTTPException(status_code=400, detail="Unsupported file format.")
-    
+        with DocumentSource.from_path(file_path) as source:
+            return extractor_registry.extract(detect_format(source), source.payload).text
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error extracting text from file: {e}")
+    finally:
+        if downloaded_path and os.path.exists(downloaded_path):
+            os.remove(downloaded_path)
 
 
 # file_url = "https://openxcell-development-public.s3.ap-south-1.amazonaws.com/teachbetter/tools/uploaded_files/personalized_report_generator/22_binit_agarwalla_20250321165628_concept_explainer-understanding_cells__the_building_blocks_of_life.pdf"
@@ -0,0 +1,162 @@
+"""
+Prometheus metrics.
+
+With several server workers, every worker writes its samples to `PROMETHEUS_MULTIPROC_DIR` and
+`/metrics` aggregates them, so a scrape sees all workers whichever one answers it. The variable
+must be set before the workers start (see `prepare_multiprocess_dir`).
+"""
+import asyncio
+import os
+import time
+import typing
+
+from loguru import logger
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+from src.config.manager import settings
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+STAGE_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+if os.environ.get(MULTIPROC_DIR_ENV):
+    # Metrics without labels open their sample file as soon as they are defined below.
+    os.makedirs(os.environ[MULTIPROC_DIR_ENV], exist_ok=True)
+
+STAGE_SECONDS = Histogram(
+    "extraction_stage_seconds",
+    "Time spent per stage: download, detect, parse.<format>, persist, email, and <stage>.queued waits.",
+    ["stage"],
+    buckets=STAGE_BUCKETS,
+)
+PARSE_SECONDS = Histogram(
+    "extraction_parse_seconds",
+    "Time to extract the text of one document, by format and extractor version.",
+    ["format", "extractor"],
+    buckets=STAGE_BUCKETS,
+)
+INPUT_BYTES = Counter("extraction_input_bytes", "Bytes of documents parsed.", ["format"])
+OUTPUT_CHARS = Counter("extraction_output_chars", "Characters of text extracted.", ["format"])
+PAGES = Counter("extraction_pages", "Pages extracted from paged formats.", ["format"])
+PAGES_PER_SECOND = Histogram(
+    "extraction_pages_per_second",
+    "Parse throughput of single documents of paged formats.",
+    ["format"],
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000),
+)
+EVENT_LOOP_LAG = Histogram(
+    "event_loop_lag_seconds",
+    "How late the event loop runs a timer, sampled periodically.",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+DB_POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "SQLAlchemy pool connections by state, summed over live workers.",
+    ["state"],
+    multiprocess_mode="livesum",
+)
+
+PASSWORD_HASH_JOBS = Gauge(
+    "password_hash_jobs",
+    "Password hashing jobs waiting for a slot or holding one, summed over live workers.",
+    ["state"],
+    multiprocess_mode="livesum",
+)
+PASSWORD_HASH_WAIT_SECONDS = Histogram(
+    "password_hash_wait_seconds",
+    "Time password hashing jobs waited for a slot, including rejected ones.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected", "Password hashing jobs rejected after waiting the queue timeout."
+)
+
+
+def observe_stage(stage: str, seconds: float) -> None:
+    STAGE_SECONDS.labels(stage=stage).observe(seconds)
+
+
+def record_extraction(
+    file_format: str, extractor: str, size: int, chars: int, pages: int | None, seconds: float
+) -> None:
+    PARSE_SECONDS.labels(format=file_format, extractor=extractor).observe(seconds)
+    INPUT_BYTES.labels(format=file_format).inc(size)
+    OUTPUT_CHARS.labels(format=file_format).inc(chars)
+    if pages is not None:
+        PAGES.labels(format=file_format).inc(pages)
+        if seconds > 0:
+            PAGES_PER_SECOND.labels(format=file_format).observe(pages / seconds)
+
+
+def prepare_multiprocess_dir(workers: int) -> None:
+    """
+    Points workers at an empty metrics directory before they start; files left by a previous
+    run would otherwise be aggregated into this one's counters.
+    """
+    if workers <= 1 and not os.environ.get(MULTIPROC_DIR_ENV):
+        return
+    directory = os.environ.setdefault(MULTIPROC_DIR_ENV, settings.METRICS_MULTIPROC_DIR)
+    os.makedirs(directory, exist_ok=True)
+    for name in os.listdir(directory):
+        if name.endswith(".db"):
+            os.remove(os.path.join(directory, name))
+
+
+def metrics_payload() -> tuple[bytes, str]:
+    if os.environ.get(MULTIPROC_DIR_ENV):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+class RuntimeMonitor:
+    """
+    Samples event-loop lag and the database pool every `interval` seconds.
+    """
+
+    def __init__(self, interval: float = settings.METRICS_SAMPLE_SECONDS):
+        self.interval = interval
+        self._pool: typing.Any = None
+        self._task: asyncio.Task | None = None
+
+    def start(self, pool: typing.Any) -> None:
+        self._pool = pool
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if os.environ.get(MULTIPROC_DIR_ENV):
+            multiprocess.mark_process_dead(os.getpid())
+
+    async def _run(self) -> None:
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            EVENT_LOOP_LAG.observe(max(0.0, time.perf_counter() - expected))
+            try:
+                self._sample_pool()
+            except Exception as e:
+                logger.debug(f"Could not sample the database pool | {e}")
+
+    def _sample_pool(self) -> None:
+        if self._pool is None or not hasattr(self._pool, "checkedout"):
+            return
+        DB_POOL_CONNECTIONS.labels(state="checked_in").set(self._pool.checkedin())
+        DB_POOL_CONNECTIONS.labels(state="checked_out").set(self._pool.checkedout())
+        # QueuePool counts overflow from -pool_size up; only connections beyond the pool size are overflow.
+        DB_POOL_CONNECTIONS.labels(state="overflow").set(max(0, self._pool.overflow()))
+
+
+runtime_monitor: RuntimeMonitor = RuntimeMonitor()
@@ -0,0 +1,193 @@
+"""
+Opt-in per-request profiling.
+
+A request is profiled when it carries `PROFILER_HEADER` with the admin token, or is picked by
+`PROFILER_SAMPLE_RATE`. cProfile then runs on the event loop thread for the duration of the
+request, and work the request sends to the extraction executor is profiled in the worker thread or
+process that runs it. Each part is written as a pstats file named after the request id under
+`PROFILER_OUTPUT_DIR`; `load_report` merges them.
+
+The loop-thread profile also sees whatever other requests run concurrently on the loop. Only one
+request per process is profiled at a time, since cProfile hooks are per thread (per process on
+Python 3.12+); worker threads that cannot start their own profiler run unprofiled, their calls
+then show up in the loop-thread profile instead.
+
+When neither the token nor a sampling rate is configured the middleware is not installed at all.
+"""
+import contextvars
+import cProfile
+import functools
+import glob
+import hmac
+import io
+import itertools
+import os
+import pstats
+import random
+import re
+import tempfile
+import typing
+import uuid
+
+from loguru import logger
+
+from src.config.manager import settings
+
+PROFILER_HEADER = "x-profile-token"
+REQUEST_ID_HEADER = "x-request-id"
+REQUEST_ID = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+_current_profile: contextvars.ContextVar[typing.Optional["RequestProfile"]] = contextvars.ContextVar(
+    "current_profile", default=None
+)
+
+
+def profiling_enabled() -> bool:
+    return bool(settings.PROFILER_ADMIN_TOKEN) or settings.PROFILER_SAMPLE_RATE > 0
+
+
+def is_admin_token(token: str | None) -> bool:
+    return bool(settings.PROFILER_ADMIN_TOKEN) and token is not None and hmac.compare_digest(
+        token.encode("utf-8"), settings.PROFILER_ADMIN_TOKEN.encode("utf-8")
+    )
+
+
+class RequestProfile:
+    def __init__(self, request_id: str, directory: str = settings.PROFILER_OUTPUT_DIR):
+        self.request_id = request_id
+        self.directory = directory
+        self._parts = itertools.count(1)
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.directory, f"{self.request_id}.pstats")
+
+    def worker_path(self, stage: str) -> str:
+        stage = re.sub(r"[^A-Za-z0-9_.-]", "_", stage)
+        return os.path.join(self.directory, f"{self.request_id}.{stage}.{next(self._parts)}.pstats")
+
+
+def run_profiled(path: str, func: typing.Callable, *args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+    """
+    Runs `func` under cProfile and writes its stats to `path`. Module-level so it can be sent
+    to the process pool.
+    """
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # Another profiler is already active in this process (Python 3.12+).
+        return func(*args, **kwargs)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
+
+
+def profile_executor_call(stage: str, func: typing.Callable) -> typing.Callable:
+    """
+    Wraps work about to be sent to an executor so it is profiled when the current request is.
+    """
+    profile = _current_profile.get()
+    if profile is None:
+        return func
+    return functools.partial(run_profiled, profile.worker_path(stage), func)
+
+
+class ProfilerMiddleware:
+    """
+    ASGI middleware profiling the requests selected by the admin header or the sampling rate.
+    The request id, taken from `X-Request-ID` or generated, is returned in the same header.
+    """
+
+    def __init__(
+        self,
+        app: typing.Any,
+        sample_rate: float = settings.PROFILER_SAMPLE_RATE,
+        directory: str = settings.PROFILER_OUTPUT_DIR,
+        max_profiles: int = settings.PROFILER_MAX_PROFILES,
+    ):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.directory = directory
+        self.max_profiles = max_profiles
+        self._busy = False
+        os.makedirs(self.directory, exist_ok=True)
+
+    async def __call__(self, scope: dict, receive: typing.Callable, send: typing.Callable) -> None:
+        if scope["type"] != "http" or self._busy:
+            await self.app(scope, receive, send)
+            return
+
+        headers = {name.decode("latin-1"): value.decode("latin-1") for name, value in scope["headers"]}
+        if not (is_admin_token(headers.get(PROFILER_HEADER)) or random.random() < self.sample_rate):
+            await self.app(scope, receive, send)
+            return
+
+        request_id = headers.get(REQUEST_ID_HEADER, "")
+        if not REQUEST_ID.match(request_id):
+            request_id = uuid.uuid4().hex
+        profile = RequestProfile(request_id, self.directory)
+
+        async def send_with_request_id(message: dict) -> None:
+            if message["type"] == "http.response.start":
+                message = {**message, "headers": [*message.get("headers", []), (b"x-request-id", request_id.encode())]}
+            await send(message)
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            await self.app(scope, receive, send)
+            return
+
+        self._busy = True
+        token = _current_profile.set(profile)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            profiler.disable()
+            _current_profile.reset(token)
+            self._busy = False
+            profiler.dump_stats(profile.path)
+            logger.info(f"Profiled request {request_id} {scope.get('method')} {scope.get('path')} | {profile.path}")
+            self._prune()
+
+    def _prune(self) -> None:
+        profiles = sorted(glob.glob(os.path.join(self.directory, "*.pstats")), key=os.path.getmtime)
+        request_ids = list(dict.fromkeys(os.path.basename(path).split(".", 1)[0] for path in profiles))
+        for request_id in request_ids[:max(0, len(request_ids) - self.max_profiles)]:
+            for path in glob.glob(os.path.join(self.directory, f"{request_id}.*pstats")):
+                os.remove(path)
+
+
+def list_profiles(directory: str = settings.PROFILER_OUTPUT_DIR) -> list[str]:
+    paths = sorted(glob.glob(os.path.join(directory, "*.pstats")), key=os.path.getmtime, reverse=True)
+    return list(dict.fromkeys(os.path.basename(path).split(".", 1)[0] for path in paths))
+
+
+def load_report(
+    request_id: str, as_text: bool = True, limit: int = 50, directory: str = settings.PROFILER_OUTPUT_DIR
+) -> bytes | None:
+    """
+    Merges the loop-thread and worker profiles of a request into one report: the top `limit`
+    functions by cumulative time as text, or a pstats file for snakeviz/flameprof. Returns None
+    when no profile exists for `request_id`.
+    """
+    if not REQUEST_ID.match(request_id):
+        return None
+    paths = sorted(glob.glob(os.path.join(directory, f"{request_id}.*pstats")))
+    if not paths:
+        return None
+
+    if as_text:
+        output = io.StringIO()
+        stats = pstats.Stats(*paths, stream=output)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+        return output.getvalue().encode("utf-8")
+
+    stats = pstats.Stats(*paths)
+    with tempfile.NamedTemporaryFile(suffix=".pstats") as merged:
+        stats.dump_stats(merged.name)
+        return merged.read()
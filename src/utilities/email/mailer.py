@@ -26,9 +26,9 @@ class Mailer:
         self.from_email = from_email
         self.use_tls = use_tls
 
-    async def send_email(
+    def build_message(
         self, to_email: str, subject: str, body: str, html: Optional[str] = None
-    ) -> None:
+    ) -> EmailMessage:
         message = EmailMessage()
         message["From"] = self.from_email
         message["To"] = to_email
@@ -37,6 +37,16 @@ class Mailer:
 
         if html:
             message.add_alternative(html, subtype="html")
+        return message
+
+    async def send_email(
+        self, to_email: str, subject: str, body: str, html: Optional[str] = None
+    ) -> None:
+        """
+        Sends one email over a connection of its own. Application emails go through the outbox
+        (`src.utilities.email.outbox`) instead, which reuses connections and retries.
+        """
+        message = self.build_message(to_email, subject, body, html)
 
         logger.debug(
             f"Attempting to send email to {to_email} via {self.server}:{self.port}"
@@ -0,0 +1,156 @@
+import asyncio
+import itertools
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+from loguru import logger
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.manager import settings
+from src.repository.crud.email_outbox import EmailOutboxCRUDRepository
+from src.repository.database import async_db
+from src.utilities.core.metrics import observe_stage
+from src.utilities.email.mailer import Mailer
+from src.utilities.email.smtp_pool import SMTPConnectionPool
+
+
+class EmailOutbox:
+    """
+    Sends emails from the durable `email_outbox` table in the background, so requests only
+    insert a row and neither wait for SMTP nor fail with it.
+
+    Emails are held back for `digest_window_seconds` after being queued, and the due emails of one
+    recipient and kind are sent as a single digest. Failed sends are retried with exponential
+    backoff up to `max_attempts`. Every API worker runs a sender; claiming rows with SKIP LOCKED
+    and a lease keeps them from sending the same email twice.
+    """
+
+    def __init__(
+        self,
+        mailer: Optional[Mailer] = None,
+        pool: Optional[SMTPConnectionPool] = None,
+        batch_size: int = settings.EMAIL_OUTBOX_BATCH_SIZE,
+        poll_seconds: float = settings.EMAIL_OUTBOX_POLL_SECONDS,
+        lease_seconds: float = settings.EMAIL_OUTBOX_LEASE_SECONDS,
+        max_attempts: int = settings.EMAIL_OUTBOX_MAX_ATTEMPTS,
+        retry_base_seconds: float = settings.EMAIL_RETRY_BASE_SECONDS,
+        retry_max_seconds: float = settings.EMAIL_RETRY_MAX_SECONDS,
+        digest_window_seconds: float = settings.EMAIL_DIGEST_WINDOW_SECONDS,
+    ):
+        self.mailer = mailer or Mailer()
+        self.pool = pool or SMTPConnectionPool()
+        self.batch_size = max(1, batch_size)
+        self.poll_seconds = poll_seconds
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max(1, max_attempts)
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self.digest_window_seconds = digest_window_seconds
+        self._task: asyncio.Task | None = None
+
+    def enqueue(
+        self,
+        async_session: AsyncSession,
+        to_email: str,
+        subject: str,
+        body: str,
+        kind: str,
+        user_id: Optional[int] = None,
+    ) -> None:
+        """
+        Queues an email in `async_session`; it is stored when the caller commits.
+        """
+        EmailOutboxCRUDRepository(async_session=async_session).add(
+            to_email, subject, body, kind, user_id=user_id, delay_seconds=self.digest_window_seconds
+        )
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            f"Email Outbox --- Started with {self.pool.size} SMTP connections and batches of {self.batch_size}"
+        )
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.pool.close()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                claimed = await self.send_due()
+            except Exception as e:
+                logger.error(f"Email outbox run failed | {e}")
+                claimed = 0
+            if claimed < self.batch_size:
+                await asyncio.sleep(self.poll_seconds)
+
+    async def send_due(self) -> int:
+        """
+        Sends one batch of due emails and records the results. Returns how many emails were claimed.
+        """
+        async with async_db.async_session_factory() as session:
+            emails = await EmailOutboxCRUDRepository(async_session=session).claim_due(
+                self.batch_size, self.lease_seconds
+            )
+        if not emails:
+            return 0
+
+        digests = [
+            list(group)
+            for _, group in itertools.groupby(
+                sorted(emails, key=lambda email: (email.to_email, email.kind, email.id)),
+                key=lambda email: (email.to_email, email.kind),
+            )
+        ]
+        # The pool bounds how many are actually in flight.
+        errors = await asyncio.gather(*(self._send(digest) for digest in digests), return_exceptions=True)
+
+        async with async_db.async_session_factory() as session:
+            repository = EmailOutboxCRUDRepository(async_session=session)
+            sent = [email.id for digest, error in zip(digests, errors) if error is None for email in digest]
+            if sent:
+                await repository.mark_sent(sent)
+            for digest, error in zip(digests, errors):
+                if error is not None:
+                    attempts = max(email.attempts for email in digest)
+                    logger.warning(
+                        f"Sending {len(digest)} email(s) to {digest[0].to_email} failed "
+                        f"(attempt {attempts}/{self.max_attempts}) | {error}"
+                    )
+                    await repository.mark_failed(
+                        [email.id for email in digest], str(error), self._retry_at(attempts)
+                    )
+
+        logger.info(f"Email outbox sent {len(sent)} of {len(emails)} email(s) as {len(digests)} message(s)")
+        return len(emails)
+
+    async def _send(self, digest: list[Row]) -> None:
+        subject, body = self._compose(digest)
+        started = time.perf_counter()
+        try:
+            await self.pool.send(self.mailer.build_message(digest[0].to_email, subject, body))
+        finally:
+            observe_stage("email", time.perf_counter() - started)
+
+    def _compose(self, digest: list[Row]) -> tuple[str, str]:
+        if len(digest) == 1:
+            return digest[0].subject, digest[0].body
+        subject = f"{digest[0].subject} ({len(digest)} updates)"
+        body = f"You have {len(digest)} updates:\n\n" + "\n\n----\n\n".join(email.body for email in digest)
+        return subject, body
+
+    def _retry_at(self, attempts: int) -> Optional[datetime]:
+        if attempts >= self.max_attempts:
+            return None
+        delay = min(self.retry_max_seconds, self.retry_base_seconds * 2 ** (attempts - 1))
+        # Jitter spreads out retries of emails that failed together, e.g. during an SMTP outage.
+        return datetime.utcnow() + timedelta(seconds=delay * random.uniform(0.5, 1.0))
+
+
+email_outbox: EmailOutbox = EmailOutbox()
@@ -0,0 +1,93 @@
+import asyncio
+import contextlib
+from email.message import EmailMessage
+
+import aiosmtplib
+from loguru import logger
+
+from src.config.manager import settings
+
+
+class SMTPConnectionPool:
+    """
+    Keeps up to `size` authenticated SMTP connections open between messages, so a batch pays
+    for the connect, STARTTLS and login round trips once instead of per message.
+
+    Connections that fail are dropped; a message that fails on a reused connection the server
+    has meanwhile closed is retried once on a fresh one.
+    """
+
+    def __init__(
+        self,
+        size: int = settings.EMAIL_SMTP_POOL_SIZE,
+        server: str = settings.SMTP_SERVER,
+        port: int = settings.SMTP_PORT,
+        username: str = settings.SMTP_USERNAME,
+        password: str = settings.SMTP_PASSWORD,
+        use_tls: bool = settings.SMTP_USE_TLS,
+        timeout: float = settings.SMTP_TIMEOUT,
+    ):
+        self.size = max(1, size)
+        self.server = server
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self._idle: list[aiosmtplib.SMTP] = []
+        self._slots: asyncio.Semaphore | None = None
+
+    @property
+    def slots(self) -> asyncio.Semaphore:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.size)
+        return self._slots
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        client = aiosmtplib.SMTP(
+            hostname=self.server, port=self.port, start_tls=self.use_tls, timeout=self.timeout
+        )
+        await client.connect()
+        if self.username:
+            await client.login(self.username, self.password)
+        logger.debug(f"Opened SMTP connection to {self.server}:{self.port}")
+        return client
+
+    async def _discard(self, client: aiosmtplib.SMTP) -> None:
+        with contextlib.suppress(Exception):
+            if client.is_connected:
+                await client.quit()
+        client.close()
+
+    async def send(self, message: EmailMessage) -> None:
+        async with self.slots:
+            while self._idle:
+                client = self._idle.pop()
+                if not client.is_connected:
+                    client.close()
+                    continue
+                try:
+                    await client.send_message(message)
+                except (aiosmtplib.SMTPServerDisconnected, ConnectionError):
+                    # Idle connections get closed by the server; retry on a fresh one below.
+                    client.close()
+                    break
+                except Exception:
+                    await self._discard(client)
+                    raise
+                self._idle.append(client)
+                return
+
+            client = await self._connect()
+            try:
+                await client.send_message(message)
+            except Exception:
+                await self._discard(client)
+                raise
+            self._idle.append(client)
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for client in idle:
+            await self._discard(client)
+        self._slots = None
@@ -0,0 +1,94 @@
+import hashlib
+import sys
+
+import cachetools
+from loguru import logger
+
+from src.config.manager import settings
+from src.repository.crud.extraction_cache import ExtractionCacheCRUDRepository
+from src.repository.database import async_db
+from src.utilities.extraction.options import ExtractionOptions
+
+# Bump a format's version whenever its extractor starts producing different text,
+# so stale cache entries are no longer matched.
+EXTRACTOR_VERSIONS: dict[str, str] = {
+    "pdf": "pdf-2",
+    "docx": "docx-3",
+    "doc": "doc-2",
+    "html": "html-2",
+}
+
+
+def extractor_version(file_format: str, options: ExtractionOptions | None = None) -> str:
+    version = EXTRACTOR_VERSIONS.get(file_format, EXTRACTOR_VERSIONS["html"])
+    variant = options.cache_variant(file_format) if options else ""
+    return f"{version}+{variant}" if variant else version
+
+
+def file_sha256(file_path: str, chunk_size: int = settings.DOWNLOAD_CHUNK_SIZE) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """
+    Content-addressed cache of extracted text keyed by (SHA-256, extractor version).
+
+    Lookups go to an in-process LRU bounded by the memory size of the cached strings, then
+    to the `extraction_cache` table. The cache is best effort: database errors are logged
+    and treated as misses so they never fail an extraction.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = settings.EXTRACTION_CACHE_ENABLED,
+        max_bytes: int = settings.EXTRACTION_CACHE_MAX_BYTES,
+    ):
+        self.enabled = enabled
+        self._memory: cachetools.LRUCache = cachetools.LRUCache(maxsize=max_bytes, getsizeof=sys.getsizeof)
+
+    def _remember(self, key: tuple[str, str], text: str) -> None:
+        # Texts larger than the whole cache are rejected by cachetools; they still live in Postgres.
+        try:
+            self._memory[key] = text
+        except ValueError:
+            pass
+
+    async def get(self, sha256: str, version: str) -> str | None:
+        if not self.enabled:
+            return None
+
+        key = (sha256, version)
+        text = self._memory.get(key)
+        if text is not None:
+            return text
+
+        try:
+            async with async_db.async_session_factory() as session:
+                text = await ExtractionCacheCRUDRepository(async_session=session).find_text(sha256, version)
+        except Exception as e:
+            logger.warning(f"Extraction cache lookup failed for {sha256} | {e}")
+            return None
+
+        if text is not None:
+            self._remember(key, text)
+        return text
+
+    async def put(self, sha256: str, version: str, file_format: str | None, text: str) -> None:
+        if not self.enabled:
+            return
+
+        self._remember((sha256, version), text)
+        try:
+            async with async_db.async_session_factory() as session:
+                await ExtractionCacheCRUDRepository(async_session=session).save_text(
+                    sha256, version, file_format, text
+                )
+        except Exception as e:
+            logger.warning(f"Extraction cache store failed for {sha256} | {e}")
+
+
+extraction_cache: ExtractionCache = ExtractionCache()
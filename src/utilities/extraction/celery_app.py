@@ -0,0 +1,31 @@
+import asyncio
+
+from celery import Celery
+
+from src.config.manager import settings
+
+celery_app = Celery("text_extraction", broker=settings.CELERY_BROKER_URL)
+celery_app.conf.update(task_acks_late=True, worker_prefetch_multiplier=1)
+
+# One loop for the lifetime of the worker, so the DB pool, HTTP client and executor
+# semaphores created on the first task stay usable for the following ones.
+_worker_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _run(coroutine) -> None:
+    global _worker_loop
+    if _worker_loop is None:
+        _worker_loop = asyncio.new_event_loop()
+    _worker_loop.run_until_complete(coroutine)
+
+
+@celery_app.task(name="documents.extract")
+def extract_document_task(document_id: int) -> None:
+    """
+    Celery entrypoint for the `celery` job backend. The extraction executor starts its own
+    process pool, so run workers with the non-daemonic solo pool and scale by process count, e.g.
+    `celery -A src.utilities.extraction.celery_app worker -P solo`.
+    """
+    from src.utilities.extraction.jobs import process_document
+
+    _run(process_document(document_id))
@@ -0,0 +1,63 @@
+import typing
+
+from src.config.manager import settings
+from src.utilities.extraction.excerpt import PAGE_SEPARATOR
+
+PAGE_SEPARATOR_BYTES = PAGE_SEPARATOR.encode("utf-8")
+
+
+class TextChunk(typing.NamedTuple):
+    """
+    A slice of a stored text's UTF-8 encoding. `page_number` is 1-based and counts the pages of the
+    stored text, which are the selected ones only when the extraction was limited to some pages.
+    """
+
+    chunk_index: int
+    page_number: int
+    byte_offset: int
+    content: bytes
+
+
+def iter_page_chunks(
+    text: str, max_bytes: int = settings.DOCUMENT_CHUNK_MAX_BYTES
+) -> typing.Iterator[TextChunk]:
+    """
+    Splits `text` into one chunk per page, and pages longer than `max_bytes` into several. Offsets
+    count the page separators between pages, so they are offsets into `text.encode("utf-8")`.
+    Empty pages still get a chunk, so page numbers have no gaps.
+    """
+    max_bytes = max(1, max_bytes)
+    chunk_index = 0
+    offset = 0
+    for page_number, page in enumerate(text.split(PAGE_SEPARATOR), start=1):
+        data = page.encode("utf-8")
+        for start in range(0, len(data) or 1, max_bytes):
+            content = data[start:start + max_bytes]
+            yield TextChunk(chunk_index, page_number, offset + start, content)
+            chunk_index += 1
+        offset += len(data) + len(PAGE_SEPARATOR_BYTES)
+
+
+class BodySpan(typing.NamedTuple):
+    # `chunk_index` is None for the page separator between two pages.
+    start: int
+    length: int
+    chunk_index: int | None
+
+
+def body_spans(layout: typing.Iterable[tuple[int, int, int]]) -> tuple[list[BodySpan], int]:
+    """
+    Lays out `(chunk_index, page_number, byte_length)` chunks, in text order, as one body with a page
+    separator between pages, the way the full text is. Returns the spans and the body size.
+    """
+    spans: list[BodySpan] = []
+    position = 0
+    previous_page = None
+    for chunk_index, page_number, byte_length in layout:
+        if previous_page is not None and page_number != previous_page:
+            spans.append(BodySpan(position, len(PAGE_SEPARATOR_BYTES), None))
+            position += len(PAGE_SEPARATOR_BYTES)
+        spans.append(BodySpan(position, byte_length, chunk_index))
+        position += byte_length
+        previous_page = page_number
+    return spans, position
@@ -0,0 +1,256 @@
+"""
+Pure-Python text extraction for legacy Word 97-2003 (.doc) binaries.
+
+The file is an OLE compound file (MS-CFB). Its `WordDocument` stream starts with the FIB,
+which points at the piece table (CLX) in the `0Table`/`1Table` stream; the piece table maps
+character positions of the main document to runs of 8-bit or UTF-16 text in `WordDocument` (MS-DOC).
+"""
+import functools
+import mmap
+import struct
+import typing
+
+from src.utilities.extraction.source import Payload
+
+CFB_SIGNATURE = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+MAX_REGULAR_SECTOR = 0xFFFFFFFA
+
+WORD_IDENT = 0xA5EC
+MIN_WORD97_NFIB = 0x00C0
+
+# Control characters of the main text that carry structure rather than content.
+FIELD_BEGIN, FIELD_SEPARATOR, FIELD_END = "\x13", "\x14", "\x15"
+SPECIAL_CHARACTERS = str.maketrans(
+    {
+        "\r": "\n",
+        "\x07": "\t",
+        "\x0b": "\n",
+        "\x0c": "\n",
+        "\x1e": "-",
+        "\x00": None,
+        "\x01": None,
+        "\x02": None,
+        "\x05": None,
+        "\x08": None,
+        "\x1f": None,
+    }
+)
+
+
+class DocFormatError(ValueError):
+    pass
+
+
+class CompoundFile:
+    """
+    Minimal read-only MS-CFB reader: enough to list the directory and read whole streams.
+    """
+
+    def __init__(self, data: typing.Union[bytes, mmap.mmap]):
+        self.data = data
+        if bytes(data[:8]) != CFB_SIGNATURE:
+            raise DocFormatError("Not an OLE compound file.")
+
+        (
+            sector_shift,
+            mini_sector_shift,
+        ) = struct.unpack_from("<HH", data, 0x1E)
+        (
+            fat_sector_count,
+            first_directory_sector,
+            _transaction_signature,
+            self.mini_stream_cutoff,
+            first_mini_fat_sector,
+            mini_fat_sector_count,
+            first_difat_sector,
+            difat_sector_count,
+        ) = struct.unpack_from("<IIIIIIII", data, 0x2C)
+
+        self.sector_size = 1 << sector_shift
+        self.mini_sector_size = 1 << mini_sector_shift
+        self.fat = self._read_fat(fat_sector_count, first_difat_sector, difat_sector_count)
+        self.entries = self._read_directory(first_directory_sector)
+
+        self.mini_fat = self._unpack_sectors(self._chain(first_mini_fat_sector)) if mini_fat_sector_count else []
+
+    @functools.cached_property
+    def mini_stream(self) -> bytes:
+        root = self.entries[0]
+        return self._read_chain(root["start"], root["size"])
+
+    def _sector(self, sector: int) -> bytes:
+        offset = (sector + 1) * self.sector_size
+        chunk = self.data[offset:offset + self.sector_size]
+        if len(chunk) < self.sector_size:
+            # Files may be truncated after the last used byte of the final sector.
+            chunk = bytes(chunk) + b"\x00" * (self.sector_size - len(chunk))
+        return chunk
+
+    def _unpack_sectors(self, sectors: list[int]) -> list[int]:
+        entries_per_sector = self.sector_size // 4
+        table: list[int] = []
+        for sector in sectors:
+            table.extend(struct.unpack(f"<{entries_per_sector}I", self._sector(sector)))
+        return table
+
+    def _read_fat(self, fat_sector_count: int, first_difat_sector: int, difat_sector_count: int) -> list[int]:
+        fat_sectors = list(struct.unpack_from("<109I", self.data, 0x4C))
+        difat_sector = first_difat_sector
+        for _ in range(difat_sector_count):
+            if difat_sector > MAX_REGULAR_SECTOR:
+                break
+            values = struct.unpack(f"<{self.sector_size // 4}I", self._sector(difat_sector))
+            fat_sectors.extend(values[:-1])
+            difat_sector = values[-1]
+        return self._unpack_sectors([sector for sector in fat_sectors[:fat_sector_count] if sector <= MAX_REGULAR_SECTOR])
+
+    def _chain(self, start: int, table: list[int] | None = None) -> list[int]:
+        table = self.fat if table is None else table
+        chain: list[int] = []
+        sector = start
+        while sector <= MAX_REGULAR_SECTOR:
+            if sector >= len(table) or len(chain) > len(table):
+                raise DocFormatError("Corrupt sector chain.")
+            chain.append(sector)
+            sector = table[sector]
+        return chain
+
+    def _read_chain(self, start: int, size: int) -> bytes:
+        if start > MAX_REGULAR_SECTOR:
+            return b""
+        return b"".join(self._sector(sector) for sector in self._chain(start))[:size]
+
+    def _read_mini_chain(self, start: int, size: int) -> bytes:
+        chunks = []
+        for sector in self._chain(start, self.mini_fat):
+            offset = sector * self.mini_sector_size
+            chunks.append(self.mini_stream[offset:offset + self.mini_sector_size])
+        return b"".join(chunks)[:size]
+
+    def _read_directory(self, first_directory_sector: int) -> list[dict]:
+        raw = b"".join(self._sector(sector) for sector in self._chain(first_directory_sector))
+        entries = []
+        for offset in range(0, len(raw), 128):
+            name_length, entry_type = struct.unpack_from("<HB", raw, offset + 64)
+            start, size = struct.unpack_from("<IQ", raw, offset + 116)
+            if self.sector_size == 512:
+                # Version 3 files only define the low 32 bits of the stream size.
+                size &= 0xFFFFFFFF
+            name = raw[offset:offset + max(0, name_length - 2)].decode("utf-16-le", errors="replace")
+            entries.append({"name": name, "type": entry_type, "start": start, "size": size})
+        return entries
+
+    def has_stream(self, name: str) -> bool:
+        return any(entry["type"] == 2 and entry["name"] == name for entry in self.entries[1:])
+
+    def open_stream(self, name: str) -> bytes:
+        for entry in self.entries[1:]:
+            if entry["type"] == 2 and entry["name"] == name:
+                if entry["size"] < self.mini_stream_cutoff:
+                    return self._read_mini_chain(entry["start"], entry["size"])
+                return self._read_chain(entry["start"], entry["size"])
+        raise DocFormatError(f"Stream {name} not found.")
+
+
+def _iter_pieces(compound_file: CompoundFile) -> typing.Iterator[str]:
+    word_document = compound_file.open_stream("WordDocument")
+    if len(word_document) < 0x1AA:
+        raise DocFormatError("WordDocument stream is too short.")
+
+    ident, nfib = struct.unpack_from("<HH", word_document, 0x00)
+    (flags,) = struct.unpack_from("<H", word_document, 0x0A)
+    if ident != WORD_IDENT:
+        raise DocFormatError("Not a Word document.")
+    if nfib < MIN_WORD97_NFIB:
+        raise DocFormatError("Word 95 and older documents are not supported.")
+    if flags & 0x0100:
+        raise DocFormatError("Encrypted Word documents are not supported.")
+
+    (ccp_text,) = struct.unpack_from("<i", word_document, 0x4C)
+    fc_clx, lcb_clx = struct.unpack_from("<II", word_document, 0x1A2)
+    table = compound_file.open_stream("1Table" if flags & 0x0200 else "0Table")
+    clx = table[fc_clx:fc_clx + lcb_clx]
+
+    # Skip the Prc entries (property modifiers) in front of the piece table.
+    offset = 0
+    while offset < len(clx) and clx[offset] == 0x01:
+        (grpprl_size,) = struct.unpack_from("<h", clx, offset + 1)
+        offset += 3 + grpprl_size
+    if offset >= len(clx) or clx[offset] != 0x02:
+        raise DocFormatError("Piece table not found.")
+
+    (plc_size,) = struct.unpack_from("<I", clx, offset + 1)
+    plc_offset = offset + 5
+    piece_count = (plc_size - 4) // 12
+    cps = struct.unpack_from(f"<{piece_count + 1}i", clx, plc_offset)
+    descriptors_offset = plc_offset + 4 * (piece_count + 1)
+
+    for index in range(piece_count):
+        cp_start, cp_end = cps[index], min(cps[index + 1], ccp_text)
+        if cp_start >= ccp_text:
+            break
+        (fc,) = struct.unpack_from("<I", clx, descriptors_offset + 8 * index + 2)
+        length = cp_end - cp_start
+        if fc & 0x40000000:
+            start = (fc & 0x3FFFFFFF) // 2
+            yield word_document[start:start + length].decode("cp1252", errors="replace")
+        else:
+            start = fc & 0x3FFFFFFF
+            yield word_document[start:start + 2 * length].decode("utf-16-le", errors="replace")
+
+
+def _clean(pieces: typing.Iterable[str]) -> typing.Iterator[str]:
+    """
+    Drops field instructions (between begin and separator) while keeping field results,
+    and maps Word's structural control characters to plain text.
+    """
+    depth_in_code = []
+    for piece in pieces:
+        if not depth_in_code and FIELD_BEGIN not in piece and FIELD_END not in piece:
+            yield piece.translate(SPECIAL_CHARACTERS)
+            continue
+
+        output = []
+        for character in piece:
+            if character == FIELD_BEGIN:
+                depth_in_code.append(True)
+            elif character == FIELD_SEPARATOR:
+                if depth_in_code:
+                    depth_in_code[-1] = False
+            elif character == FIELD_END:
+                if depth_in_code:
+                    depth_in_code.pop()
+            elif not any(depth_in_code):
+                output.append(character)
+        if output:
+            yield "".join(output).translate(SPECIAL_CHARACTERS)
+
+
+def iter_doc_text(payload: Payload) -> typing.Iterator[str]:
+    """
+    Yields the main-document text of a .doc file piece by piece.
+    """
+    if isinstance(payload, (bytes, bytearray)):
+        yield from _clean(_iter_pieces(CompoundFile(payload)))
+        return
+
+    with open(payload, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        yield from _clean(_iter_pieces(CompoundFile(data)))
+
+
+def is_word_document(payload: Payload) -> bool:
+    """
+    Tells Word documents apart from the other OLE compound files (.xls, .ppt, .msg, ...) by their
+    `WordDocument` stream. Only the FAT and directory are read.
+    """
+    try:
+        if isinstance(payload, (bytes, bytearray)):
+            return CompoundFile(payload).has_stream("WordDocument")
+        with open(payload, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return CompoundFile(data).has_stream("WordDocument")
+    except (DocFormatError, struct.error, ValueError):
+        return False
+
+
+def read_doc_text(payload: Payload) -> str:
+    return "".join(iter_doc_text(payload))
@@ -0,0 +1,117 @@
+"""
+Streaming text extraction for DOCX files.
+
+Instead of building the python-docx object model, the WordprocessingML parts are read straight
+from the zip with lxml `iterparse`; every element is cleared once its text has been taken, so
+memory stays flat regardless of document size. Besides the body this covers table cells,
+headers, footers, footnotes and endnotes.
+"""
+import io
+import re
+import typing
+import zipfile
+
+from lxml import etree
+
+from src.utilities.extraction.excerpt import PAGE_SEPARATOR
+from src.utilities.extraction.source import Payload
+
+W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def _w(tag: str) -> str:
+    return f"{{{W_NAMESPACE}}}{tag}"
+
+
+P, T, TAB, BR, CR, TC, TR, TBL = (_w(tag) for tag in ("p", "t", "tab", "br", "cr", "tc", "tr", "tbl"))
+RENDERED_PAGE_BREAK = _w("lastRenderedPageBreak")
+BREAK_TYPE = _w("type")
+BODY_PART = "word/document.xml"
+NOTE_PARTS = ("word/footnotes.xml", "word/endnotes.xml")
+HEADER_FOOTER_PART = re.compile(r"^word/(header|footer)(\d*)\.xml$")
+
+
+def _discard(element: etree._Element) -> None:
+    element.clear()
+    while element.getprevious() is not None:
+        del element.getparent()[0]
+
+
+def iter_part_lines(stream: typing.BinaryIO) -> typing.Iterator[str]:
+    """
+    Yields one line per paragraph, and one tab-separated line per table row.
+
+    Page breaks, explicit or where Word last laid out a new page, become `PAGE_SEPARATOR`;
+    a break with no text since the previous one is dropped, as Word records both for manual breaks.
+    """
+    runs: list[str] = []
+    cell_paragraphs: list[str] = []
+    row_cells: list[str] = []
+    at_page_start = True
+
+    for _, element in etree.iterparse(
+        stream,
+        events=("end",),
+        tag=(P, T, TAB, BR, CR, TC, TR, TBL, RENDERED_PAGE_BREAK),
+        resolve_entities=False,
+        huge_tree=True,
+    ):
+        tag = element.tag
+        if tag == T:
+            runs.append(element.text or "")
+            at_page_start = at_page_start and not element.text
+        elif tag == TAB:
+            runs.append("\t")
+        elif tag == RENDERED_PAGE_BREAK or (tag == BR and element.get(BREAK_TYPE) == "page"):
+            if not at_page_start:
+                runs.append(PAGE_SEPARATOR)
+                at_page_start = True
+        elif tag in (BR, CR):
+            runs.append("\n")
+        elif tag == P:
+            paragraph = "".join(runs)
+            runs = []
+            parent = element.getparent()
+            if parent is not None and parent.tag == TC:
+                cell_paragraphs.append(paragraph)
+            else:
+                yield paragraph
+                _discard(element)
+        elif tag == TC:
+            row_cells.append(" ".join(paragraph for paragraph in cell_paragraphs if paragraph))
+            cell_paragraphs = []
+        elif tag == TR:
+            yield "\t".join(row_cells)
+            row_cells = []
+            _discard(element)
+        elif tag == TBL:
+            _discard(element)
+
+
+def _part_names(archive: zipfile.ZipFile) -> list[str]:
+    names = archive.namelist()
+    headers_and_footers = sorted(
+        (name for name in names if HEADER_FOOTER_PART.match(name)),
+        key=lambda name: (
+            HEADER_FOOTER_PART.match(name).group(1) != "header",
+            int(HEADER_FOOTER_PART.match(name).group(2) or 0),
+        ),
+    )
+    return [BODY_PART, *headers_and_footers, *(name for name in NOTE_PARTS if name in names)]
+
+
+def iter_docx_lines(payload: Payload) -> typing.Iterator[str]:
+    """
+    Yields the body's lines followed by the non-empty lines of headers, footers and notes,
+    which thus count as part of the last page.
+    """
+    with zipfile.ZipFile(io.BytesIO(payload) if isinstance(payload, (bytes, bytearray)) else payload) as archive:
+        for part_name in _part_names(archive):
+            with archive.open(part_name) as stream:
+                for line in iter_part_lines(stream):
+                    if line or part_name == BODY_PART:
+                        yield line
+
+
+def read_docx_text(payload: Payload) -> str:
+    return "\n".join(iter_docx_lines(payload))
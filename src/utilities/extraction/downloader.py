@@ -0,0 +1,123 @@
+import dataclasses
+import hashlib
+import os
+from urllib.parse import urlparse
+
+import httpx
+from fastapi import HTTPException, status
+from loguru import logger
+
+from src.config.manager import settings
+from src.utilities.extraction.executor import StageTimer
+from src.utilities.extraction.source import DocumentSource
+
+
+@dataclasses.dataclass
+class DownloadedFile:
+    url: str
+    source: DocumentSource
+    content_type: str | None
+    size: int
+    sha256: str
+
+
+class HTTPDownloader:
+    """
+    Downloads URLs through one shared, pooled `httpx.AsyncClient`.
+    """
+
+    def __init__(
+        self,
+        connect_timeout: float = settings.HTTP_CONNECT_TIMEOUT,
+        read_timeout: float = settings.HTTP_READ_TIMEOUT,
+        max_connections: int = settings.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections: int = settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = settings.HTTP_KEEPALIVE_EXPIRY,
+        http2: bool = settings.HTTP_ENABLE_HTTP2,
+        max_bytes: int = settings.DOWNLOAD_MAX_BYTES,
+        chunk_size: int = settings.DOWNLOAD_CHUNK_SIZE,
+    ):
+        self.timeout = httpx.Timeout(
+            connect=connect_timeout, read=read_timeout, write=read_timeout, pool=connect_timeout
+        )
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=self.http2,
+                timeout=self.timeout,
+                limits=self.limits,
+                follow_redirects=True,
+            )
+        return self._client
+
+    async def start(self) -> httpx.AsyncClient:
+        logger.info("HTTP Downloader --- Client Created")
+        return self.client
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            logger.info("HTTP Downloader --- Client Closed")
+
+    def _too_large(self, url: str) -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File at {url} exceeds the {self.max_bytes} byte download limit.",
+        )
+
+    async def download(self, url: str, timer: StageTimer | None = None) -> DownloadedFile:
+        """
+        Streams `url` into a `DocumentSource`, enforcing the size limit both from Content-Length and while
+        reading. The SHA-256 of the body is computed on the fly for the extraction cache.
+        """
+        timer = timer or StageTimer()
+        source = DocumentSource(name=os.path.basename(urlparse(url).path) or "index.html")
+
+        try:
+            with timer.stage("download"):
+                async with self.client.stream("GET", url) as response:
+                    response.raise_for_status()
+                    source.content_type = response.headers.get("Content-Type")
+
+                    content_length = response.headers.get("Content-Length")
+                    if content_length and content_length.isdigit() and int(content_length) > self.max_bytes:
+                        raise self._too_large(url)
+
+                    size = 0
+                    digest = hashlib.sha256()
+                    async for chunk in response.aiter_bytes(chunk_size=self.chunk_size):
+                        size += len(chunk)
+                        if size > self.max_bytes:
+                            raise self._too_large(url)
+                        digest.update(chunk)
+                        source.write(chunk)
+                    source.finish()
+
+            return DownloadedFile(
+                url=url,
+                source=source,
+                content_type=source.content_type,
+                size=size,
+                sha256=digest.hexdigest(),
+            )
+        except HTTPException:
+            source.close()
+            raise
+        except Exception as e:
+            source.close()
+            raise HTTPException(status_code=500, detail=f"Error downloading file: {e}")
+
+
+http_downloader: HTTPDownloader = HTTPDownloader()
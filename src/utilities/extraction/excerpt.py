@@ -0,0 +1,74 @@
+import dataclasses
+import time
+import typing
+
+from src.utilities.extraction.options import ExtractionOptions
+
+# Pages are separated by a form feed, as pdftotext does, so page boundaries survive in stored and cached text.
+PAGE_SEPARATOR = "\f"
+
+
+@dataclasses.dataclass
+class ExtractedText:
+    text: str
+    partial: bool = False
+
+
+def excerpt(
+    pieces: typing.Iterable[str],
+    options: ExtractionOptions,
+    separator: str = "\n",
+    paged: bool = True,
+) -> ExtractedText:
+    """
+    Joins `pieces` with `separator` while applying the page selection, `max_chars` and the deadline
+    of `options`, stopping as soon as no more wanted text can follow. Pages are delimited by
+    `PAGE_SEPARATOR`; for formats without pages (`paged=False`) the page selection is ignored.
+    With no limits set this is exactly `separator.join(pieces)`.
+    """
+    selects_pages = paged and options.pages is not None
+    kept_pages: list[str] = []
+    current: list[str] = []
+    page = 0
+    size = 0
+    partial = False
+
+    def finish_page() -> None:
+        nonlocal partial
+        if not selects_pages or options.selects_page(page):
+            kept_pages.append(separator.join(current))
+        elif any(current):
+            partial = True
+
+    for piece in pieces:
+        if options.deadline is not None and time.time() > options.deadline:
+            partial = True
+            break
+
+        parts = piece.split(PAGE_SEPARATOR) if paged else [piece]
+        for index, part in enumerate(parts):
+            if index:
+                finish_page()
+                current = []
+                page += 1
+                if selects_pages and options.past_last_page(page):
+                    return _truncated(kept_pages, options, partial=True)
+            current.append(part)
+            if not selects_pages or options.selects_page(page):
+                size += len(part)
+
+        if options.max_chars is not None and size > options.max_chars:
+            break
+    else:
+        finish_page()
+        return _truncated(kept_pages, options, partial)
+
+    finish_page()
+    return _truncated(kept_pages, options, partial=True)
+
+
+def _truncated(kept_pages: list[str], options: ExtractionOptions, partial: bool) -> ExtractedText:
+    text = PAGE_SEPARATOR.join(kept_pages)
+    if options.max_chars is not None and len(text) > options.max_chars:
+        return ExtractedText(text[:options.max_chars], partial=True)
+    return ExtractedText(text, partial)
@@ -0,0 +1,146 @@
+import asyncio
+import concurrent.futures
+import contextlib
+import functools
+import multiprocessing
+import time
+import typing
+
+from loguru import logger
+
+from src.config.manager import settings
+from src.utilities.core.metrics import observe_stage
+from src.utilities.core.profiler import profile_executor_call
+
+
+class StageTimer:
+    """
+    Accumulates the wall-clock time a request spends in each extraction stage, and reports
+    every timed stage to the `extraction_stage_seconds` histogram.
+    """
+
+    def __init__(self):
+        self.timings: dict[str, float] = {}
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> typing.Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.timings[name] = self.timings.get(name, 0.0) + elapsed
+            observe_stage(name, elapsed)
+
+    def summary(self) -> str:
+        return ", ".join(f"{name}={seconds * 1000:.1f}ms" for name, seconds in self.timings.items())
+
+
+class ExtractionExecutor:
+    """
+    Runs blocking extraction work off the event loop.
+
+    I/O-ish and short work (file hashing, format detection, text compression, broker publishing,
+    and parsing of documents too small to be worth a process round trip) goes to a thread pool and
+    CPU-bound parsing goes to a process pool. Each pool admits at most `max_queue_depth` queued or
+    running jobs; further callers wait for a slot instead of piling onto the pool.
+    """
+
+    def __init__(
+        self,
+        thread_workers: int = settings.EXTRACTION_THREAD_WORKERS,
+        process_workers: int = settings.EXTRACTION_PROCESS_WORKERS,
+        max_queue_depth: int = settings.EXTRACTION_MAX_QUEUE_DEPTH,
+    ):
+        self.thread_workers = max(1, thread_workers)
+        self.process_workers = max(1, process_workers)
+        self.max_queue_depth = max(1, max_queue_depth)
+        self._thread_pool: concurrent.futures.ThreadPoolExecutor | None = None
+        self._process_pool: concurrent.futures.ProcessPoolExecutor | None = None
+        self._io_slots: asyncio.Semaphore | None = None
+        self._cpu_slots: asyncio.Semaphore | None = None
+
+    @property
+    def thread_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        if self._thread_pool is None:
+            self._thread_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.thread_workers, thread_name_prefix="extraction-io"
+            )
+        return self._thread_pool
+
+    @property
+    def process_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        if self._process_pool is None:
+            # Workers are spawned rather than forked so they never inherit the event loop or DB pool.
+            self._process_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.process_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._process_pool
+
+    @property
+    def io_slots(self) -> asyncio.Semaphore:
+        if self._io_slots is None:
+            self._io_slots = asyncio.Semaphore(self.max_queue_depth)
+        return self._io_slots
+
+    @property
+    def cpu_slots(self) -> asyncio.Semaphore:
+        if self._cpu_slots is None:
+            self._cpu_slots = asyncio.Semaphore(self.max_queue_depth)
+        return self._cpu_slots
+
+    def start(self) -> None:
+        self.thread_pool
+        self.process_pool
+        logger.info(
+            f"Extraction Executor --- Started with {self.thread_workers} threads, "
+            f"{self.process_workers} processes and queue depth {self.max_queue_depth}"
+        )
+
+    def shutdown(self) -> None:
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=True, cancel_futures=True)
+            self._process_pool = None
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=True, cancel_futures=True)
+            self._thread_pool = None
+        self._io_slots = None
+        self._cpu_slots = None
+        logger.info("Extraction Executor --- Stopped")
+
+    async def run_io(
+        self, stage: str, func: typing.Callable, *args: typing.Any, timer: StageTimer | None = None, **kwargs: typing.Any
+    ) -> typing.Any:
+        return await self._run(self.thread_pool, self.io_slots, stage, func, args, kwargs, timer)
+
+    async def run_cpu(
+        self, stage: str, func: typing.Callable, *args: typing.Any, timer: StageTimer | None = None, **kwargs: typing.Any
+    ) -> typing.Any:
+        return await self._run(self.process_pool, self.cpu_slots, stage, func, args, kwargs, timer)
+
+    async def _run(
+        self,
+        pool: concurrent.futures.Executor,
+        slots: asyncio.Semaphore,
+        stage: str,
+        func: typing.Callable,
+        args: tuple,
+        kwargs: dict,
+        timer: StageTimer | None,
+    ) -> typing.Any:
+        timer = timer or StageTimer()
+        loop = asyncio.get_running_loop()
+
+        with timer.stage(f"{stage}.queued"):
+            await slots.acquire()
+        try:
+            with timer.stage(stage):
+                call = profile_executor_call(stage, functools.partial(func, *args, **kwargs))
+                return await loop.run_in_executor(pool, call)
+        finally:
+            slots.release()
+            logger.debug(f"Extraction stage {stage} | {timer.summary()}")
+
+
+extraction_executor: ExtractionExecutor = ExtractionExecutor()
@@ -0,0 +1,99 @@
+"""
+Document format detection.
+
+The leading magic bytes decide first, since they cannot be mislabeled: PDF header, OLE compound
+file, whose directory tells a legacy Word document apart from Excel, PowerPoint or Outlook files,
+or zip, where the archive manifest tells a DOCX apart from other OOXML/zip files. Only when the
+content is not conclusive do the Content-Type header and then the file name extension decide.
+Other text content is treated as HTML; other binary content is rejected.
+"""
+import codecs
+import io
+import typing
+import zipfile
+
+from src.utilities.extraction.doc_reader import CFB_SIGNATURE, is_word_document
+from src.utilities.extraction.source import DocumentSource, Payload
+
+SNIFF_BYTES = 2048
+
+PDF_MAGIC = b"%PDF-"
+ZIP_MAGIC = b"PK\x03\x04"
+DOCX_MAIN_PART = "word/document.xml"
+TEXT_BOMS = (codecs.BOM_UTF8, codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)
+
+CONTENT_TYPE_FORMATS: dict[str, str] = {
+    "application/pdf": "pdf",
+    "application/x-pdf": "pdf",
+    "application/msword": "doc",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": "docx",
+    "text/html": "html",
+    "application/xhtml+xml": "html",
+    "text/plain": "html",
+}
+EXTENSION_FORMATS: dict[str, str] = {
+    "pdf": "pdf",
+    "doc": "doc",
+    "docx": "docx",
+    "html": "html",
+    "htm": "html",
+    "xhtml": "html",
+    "txt": "html",
+}
+
+
+def format_from_content_type(content_type: str | None) -> str | None:
+    if not content_type:
+        return None
+    return CONTENT_TYPE_FORMATS.get(content_type.split(";", 1)[0].strip().lower())
+
+
+def format_from_extension(extension: str) -> str | None:
+    return EXTENSION_FORMATS.get(extension)
+
+
+def _zip_format(payload: Payload) -> str | None:
+    try:
+        with zipfile.ZipFile(io.BytesIO(payload) if isinstance(payload, (bytes, bytearray)) else payload) as archive:
+            names = set(archive.namelist())
+    except zipfile.BadZipFile:
+        return None
+    return "docx" if DOCX_MAIN_PART in names else None
+
+
+def _looks_like_text(head: bytes) -> bool:
+    return head.startswith(TEXT_BOMS) or b"\x00" not in head
+
+
+def sniff_format(head: bytes, payload: typing.Callable[[], Payload]) -> str | None:
+    """
+    Detects the format from content alone. `payload` is only called for OLE and zip files,
+    whose directories may live anywhere in the file.
+    """
+    if PDF_MAGIC in head[:1024]:
+        return "pdf"
+    if head.startswith(CFB_SIGNATURE):
+        return "doc" if is_word_document(payload()) else None
+    if head.startswith(ZIP_MAGIC):
+        return _zip_format(payload())
+    return None
+
+
+def detect_format(source: DocumentSource) -> str | None:
+    """
+    Returns the extractor format for `source`, or None when it is binary content of an unsupported format.
+    """
+    head = source.read_head(SNIFF_BYTES)
+    sniffed = sniff_format(head, lambda: source.payload)
+    if sniffed:
+        return sniffed
+    if not head:
+        return format_from_extension(source.extension) or "html"
+    if not _looks_like_text(head):
+        # Binary content that is neither PDF, Word nor DOCX: a label claiming otherwise is wrong.
+        return None
+    return (
+        format_from_content_type(source.content_type)
+        or format_from_extension(source.extension)
+        or "html"
+    )
@@ -0,0 +1,137 @@
+"""
+HTML text extraction with lxml.
+
+The page is parsed once with libxml2's HTML parser and walked in a single pass: boilerplate
+subtrees (scripts, styles, navigation, footers, ...) are skipped, block elements become line
+breaks and whitespace is collapsed. The charset comes from the Content-Type header, then a BOM,
+then `<meta>` tags, falling back to UTF-8. Pages that do not decode in that charset are read as
+cp1252, which undeclared and mislabelled pages mostly are, and as a last resort with replacement
+characters, so stray bytes never fail an extraction.
+"""
+import codecs
+import re
+import typing
+
+from lxml import etree
+
+from src.utilities.extraction.source import Payload
+
+DROPPED_TAGS = frozenset(
+    {"head", "script", "style", "noscript", "template", "nav", "footer", "svg", "iframe", "object", "canvas"}
+)
+BLOCK_TAGS = frozenset(
+    {
+        "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt", "figcaption",
+        "figure", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "ol",
+        "p", "pre", "section", "table", "tr", "ul",
+    }
+)
+CELL_TAGS = frozenset({"td", "th"})
+MAIN_CONTENT_XPATHS = ("//main", "//article", "//*[@role='main']", "//body")
+
+HEADER_CHARSET = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+META_CHARSET = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?\s*([\w.:-]+)", re.IGNORECASE)
+HORIZONTAL_WHITESPACE = re.compile(r"[^\S\n]+")
+BOMS = ((codecs.BOM_UTF8, "utf-8"), (codecs.BOM_UTF16_LE, "utf-16-le"), (codecs.BOM_UTF16_BE, "utf-16-be"))
+
+
+def _known_charset(name: str | bytes | None) -> str | None:
+    if not name:
+        return None
+    if isinstance(name, bytes):
+        name = name.decode("ascii", errors="ignore")
+    try:
+        return codecs.lookup(name).name
+    except LookupError:
+        return None
+
+
+def detect_charset(content: bytes, content_type: str | None = None) -> str:
+    if content_type:
+        match = HEADER_CHARSET.search(content_type)
+        charset = _known_charset(match.group(1) if match else None)
+        if charset:
+            return charset
+
+    for bom, charset in BOMS:
+        if content.startswith(bom):
+            return charset
+
+    match = META_CHARSET.search(content[:4096])
+    return _known_charset(match.group(1) if match else None) or "utf-8"
+
+
+def decode_html(content: bytes, content_type: str | None = None) -> str:
+    charset = detect_charset(content, content_type)
+    for encoding in dict.fromkeys((charset, "cp1252")):
+        try:
+            text = content.decode(encoding)
+            break
+        except UnicodeDecodeError:
+            continue
+    else:
+        text = content.decode(charset, errors="replace")
+    return text.removeprefix("\ufeff")
+
+
+def _content_root(root: etree._Element, main_content_only: bool) -> etree._Element:
+    if not main_content_only:
+        return root
+    for xpath in MAIN_CONTENT_XPATHS:
+        candidates = root.xpath(xpath)
+        if candidates:
+            return candidates[0]
+    return root
+
+
+def _iter_text(root: etree._Element) -> typing.Iterator[str]:
+    walker = etree.iterwalk(root, events=("start", "end"))
+    skipping: etree._Element | None = None
+    for event, element in walker:
+        tag = element.tag if isinstance(element.tag, str) else None
+        if event == "start":
+            if tag is None or tag in DROPPED_TAGS:
+                walker.skip_subtree()
+                skipping = element
+                continue
+            if tag in BLOCK_TAGS:
+                yield "\n"
+            if element.text:
+                yield element.text
+            continue
+
+        if element is skipping:
+            skipping = None
+        elif tag in BLOCK_TAGS:
+            yield "\n"
+        elif tag in CELL_TAGS:
+            yield " "
+        if element is not root and element.tail:
+            yield element.tail
+
+
+def read_html_text(
+    payload: Payload, content_type: str | None = None, main_content_only: bool = False
+) -> str:
+    if not isinstance(payload, (bytes, bytearray)):
+        with open(payload, "rb") as f:
+            payload = f.read()
+    if not payload.strip():
+        return ""
+
+    # Decoded here rather than by libxml2, which rejects bytes that are invalid in the given
+    # encoding; the text is handed back as UTF-8, overriding any charset the page declares.
+    payload = decode_html(bytes(payload), content_type).encode("utf-8")
+    parser = etree.HTMLParser(
+        encoding="utf-8",
+        remove_comments=True,
+        remove_pis=True,
+        no_network=True,
+        huge_tree=True,
+    )
+    root = etree.fromstring(payload, parser)
+    if root is None:
+        return ""
+
+    text = HORIZONTAL_WHITESPACE.sub(" ", "".join(_iter_text(_content_root(root, main_content_only))))
+    return "\n".join(line.strip() for line in text.splitlines() if line.strip())
@@ -0,0 +1,135 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from loguru import logger
+
+from src.config.manager import settings
+from src.repository.crud.document import DocumentCRUDRepository
+from src.repository.database import async_db
+from src.utilities.extraction.executor import StageTimer, extraction_executor
+from src.utilities.extraction.options import ExtractionOptions
+from src.utilities.extraction.pipeline import ExtractionPipeline, extraction_pipeline
+
+
+async def process_document(document_id: int, pipeline: ExtractionPipeline = extraction_pipeline) -> None:
+    """
+    Claims a document, extracts it and records the outcome. Claiming is atomic, so a document
+    that is queued twice is still only extracted once; a job that raises marks the document
+    failed, and one whose worker died is claimed again once its lease runs out.
+    """
+    async with async_db.async_session_factory() as session:
+        repository = DocumentCRUDRepository(async_session=session)
+        claimed = await repository.claim(document_id)
+        if claimed is None:
+            return
+
+        timer = StageTimer()
+        try:
+            outcome = await pipeline.extract_item(
+                claimed.file_path, timer=timer, options=ExtractionOptions.from_dict(claimed.extraction_options)
+            )
+            with timer.stage("persist"):
+                await repository.finish(
+                    document_id,
+                    extracted_text=outcome.extracted_text,
+                    content_sha256=outcome.sha256,
+                    file_format=outcome.file_format,
+                    error_message=outcome.error,
+                    is_partial=outcome.partial,
+                )
+        except Exception as e:
+            logger.error(f"Extraction job {document_id} crashed | {e}")
+            await session.rollback()
+            await repository.fail(document_id, f"Extraction failed: {e}")
+            return
+        logger.info(f"Extraction job {document_id} finished | {timer.summary()}")
+
+
+def _publish_to_celery(document_ids: list[int]) -> None:
+    from src.utilities.extraction.celery_app import extract_document_task
+
+    for document_id in document_ids:
+        extract_document_task.delay(document_id)
+
+
+class ExtractionJobQueue:
+    """
+    Hands pending documents to background workers.
+
+    The `local` backend runs `workers` asyncio tasks in this process and re-queues rows left
+    pending by a previous run on startup. The `celery` backend only publishes document ids;
+    see `src.utilities.extraction.celery_app` for the worker side. With either backend, rows
+    stuck pending or in_progress for longer than `lease_seconds` are re-submitted periodically.
+    """
+
+    def __init__(
+        self,
+        backend: str = settings.EXTRACTION_JOB_BACKEND,
+        workers: int = settings.EXTRACTION_JOB_WORKERS,
+        lease_seconds: float = settings.EXTRACTION_JOB_LEASE_SECONDS,
+    ):
+        self.backend = backend
+        self.workers = max(1, workers)
+        self.lease_seconds = lease_seconds
+        self._queue: asyncio.Queue[int] | None = None
+        self._tasks: list[asyncio.Task] = []
+
+    async def start(self) -> None:
+        if self.backend == "local":
+            self._queue = asyncio.Queue()
+            self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+            # The previous run's queue only lived in memory, so everything still pending is re-queued.
+            await self.recover(pending_before=datetime.utcnow())
+        self._tasks.append(asyncio.create_task(self._recover_periodically()))
+        logger.info(f"Extraction Job Queue --- Started with {self.backend} backend and {self.workers} local workers")
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+
+    async def recover(self, pending_before: datetime | None = None) -> None:
+        stale_before = datetime.utcnow() - timedelta(seconds=self.lease_seconds)
+        async with async_db.async_session_factory() as session:
+            document_ids = await DocumentCRUDRepository(async_session=session).find_recoverable_ids(
+                pending_before=pending_before or stale_before, claimed_before=stale_before
+            )
+        if document_ids:
+            logger.info(f"Extraction Job Queue --- Re-queueing {len(document_ids)} pending or stale documents")
+        await self.submit(document_ids)
+
+    async def _recover_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.lease_seconds / 2)
+            try:
+                await self.recover()
+            except Exception as e:
+                logger.error(f"Extraction job recovery failed | {e}")
+
+    async def submit(self, document_ids: list[int]) -> None:
+        if not document_ids:
+            return
+        if self.backend == "celery":
+            # Publishing talks to the broker synchronously.
+            await extraction_executor.run_io("publish", _publish_to_celery, document_ids)
+            return
+
+        if self._queue is None:
+            raise RuntimeError("Extraction job queue has not been started.")
+        for document_id in document_ids:
+            self._queue.put_nowait(document_id)
+
+    async def _work(self) -> None:
+        while True:
+            document_id = await self._queue.get()
+            try:
+                await process_document(document_id)
+            except Exception as e:
+                logger.error(f"Extraction job {document_id} crashed | {e}")
+            finally:
+                self._queue.task_done()
+
+
+extraction_job_queue: ExtractionJobQueue = ExtractionJobQueue()
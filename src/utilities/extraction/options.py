@@ -0,0 +1,99 @@
+import dataclasses
+import re
+import time
+
+DOCUMENT_FORMATS = ("pdf", "docx", "doc")
+# `standard` is PyMuPDF's default text extraction; `fast` and `fidelity` only apply to PDFs.
+EXTRACTION_MODES = ("standard", "fast", "fidelity")
+PAGE_RANGE = re.compile(r"^\s*(\d+)\s*(?:(-)\s*(\d*)\s*)?$")
+
+# A parsed page selection: 0-based (start, stop) pairs, stop exclusive, None for "to the end".
+PageRanges = tuple[tuple[int, int | None], ...]
+
+
+def parse_page_ranges(spec: str) -> PageRanges:
+    """
+    Parses a 1-based page selection such as "1-5,8,10-" into 0-based ranges.
+    """
+    ranges = []
+    for part in spec.split(","):
+        match = PAGE_RANGE.match(part)
+        if not match:
+            raise ValueError(f"Invalid page range: {part.strip()!r}")
+        first = int(match.group(1))
+        last = int(match.group(3)) if match.group(3) else (None if match.group(2) else first)
+        if first < 1 or (last is not None and last < first):
+            raise ValueError(f"Invalid page range: {part.strip()!r}")
+        ranges.append((first - 1, last))
+    return tuple(ranges)
+
+
+@dataclasses.dataclass(frozen=True)
+class ExtractionOptions:
+    """
+    Per-request settings passed down to the extractors. Any option that changes the extracted
+    text must show up in `cache_variant`, so differently extracted texts never share a cache entry.
+
+    `pages`, `max_chars` and `time_budget_ms` only cut the text short: results they shorten are
+    flagged as partial and not cached, and cached full texts are trimmed to them instead.
+    """
+
+    main_content_only: bool = False
+    extraction_mode: str = "standard"
+    pages: str | None = None
+    max_chars: int | None = None
+    time_budget_ms: int | None = None
+    # Wall-clock time after which extractors stop; set from `time_budget_ms` when extraction starts.
+    deadline: float | None = dataclasses.field(default=None, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.extraction_mode not in EXTRACTION_MODES:
+            raise ValueError(f"extraction_mode must be one of {', '.join(EXTRACTION_MODES)}.")
+        if self.pages is not None:
+            parse_page_ranges(self.pages)
+        if self.max_chars is not None and self.max_chars < 0:
+            raise ValueError("max_chars must not be negative.")
+        if self.time_budget_ms is not None and self.time_budget_ms <= 0:
+            raise ValueError("time_budget_ms must be positive.")
+
+    @property
+    def limits_output(self) -> bool:
+        return self.pages is not None or self.max_chars is not None or self.time_budget_ms is not None
+
+    @property
+    def page_ranges(self) -> PageRanges:
+        return parse_page_ranges(self.pages) if self.pages is not None else ((0, None),)
+
+    def selects_page(self, page: int) -> bool:
+        return any(start <= page and (stop is None or page < stop) for start, stop in self.page_ranges)
+
+    def past_last_page(self, page: int) -> bool:
+        stops = [stop for _, stop in self.page_ranges]
+        return None not in stops and page >= max(stops)
+
+    def page_numbers(self, page_count: int) -> list[int]:
+        return [page for page in range(page_count) if self.selects_page(page)]
+
+    def with_deadline(self) -> "ExtractionOptions":
+        if self.time_budget_ms is None or self.deadline is not None:
+            return self
+        return dataclasses.replace(self, deadline=time.time() + self.time_budget_ms / 1000)
+
+    def cache_variant(self, file_format: str) -> str:
+        variants = []
+        if self.main_content_only and file_format not in DOCUMENT_FORMATS:
+            variants.append("main")
+        if self.extraction_mode != "standard" and file_format == "pdf":
+            variants.append(self.extraction_mode)
+        return "+".join(variants)
+
+    def to_dict(self) -> dict:
+        values = dataclasses.asdict(self)
+        values.pop("deadline")
+        return values
+
+    @classmethod
+    def from_dict(cls, values: dict | None) -> "ExtractionOptions":
+        # Unknown keys are ignored so rows written by other versions can still be processed.
+        fields = {field.name for field in dataclasses.fields(cls)} - {"deadline"}
+        return cls(**{key: value for key, value in (values or {}).items() if key in fields})
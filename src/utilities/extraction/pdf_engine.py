@@ -0,0 +1,257 @@
+import asyncio
+import os
+import tempfile
+import time
+
+import fitz
+
+from src.config.manager import settings
+from src.utilities.extraction.executor import ExtractionExecutor, StageTimer, extraction_executor
+from src.utilities.extraction.excerpt import PAGE_SEPARATOR, ExtractedText
+from src.utilities.extraction.options import ExtractionOptions
+from src.utilities.extraction.source import Payload
+
+
+def open_pdf(payload: Payload) -> fitz.Document:
+    if isinstance(payload, (bytes, bytearray)):
+        return fitz.open(stream=payload, filetype="pdf")
+    return fitz.open(payload)
+
+
+# `fast`: no ligature/whitespace preservation, no ActualText handling, and annotations are not run at all.
+FAST_TEXT_FLAGS = fitz.TEXT_MEDIABOX_CLIP | fitz.TEXT_IGNORE_ACTUALTEXT
+# Lines wider than this share of the page span several columns and end a column section.
+SPANNING_LINE_WIDTH = 0.6
+
+# (x0, y0, x1, y1, text)
+TextLine = tuple[float, float, float, float, str]
+
+
+def _columns_in_order(lines: list[TextLine]) -> list[TextLine]:
+    """
+    Groups lines into column bands of overlapping x-ranges, read left to right and top to bottom.
+    """
+    bands: list[list[float]] = []
+    for x0, _, x1, _, _ in sorted(lines, key=lambda line: line[0]):
+        if bands and x0 <= bands[-1][1]:
+            bands[-1][1] = max(bands[-1][1], x1)
+        else:
+            bands.append([x0, x1])
+
+    def band_index(line: TextLine) -> int:
+        return next(index for index, (x0, x1) in enumerate(bands) if x0 <= line[0] <= x1)
+
+    return sorted(lines, key=lambda line: (band_index(line), line[1], line[0]))
+
+
+def _reading_order_text(page: fitz.Page) -> str:
+    """
+    Orders text lines for multi-column layouts: the page is cut into sections at lines that span
+    the columns (titles, captions, footers), and each section is read column by column.
+    MuPDF merges lines of neighbouring columns into one block, so this works on lines, not blocks.
+    """
+    lines: list[TextLine] = [
+        (*line["bbox"], "".join(span["text"] for span in line["spans"]))
+        for block in page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT)["blocks"]
+        for line in block.get("lines", ())
+    ]
+    page_width = page.rect.width or 1
+    ordered: list[TextLine] = []
+    section: list[TextLine] = []
+    for line in sorted(lines, key=lambda line: (line[1], line[0])):
+        if (line[2] - line[0]) / page_width > SPANNING_LINE_WIDTH:
+            ordered += _columns_in_order(section)
+            ordered.append(line)
+            section = []
+        else:
+            section.append(line)
+    ordered += _columns_in_order(section)
+    return "".join(f"{line[4]}\n" for line in ordered)
+
+
+def _page_text(page: fitz.Page, mode: str) -> str:
+    if mode == "fast":
+        text_page = page.get_displaylist(annots=False).get_textpage(FAST_TEXT_FLAGS)
+        return fitz.TextPage(text_page).extractText()
+    if mode == "fidelity":
+        return _reading_order_text(page)
+    return page.get_text()
+
+
+def _page_count(payload: Payload) -> int:
+    with open_pdf(payload) as doc:
+        return doc.page_count
+
+
+def _extract_pages(
+    payload: Payload,
+    page_numbers: list[int],
+    max_chars: int | None = None,
+    deadline: float | None = None,
+    mode: str = "standard",
+) -> list[str]:
+    """
+    Worker entrypoint: reopens the PDF and extracts the given pages, stopping early once
+    `max_chars` characters have been extracted or `deadline` has passed.
+    """
+    pages: list[str] = []
+    size = 0
+    with open_pdf(payload) as doc:
+        for page_number in page_numbers:
+            if (deadline is not None and time.time() > deadline) or (max_chars is not None and size >= max_chars):
+                break
+            text = _page_text(doc[page_number], mode)
+            pages.append(text)
+            size += len(text)
+    return pages
+
+
+def spill_payload(payload: bytes, temp_dir: str = settings.EXTRACTION_TEMP_DIR) -> str:
+    """
+    Writes an in-memory PDF to a temp file, so that workers reopen it instead of each receiving a
+    pickled copy. The caller removes the file.
+    """
+    os.makedirs(temp_dir, exist_ok=True)
+    fd, path = tempfile.mkstemp(prefix="extract-", suffix=".pdf", dir=temp_dir)
+    with os.fdopen(fd, "wb") as f:
+        f.write(payload)
+    return path
+
+
+def _remove(path: str | None) -> None:
+    if path is not None and os.path.exists(path):
+        os.remove(path)
+
+
+class PDFExtractionEngine:
+    """
+    Splits a PDF into page ranges and extracts them on the extraction process pool.
+
+    A PDF is given either as a path, which every worker reopens, or as in-memory bytes. In-memory
+    PDFs split into several ranges are written to a temp file first, so the bytes are copied once
+    rather than pickled to the worker of every range.
+    Only selected pages are parsed. With `max_chars` the ranges are extracted one after another,
+    so the remaining ones are skipped once enough text is in.
+    """
+
+    def __init__(
+        self,
+        executor: ExtractionExecutor = extraction_executor,
+        chunk_size: int = settings.PDF_PAGE_CHUNK_SIZE,
+    ):
+        self.executor = executor
+        self.chunk_size = max(1, chunk_size)
+
+    def split_pages(self, page_numbers: list[int]) -> list[list[int]]:
+        return [page_numbers[start:start + self.chunk_size] for start in range(0, len(page_numbers), self.chunk_size)]
+
+    @staticmethod
+    def _join(
+        chunks: list[list[str]], page_ranges: list[list[int]], page_count: int, options: ExtractionOptions
+    ) -> ExtractedText:
+        # Page ranges run in parallel stop at the deadline independently; only the pages before the
+        # first gap are kept, so every separator still falls between consecutive selected pages.
+        pages: list[str] = []
+        for chunk, page_numbers in zip(chunks, page_ranges):
+            pages += chunk
+            if len(chunk) < len(page_numbers):
+                break
+        text = PAGE_SEPARATOR.join(pages)
+        if options.max_chars is not None and len(text) > options.max_chars:
+            return ExtractedText(text[:options.max_chars], partial=True)
+        return ExtractedText(text, partial=len(pages) < page_count)
+
+    def extract(self, payload: Payload, options: ExtractionOptions = ExtractionOptions()) -> ExtractedText:
+        """
+        Extracts the text of a PDF, fanning page ranges out to the pool when there is more than one.
+        """
+        options = options.with_deadline()
+        page_count = _page_count(payload)
+        page_ranges = self.split_pages(options.page_numbers(page_count))
+
+        if len(page_ranges) <= 1 or options.max_chars is not None:
+            chunks: list[list[str]] = []
+            remaining = options.max_chars
+            for page_numbers in page_ranges:
+                chunks.append(
+                    _extract_pages(payload, page_numbers, remaining, options.deadline, options.extraction_mode)
+                )
+                if remaining is not None:
+                    remaining -= sum(len(page) for page in chunks[-1])
+                if len(chunks[-1]) < len(page_numbers) or (remaining is not None and remaining <= 0):
+                    break
+            return self._join(chunks, page_ranges, page_count, options)
+
+        spilled = spill_payload(payload) if isinstance(payload, (bytes, bytearray)) else None
+        try:
+            futures = [
+                self.executor.process_pool.submit(
+                    _extract_pages, spilled or payload, page_numbers, None, options.deadline, options.extraction_mode
+                )
+                for page_numbers in page_ranges
+            ]
+            return self._join([future.result() for future in futures], page_ranges, page_count, options)
+        finally:
+            _remove(spilled)
+
+    async def extract_async(
+        self, payload: Payload, options: ExtractionOptions = ExtractionOptions(), timer: StageTimer | None = None
+    ) -> ExtractedText:
+        """
+        Same as `extract`, but awaits the page ranges without blocking the event loop.
+        """
+        timer = timer or StageTimer()
+        options = options.with_deadline()
+        page_count = await self.executor.run_io("pdf.layout", _page_count, payload, timer=timer)
+        page_ranges = self.split_pages(options.page_numbers(page_count))
+
+        spilled = None
+        if isinstance(payload, (bytes, bytearray)) and len(page_ranges) > 1:
+            spilled = await self.executor.run_io("pdf.spill", spill_payload, payload, timer=timer)
+        try:
+            with timer.stage("parse.pdf"):
+                return await self._extract_ranges(spilled or payload, page_ranges, page_count, options)
+        finally:
+            _remove(spilled)
+
+    async def _extract_ranges(
+        self, payload: Payload, page_ranges: list[list[int]], page_count: int, options: ExtractionOptions
+    ) -> ExtractedText:
+        if options.max_chars is None:
+            chunks = await asyncio.gather(
+                *(
+                    self.executor.run_cpu(
+                        "parse.pdf.pages",
+                        _extract_pages,
+                        payload,
+                        page_numbers,
+                        None,
+                        options.deadline,
+                        options.extraction_mode,
+                    )
+                    for page_numbers in page_ranges
+                )
+            )
+            return self._join(list(chunks), page_ranges, page_count, options)
+
+        chunks = []
+        remaining = options.max_chars
+        for page_numbers in page_ranges:
+            chunks.append(
+                await self.executor.run_cpu(
+                    "parse.pdf.pages",
+                    _extract_pages,
+                    payload,
+                    page_numbers,
+                    remaining,
+                    options.deadline,
+                    options.extraction_mode,
+                )
+            )
+            remaining -= sum(len(page) for page in chunks[-1])
+            if len(chunks[-1]) < len(page_numbers) or remaining <= 0:
+                break
+        return self._join(chunks, page_ranges, page_count, options)
+
+
+pdf_engine: PDFExtractionEngine = PDFExtractionEngine()
@@ -0,0 +1,253 @@
+import asyncio
+import contextlib
+import dataclasses
+import functools
+import os
+import time
+import typing
+from urllib.parse import urlparse
+
+from fastapi import HTTPException
+from loguru import logger
+
+from src.config.manager import settings
+from src.utilities.core.metrics import record_extraction
+from src.utilities.extraction.cache import ExtractionCache, extraction_cache, extractor_version, file_sha256
+from src.utilities.extraction.downloader import HTTPDownloader, http_downloader
+from src.utilities.extraction.excerpt import PAGE_SEPARATOR, excerpt
+from src.utilities.extraction.executor import StageTimer, extraction_executor
+from src.utilities.extraction.formats import detect_format
+from src.utilities.extraction.options import ExtractionOptions
+from src.utilities.extraction.registry import ExtractorRegistry, extractor_registry
+from src.utilities.extraction.source import DocumentSource
+from src.utilities.extraction.upload import UploadedDocument
+
+
+@dataclasses.dataclass
+class ExtractionOutcome:
+    source: str
+    file_path: str | None = None
+    file_format: str | None = None
+    sha256: str | None = None
+    extracted_text: str | None = None
+    partial: bool = False
+    cache_hit: bool = False
+    error: str | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+class ExtractionPipeline:
+    """
+    Extracts a batch of paths/URLs concurrently while preserving input order.
+
+    Every item needs a slot from the per-request semaphore and from the process-wide
+    semaphore, so one large batch cannot starve the other requests on the worker.
+    """
+
+    def __init__(
+        self,
+        downloader: HTTPDownloader = http_downloader,
+        cache: ExtractionCache = extraction_cache,
+        registry: ExtractorRegistry = extractor_registry,
+        global_concurrency: int = settings.EXTRACTION_GLOBAL_CONCURRENCY,
+    ):
+        self.downloader = downloader
+        self.cache = cache
+        self.registry = registry
+        self.global_concurrency = max(1, global_concurrency)
+        self._global_slots: asyncio.Semaphore | None = None
+
+    @property
+    def global_slots(self) -> asyncio.Semaphore:
+        if self._global_slots is None:
+            self._global_slots = asyncio.Semaphore(self.global_concurrency)
+        return self._global_slots
+
+    async def extract_one(
+        self, file_path_or_url: str, timer: StageTimer, options: ExtractionOptions = ExtractionOptions()
+    ) -> ExtractionOutcome:
+        outcome = ExtractionOutcome(source=file_path_or_url, file_path=file_path_or_url)
+
+        if urlparse(file_path_or_url).scheme in ["http", "https", "ftp"]:
+            downloaded = await self.downloader.download(file_path_or_url, timer=timer)
+            source = downloaded.source
+            outcome.sha256 = downloaded.sha256
+        elif os.path.exists(file_path_or_url):
+            source = DocumentSource.from_path(file_path_or_url)
+            outcome.sha256 = await extraction_executor.run_io("hash", file_sha256, file_path_or_url, timer=timer)
+        else:
+            raise HTTPException(status_code=400, detail="Invalid file path or URL.")
+
+        with source:
+            return await self._extract_source(source, outcome, timer, options)
+
+    async def extract_upload(
+        self, upload: UploadedDocument, timer: StageTimer, options: ExtractionOptions = ExtractionOptions()
+    ) -> ExtractionOutcome:
+        outcome = ExtractionOutcome(source=upload.filename, file_path=upload.filename, sha256=upload.sha256)
+        with upload.source:
+            return await self._extract_source(upload.source, outcome, timer, options)
+
+    async def _extract_source(
+        self, source: DocumentSource, outcome: ExtractionOutcome, timer: StageTimer, options: ExtractionOptions
+    ) -> ExtractionOutcome:
+        outcome.file_format = await extraction_executor.run_io("detect", detect_format, source, timer=timer)
+        extractor = self.registry.get(outcome.file_format)
+
+        version = extractor_version(outcome.file_format, options)
+        with timer.stage("cache.lookup"):
+            cached_text = await self.cache.get(outcome.sha256, version)
+        if cached_text is not None:
+            # The cache only holds full texts; trim them to the requested pages/characters.
+            result = excerpt([cached_text], options, paged=extractor.paged) if options.limits_output else None
+            outcome.extracted_text = result.text if result else cached_text
+            outcome.partial = result.partial if result else False
+            outcome.cache_hit = True
+            return outcome
+
+        logger.debug(
+            f"Extracting {outcome.source} as {extractor.file_format} | "
+            f"estimated {extractor.estimate_cost_ms(source.size):.1f}ms"
+        )
+        started = time.perf_counter()
+        result = await self.registry.extract_async(extractor.file_format, source, options, timer)
+        record_extraction(
+            extractor.file_format,
+            version,
+            source.size,
+            len(result.text),
+            result.text.count(PAGE_SEPARATOR) + 1 if extractor.paged else None,
+            time.perf_counter() - started,
+        )
+        outcome.extracted_text, outcome.partial = result.text, result.partial
+        if outcome.partial:
+            return outcome
+
+        with timer.stage("cache.store"):
+            await self.cache.put(outcome.sha256, version, outcome.file_format, outcome.extracted_text)
+        return outcome
+
+    async def _extract_guarded(
+        self,
+        label: str,
+        extract: typing.Callable[[], typing.Awaitable[ExtractionOutcome]],
+        request_slots: typing.AsyncContextManager,
+    ) -> ExtractionOutcome:
+        async with request_slots, self.global_slots:
+            try:
+                return await extract()
+            except HTTPException as e:
+                logger.warning(f"Extraction failed for {label} | {e.detail}")
+                return ExtractionOutcome(source=label, error=str(e.detail))
+            except Exception as e:
+                logger.error(f"Extraction failed for {label} | {e}")
+                return ExtractionOutcome(source=label, error=str(e))
+
+    async def extract_item(
+        self,
+        file_path_or_url: str,
+        timer: StageTimer | None = None,
+        options: ExtractionOptions = ExtractionOptions(),
+    ) -> ExtractionOutcome:
+        """
+        Extracts a single path/URL under the global limit, reporting failures in the outcome.
+        """
+        timer = timer or StageTimer()
+        return await self._extract_guarded(
+            file_path_or_url,
+            functools.partial(self.extract_one, file_path_or_url, timer, options),
+            contextlib.nullcontext(),
+        )
+
+    async def extract_many(
+        self,
+        file_paths_or_urls: typing.Sequence[str],
+        timer: StageTimer | None = None,
+        concurrency: int = settings.EXTRACTION_REQUEST_CONCURRENCY,
+        options: ExtractionOptions = ExtractionOptions(),
+    ) -> list[ExtractionOutcome]:
+        """
+        Returns one outcome per input, in input order; failures are reported per item.
+        """
+        timer = timer or StageTimer()
+        request_slots = asyncio.Semaphore(max(1, concurrency))
+        return list(
+            await asyncio.gather(
+                *(
+                    self._extract_guarded(
+                        item, functools.partial(self.extract_one, item, timer, options), request_slots
+                    )
+                    for item in file_paths_or_urls
+                )
+            )
+        )
+
+    async def iter_many(
+        self,
+        file_paths_or_urls: typing.Sequence[str],
+        timer: StageTimer | None = None,
+        concurrency: int = settings.EXTRACTION_REQUEST_CONCURRENCY,
+        options: ExtractionOptions = ExtractionOptions(),
+    ) -> typing.AsyncIterator[tuple[int, ExtractionOutcome]]:
+        """
+        Yields `(input index, outcome)` pairs in completion order, so results can be streamed
+        without holding the whole batch. Closing the iterator cancels the remaining items.
+        """
+        timer = timer or StageTimer()
+        request_slots = asyncio.Semaphore(max(1, concurrency))
+
+        async def extract_indexed(index: int, item: str) -> tuple[int, ExtractionOutcome]:
+            return index, await self._extract_guarded(
+                item, functools.partial(self.extract_one, item, timer, options), request_slots
+            )
+
+        tasks = [asyncio.create_task(extract_indexed(index, item)) for index, item in enumerate(file_paths_or_urls)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def extract_uploads(
+        self,
+        uploads: typing.AsyncIterator[UploadedDocument],
+        timer: StageTimer | None = None,
+        concurrency: int = settings.EXTRACTION_REQUEST_CONCURRENCY,
+        options: ExtractionOptions = ExtractionOptions(),
+    ) -> list[ExtractionOutcome]:
+        """
+        Starts extracting each uploaded file as soon as it has been received, while later files are
+        still arriving. Returns one outcome per file, in upload order.
+        """
+        timer = timer or StageTimer()
+        request_slots = asyncio.Semaphore(max(1, concurrency))
+        received: list[UploadedDocument] = []
+        tasks: list[asyncio.Task] = []
+        try:
+            async for upload in uploads:
+                received.append(upload)
+                tasks.append(
+                    asyncio.create_task(
+                        self._extract_guarded(
+                            upload.filename,
+                            functools.partial(self.extract_upload, upload, timer, options),
+                            request_slots,
+                        )
+                    )
+                )
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for upload in received:
+                upload.source.close()
+            raise
+        return list(await asyncio.gather(*tasks))
+
+
+extraction_pipeline: ExtractionPipeline = ExtractionPipeline()
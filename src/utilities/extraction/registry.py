@@ -0,0 +1,158 @@
+import dataclasses
+import typing
+
+from fastapi import HTTPException
+
+from src.config.manager import settings
+from src.utilities.extraction.doc_reader import iter_doc_text
+from src.utilities.extraction.docx_reader import iter_docx_lines
+from src.utilities.extraction.excerpt import ExtractedText, excerpt
+from src.utilities.extraction.executor import ExtractionExecutor, StageTimer, extraction_executor
+from src.utilities.extraction.html_reader import read_html_text
+from src.utilities.extraction.options import ExtractionOptions
+from src.utilities.extraction.pdf_engine import pdf_engine
+from src.utilities.extraction.source import DocumentSource, Payload
+
+# (payload, content type, options) -> text. Must be a module-level function so it can run on the process pool.
+ReadFunction = typing.Callable[[Payload, typing.Optional[str], ExtractionOptions], ExtractedText]
+# (payload, options, timer=...) -> text, for extractors that schedule their own work.
+AsyncReadFunction = typing.Callable[..., typing.Awaitable[ExtractedText]]
+
+
+@dataclasses.dataclass(frozen=True)
+class Extractor:
+    """
+    How one format is extracted.
+
+    `cost_ms_per_mb` is a rough parse cost, used to run tiny documents on the thread pool instead
+    of paying the process pool round trip. `supports_streaming` marks extractors that read their
+    payload incrementally from a file; large in-memory documents are spilled to disk for them
+    instead of being pickled whole to the process pool, while buffered ones get the bytes.
+    `paged` extractors mark page boundaries with `PAGE_SEPARATOR`, so page selections apply to
+    them. `read_async` overrides the default of running `read` on the executor, for formats that
+    schedule their own work.
+    """
+
+    file_format: str
+    read: ReadFunction
+    cost_ms_per_mb: float
+    supports_streaming: bool = False
+    paged: bool = False
+    read_async: AsyncReadFunction | None = None
+
+    def estimate_cost_ms(self, size: int) -> float:
+        return self.cost_ms_per_mb * size / (1024 * 1024)
+
+    def error(self, e: Exception) -> HTTPException:
+        return HTTPException(status_code=500, detail=f"Error extracting {self.file_format.upper()} text: {e}")
+
+
+class ExtractorRegistry:
+    """
+    Maps detected formats to their extractors; new formats are added with `register`
+    instead of editing the dispatch code.
+    """
+
+    def __init__(
+        self,
+        executor: ExtractionExecutor = extraction_executor,
+        inline_cost_ms: float = settings.EXTRACTION_INLINE_COST_MS,
+        stream_spill_bytes: int = settings.EXTRACTION_STREAM_SPILL_BYTES,
+    ):
+        self.executor = executor
+        self.inline_cost_ms = inline_cost_ms
+        self.stream_spill_bytes = stream_spill_bytes
+        self._extractors: dict[str, Extractor] = {}
+
+    def register(self, extractor: Extractor) -> Extractor:
+        self._extractors[extractor.file_format] = extractor
+        return extractor
+
+    @property
+    def formats(self) -> list[str]:
+        return list(self._extractors)
+
+    def get(self, file_format: str | None) -> Extractor:
+        extractor = self._extractors.get(file_format) if file_format else None
+        if extractor is None:
+            raise HTTPException(status_code=415, detail="Unsupported file format.")
+        return extractor
+
+    def extract(
+        self,
+        file_format: str | None,
+        payload: Payload,
+        content_type: str | None = None,
+        options: ExtractionOptions = ExtractionOptions(),
+    ) -> ExtractedText:
+        extractor = self.get(file_format)
+        try:
+            return extractor.read(payload, content_type, options.with_deadline())
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise extractor.error(e)
+
+    async def extract_async(
+        self,
+        file_format: str | None,
+        source: DocumentSource,
+        options: ExtractionOptions = ExtractionOptions(),
+        timer: StageTimer | None = None,
+    ) -> ExtractedText:
+        extractor = self.get(file_format)
+        options = options.with_deadline()
+        try:
+            if extractor.read_async is not None:
+                return await extractor.read_async(source.payload, options, timer=timer)
+
+            if extractor.estimate_cost_ms(source.size) < self.inline_cost_ms:
+                run = self.executor.run_io
+            else:
+                run = self.executor.run_cpu
+                if extractor.supports_streaming and source.in_memory and source.size >= self.stream_spill_bytes:
+                    await self.executor.run_io("spill", source.spill, timer=timer)
+            return await run(
+                f"parse.{extractor.file_format}",
+                extractor.read,
+                source.payload,
+                source.content_type,
+                options,
+                timer=timer,
+            )
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise extractor.error(e)
+
+
+def _read_pdf(payload: Payload, content_type: str | None, options: ExtractionOptions) -> ExtractedText:
+    return pdf_engine.extract(payload, options)
+
+
+def _read_docx(payload: Payload, content_type: str | None, options: ExtractionOptions) -> ExtractedText:
+    return excerpt(iter_docx_lines(payload), options)
+
+
+def _read_doc(payload: Payload, content_type: str | None, options: ExtractionOptions) -> ExtractedText:
+    return excerpt(iter_doc_text(payload), options, separator="", paged=False)
+
+
+def _read_html(payload: Payload, content_type: str | None, options: ExtractionOptions) -> ExtractedText:
+    return excerpt([read_html_text(payload, content_type, options.main_content_only)], options, paged=False)
+
+
+extractor_registry: ExtractorRegistry = ExtractorRegistry()
+extractor_registry.register(
+    Extractor(
+        "pdf",
+        _read_pdf,
+        cost_ms_per_mb=40.0,
+        supports_streaming=True,
+        paged=True,
+        read_async=pdf_engine.extract_async,
+    )
+)
+extractor_registry.register(Extractor("docx", _read_docx, cost_ms_per_mb=30.0, supports_streaming=True, paged=True))
+extractor_registry.register(Extractor("doc", _read_doc, cost_ms_per_mb=10.0, supports_streaming=True))
+extractor_registry.register(Extractor("html", _read_html, cost_ms_per_mb=110.0))
@@ -0,0 +1,117 @@
+import os
+import tempfile
+import typing
+
+from src.config.manager import settings
+
+# What extractor workers receive: the document bytes, or a path when the document lives on disk.
+Payload = typing.Union[bytes, str]
+
+
+class DocumentSource:
+    """
+    The raw bytes of one document, kept in memory up to `spool_max_bytes` and spilled to a
+    uniquely named temp file above it. Spilled files are owned by the source and removed by `close`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        content_type: str | None = None,
+        spool_max_bytes: int = settings.EXTRACTION_SPOOL_MAX_BYTES,
+        temp_dir: str = settings.EXTRACTION_TEMP_DIR,
+    ):
+        self.name = name
+        self.content_type = content_type
+        self.spool_max_bytes = spool_max_bytes
+        self.temp_dir = temp_dir
+        self.size = 0
+        self._buffer: bytearray | bytes | None = bytearray()
+        self._path: str | None = None
+        self._file: typing.BinaryIO | None = None
+        self._owns_path = False
+
+    @classmethod
+    def from_path(cls, file_path: str) -> "DocumentSource":
+        source = cls(name=os.path.basename(file_path))
+        source._buffer = None
+        source._path = file_path
+        source.size = os.path.getsize(file_path)
+        return source
+
+    @classmethod
+    def from_bytes(cls, name: str, data: bytes) -> "DocumentSource":
+        source = cls(name=name)
+        if len(data) <= source.spool_max_bytes:
+            source._buffer = data
+            source.size = len(data)
+            return source
+        source.write(data)
+        source.finish()
+        return source
+
+    @property
+    def extension(self) -> str:
+        return os.path.splitext(self.name)[1].lstrip(".").lower()
+
+    @property
+    def in_memory(self) -> bool:
+        return self._path is None
+
+    @property
+    def payload(self) -> Payload:
+        return self._buffer if self.in_memory else self._path
+
+    def _spill(self) -> None:
+        os.makedirs(self.temp_dir, exist_ok=True)
+        fd, self._path = tempfile.mkstemp(
+            prefix="extract-", suffix=f".{self.extension}" if self.extension else "", dir=self.temp_dir
+        )
+        self._owns_path = True
+        self._file = os.fdopen(fd, "wb")
+        self._file.write(self._buffer)
+        self._buffer = None
+
+    def spill(self) -> None:
+        """
+        Moves an in-memory document to its temp file, so workers are handed the path.
+        """
+        if self.in_memory:
+            self._spill()
+            self.finish()
+
+    def write(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self._buffer is not None:
+            self._buffer += chunk
+            if len(self._buffer) > self.spool_max_bytes:
+                self._spill()
+        else:
+            self._file.write(chunk)
+
+    def finish(self) -> None:
+        # Freeze the in-memory buffer so `payload` can hand it out without copying.
+        if isinstance(self._buffer, bytearray):
+            self._buffer = bytes(self._buffer)
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def read_head(self, size: int) -> bytes:
+        if self.in_memory:
+            return bytes(memoryview(self._buffer)[:size])
+        with open(self._path, "rb") as f:
+            return f.read(size)
+
+    def close(self) -> None:
+        self.finish()
+        if self._owns_path and self._path and os.path.exists(self._path):
+            os.remove(self._path)
+        self._buffer = None
+        self._owns_path = False
+
+    def __enter__(self) -> "DocumentSource":
+        return self
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        self.close()
@@ -0,0 +1,33 @@
+import typing
+
+import orjson
+
+from src.config.manager import settings
+from src.utilities.extraction.excerpt import PAGE_SEPARATOR
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+SSE_MEDIA_TYPE = "text/event-stream"
+
+
+def iter_text_chunks(text: str, max_chars: int = settings.STREAM_CHUNK_MAX_CHARS) -> typing.Iterator[str]:
+    """
+    Splits extracted text into pages, and pages longer than `max_chars` into slices.
+    Text without page separators is treated as a single page.
+    """
+    max_chars = max(1, max_chars)
+    for page in text.split(PAGE_SEPARATOR):
+        if len(page) <= max_chars:
+            yield page
+            continue
+        for start in range(0, len(page), max_chars):
+            yield page[start:start + max_chars]
+
+
+def encode_record(record: dict, sse: bool = False) -> bytes:
+    """
+    Serializes one streamed record as an NDJSON line, or as a server-sent event named after its `type`.
+    """
+    data = orjson.dumps(record)
+    if sse:
+        return b"event: " + record["type"].encode() + b"\ndata: " + data + b"\n\n"
+    return data + b"\n"
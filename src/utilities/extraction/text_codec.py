@@ -0,0 +1,78 @@
+"""
+Compression of stored extracted texts.
+
+Texts of at least `TEXT_COMPRESSION_MIN_BYTES` are stored compressed in `documents.compressed_text`
+with the codec recorded in `documents.text_codec`; shorter ones, and all texts while compression is
+off, stay plain in `documents.extracted_text`, so rows written either way can always be read back.
+Page chunks in `document_pages` follow the same rule, each with its own `codec`.
+"""
+import typing
+import zlib
+
+import zstandard
+
+from src.config.manager import settings
+
+TEXT_CODECS = ("none", "zlib", "zstd")
+
+
+def compress_bytes(data: bytes, codec: str, level: int = settings.TEXT_COMPRESSION_LEVEL) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=level).compress(data)
+    if codec == "zlib":
+        return zlib.compress(data, level)
+    raise ValueError(f"Unknown text codec: {codec!r}")
+
+
+def decompress_bytes(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdDecompressor().decompress(data)
+    if codec == "zlib":
+        return zlib.decompress(data)
+    raise ValueError(f"Unknown text codec: {codec!r}")
+
+
+def compress_text(text: str, codec: str, level: int = settings.TEXT_COMPRESSION_LEVEL) -> bytes:
+    return compress_bytes(text.encode("utf-8"), codec, level)
+
+
+def decompress_text(data: bytes, codec: str) -> str:
+    return decompress_bytes(data, codec).decode("utf-8")
+
+
+def encode_text(
+    text: typing.Optional[str],
+    codec: str = settings.TEXT_COMPRESSION,
+    min_bytes: int = settings.TEXT_COMPRESSION_MIN_BYTES,
+) -> dict[str, typing.Any]:
+    """
+    Returns the `Document` column values storing `text`.
+    """
+    if text is None or codec == "none" or len(text) < min_bytes:
+        return {"extracted_text": text, "compressed_text": None, "text_codec": None}
+    return {"extracted_text": None, "compressed_text": compress_text(text, codec), "text_codec": codec}
+
+
+def encode_chunk(
+    data: bytes,
+    codec: str = settings.TEXT_COMPRESSION,
+    min_bytes: int = settings.TEXT_COMPRESSION_MIN_BYTES,
+) -> tuple[bytes, typing.Optional[str]]:
+    """
+    Returns the stored form of a page chunk and its codec, None when it is stored as is.
+    """
+    if codec == "none" or len(data) < min_bytes:
+        return data, None
+    return compress_bytes(data, codec), codec
+
+
+def decode_text(
+    extracted_text: typing.Optional[str], compressed_text: typing.Optional[bytes], codec: typing.Optional[str]
+) -> typing.Optional[str]:
+    if compressed_text is None:
+        return extracted_text
+    return decompress_text(compressed_text, codec or "")
+
+
+if settings.TEXT_COMPRESSION not in TEXT_CODECS:
+    raise ValueError(f"TEXT_COMPRESSION must be one of {', '.join(TEXT_CODECS)}.")
@@ -0,0 +1,141 @@
+import dataclasses
+import hashlib
+import os
+import typing
+
+from fastapi import HTTPException, Request, status
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+from src.config.manager import settings
+from src.utilities.extraction.source import DocumentSource
+
+
+@dataclasses.dataclass
+class UploadedDocument:
+    filename: str
+    source: DocumentSource
+    sha256: str
+    size: int
+
+
+class MultipartUploadReceiver:
+    """
+    Feeds a raw multipart body to python-multipart and writes every file part straight into a
+    `DocumentSource`, hashing and size-limiting it as the chunks arrive. Plain form fields are ignored.
+    """
+
+    def __init__(self, boundary: bytes, max_bytes: int = settings.UPLOAD_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.completed: list[UploadedDocument] = []
+        self._headers: dict[bytes, bytes] = {}
+        self._header_field = b""
+        self._header_value = b""
+        self._filename: str | None = None
+        self._source: DocumentSource | None = None
+        self._digest = hashlib.sha256()
+        self._size = 0
+        self.parser = MultipartParser(
+            boundary,
+            callbacks={
+                "on_part_begin": self._on_part_begin,
+                "on_header_field": self._on_header_field,
+                "on_header_value": self._on_header_value,
+                "on_header_end": self._on_header_end,
+                "on_headers_finished": self._on_headers_finished,
+                "on_part_data": self._on_part_data,
+                "on_part_end": self._on_part_end,
+            },
+        )
+
+    def _on_part_begin(self) -> None:
+        self._headers = {}
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        filename = options.get(b"filename")
+        if filename is None:
+            self._source = None
+            return
+
+        self._filename = os.path.basename(filename.decode("utf-8", errors="replace"))
+        content_type = self._headers.get(b"content-type")
+        self._source = DocumentSource(
+            name=self._filename, content_type=content_type.decode("latin-1") if content_type else None
+        )
+        self._digest = hashlib.sha256()
+        self._size = 0
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._source is None:
+            return
+
+        chunk = data[start:end]
+        self._size += len(chunk)
+        if self._size > self.max_bytes:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Uploaded file {self._filename} exceeds the {self.max_bytes} byte limit.",
+            )
+        self._digest.update(chunk)
+        self._source.write(chunk)
+
+    def _on_part_end(self) -> None:
+        if self._source is None:
+            return
+
+        self._source.finish()
+        self.completed.append(
+            UploadedDocument(
+                filename=self._filename,
+                source=self._source,
+                sha256=self._digest.hexdigest(),
+                size=self._size,
+            )
+        )
+        self._source = None
+
+    def feed(self, chunk: bytes) -> list[UploadedDocument]:
+        """
+        Parses one chunk of the body and returns the files that were completed by it.
+        """
+        self.parser.write(chunk)
+        ready, self.completed = self.completed, []
+        return ready
+
+    def close(self) -> None:
+        if self._source is not None:
+            self._source.close()
+            self._source = None
+
+
+async def iter_uploaded_documents(
+    request: Request, max_bytes: int = settings.UPLOAD_MAX_BYTES
+) -> typing.AsyncIterator[UploadedDocument]:
+    """
+    Yields each uploaded file as soon as its last byte has been received.
+    """
+    content_type, params = parse_options_header(request.headers.get("Content-Type", ""))
+    if content_type != b"multipart/form-data" or b"boundary" not in params:
+        raise HTTPException(status_code=400, detail="Expected a multipart/form-data request body.")
+
+    receiver = MultipartUploadReceiver(params[b"boundary"], max_bytes=max_bytes)
+    try:
+        async for chunk in request.stream():
+            for uploaded in receiver.feed(chunk):
+                yield uploaded
+        receiver.parser.finalize()
+        for uploaded in receiver.completed:
+            yield uploaded
+    finally:
+        receiver.close()
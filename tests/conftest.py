@@ -0,0 +1,58 @@
+import socket
+from email import message_from_bytes, policy
+from email.message import EmailMessage
+
+import pytest
+from aiosmtpd.controller import Controller
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class RecordingHandler:
+    """
+    Keeps the messages an aiosmtpd server receives, and which SMTP session each arrived on.
+    """
+
+    def __init__(self):
+        self.messages: list[EmailMessage] = []
+        self.sessions: list[int] = []
+
+    async def handle_DATA(self, server, session, envelope) -> str:
+        self.messages.append(message_from_bytes(envelope.content, policy=policy.default))
+        self.sessions.append(id(session))
+        return "250 OK"
+
+
+@pytest.fixture
+def start_smtp_server():
+    """
+    Starts recording SMTP servers, on a free port unless one is given, and stops them afterwards.
+    """
+    controllers: list[Controller] = []
+
+    def start(port: int | None = None) -> Controller:
+        controller = Controller(RecordingHandler(), hostname="127.0.0.1", port=port or free_port())
+        controller.start()
+        controllers.append(controller)
+        return controller
+
+    yield start
+    for controller in controllers:
+        # Tests may stop a server themselves, which closes its loop.
+        if not controller.loop.is_closed():
+            controller.stop()
+
+
+@pytest.fixture
+def closed_port() -> int:
+    # Nothing listens on it, so connections are refused.
+    return free_port()
+
+
+@pytest.fixture
+def smtp_server(start_smtp_server) -> Controller:
+    return start_smtp_server()
@@ -0,0 +1,130 @@
+import asyncio
+import contextlib
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from src.utilities.email import outbox as outbox_module
+from src.utilities.email.outbox import EmailOutbox
+from src.utilities.email.smtp_pool import SMTPConnectionPool
+
+
+class RecordingRepository:
+    """
+    Stands in for `EmailOutboxCRUDRepository`: hands out `due` once and records the results.
+    """
+
+    def __init__(self, due: list[SimpleNamespace]):
+        self.due = due
+        self.sent: list[int] = []
+        self.failed: list[tuple[list[int], str, datetime | None]] = []
+
+    async def claim_due(self, limit: int, lease_seconds: float) -> list[SimpleNamespace]:
+        claimed, self.due = self.due[:limit], self.due[limit:]
+        return claimed
+
+    async def mark_sent(self, email_ids: list[int]) -> None:
+        self.sent.extend(email_ids)
+
+    async def mark_failed(self, email_ids: list[int], error: str, retry_at: datetime | None) -> None:
+        self.failed.append((email_ids, error, retry_at))
+
+
+def _email(email_id: int, to_email: str, kind: str = "extraction_completed", attempts: int = 1) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=email_id,
+        user_id=None,
+        to_email=to_email,
+        subject="Document Extraction Completed",
+        body=f"Update {email_id}",
+        kind=kind,
+        attempts=attempts,
+    )
+
+
+def _outbox(port: int, **kwargs) -> EmailOutbox:
+    pool = SMTPConnectionPool(
+        size=2, server="127.0.0.1", port=port, username="", password="", use_tls=False, timeout=5
+    )
+    return EmailOutbox(pool=pool, **kwargs)
+
+
+@pytest.fixture
+def repository(monkeypatch):
+    def install(due: list[SimpleNamespace]) -> RecordingRepository:
+        repository = RecordingRepository(due)
+        monkeypatch.setattr(outbox_module, "EmailOutboxCRUDRepository", lambda async_session: repository)
+        monkeypatch.setattr(
+            outbox_module, "async_db", SimpleNamespace(async_session_factory=contextlib.nullcontext)
+        )
+        return repository
+
+    return install
+
+
+def _send_due(outbox: EmailOutbox) -> int:
+    async def send_due():
+        try:
+            return await outbox.send_due()
+        finally:
+            await outbox.pool.close()
+
+    return asyncio.run(send_due())
+
+
+def test_due_emails_of_a_recipient_and_kind_are_sent_as_one_digest(smtp_server, repository):
+    recorded = repository(
+        [
+            _email(1, "a@test.com"),
+            _email(2, "b@test.com"),
+            _email(3, "a@test.com"),
+            _email(4, "a@test.com", kind="password_reset"),
+            _email(5, "a@test.com"),
+        ]
+    )
+
+    assert _send_due(_outbox(smtp_server.port)) == 5
+
+    messages = {(message["To"], message["Subject"]): message for message in smtp_server.handler.messages}
+    assert len(smtp_server.handler.messages) == 3
+    digest = messages[("a@test.com", "Document Extraction Completed (3 updates)")]
+    assert all(f"Update {email_id}" in digest.get_content() for email_id in (1, 3, 5))
+    assert ("b@test.com", "Document Extraction Completed") in messages
+    assert ("a@test.com", "Document Extraction Completed") in messages
+    assert sorted(recorded.sent) == [1, 2, 3, 4, 5]
+    assert recorded.failed == []
+
+
+def test_failed_sends_are_scheduled_for_a_retry(closed_port, repository):
+    recorded = repository([_email(1, "a@test.com"), _email(2, "a@test.com", attempts=2)])
+    outbox = _outbox(closed_port, retry_base_seconds=60, retry_max_seconds=3600, max_attempts=5)
+
+    before = datetime.utcnow()
+    assert _send_due(outbox) == 2
+
+    assert recorded.sent == []
+    [(email_ids, error, retry_at)] = recorded.failed
+    assert email_ids == [1, 2] and error
+    # The digest is retried after the backoff of its most attempted email, with up to half of it as jitter.
+    assert before + timedelta(seconds=60) <= retry_at <= datetime.utcnow() + timedelta(seconds=120)
+
+
+def test_failed_sends_are_given_up_after_max_attempts(closed_port, repository):
+    recorded = repository([_email(1, "a@test.com", attempts=3)])
+
+    assert _send_due(_outbox(closed_port, max_attempts=3)) == 1
+
+    assert recorded.failed[0][2] is None
+
+
+def test_retry_backoff_doubles_up_to_the_maximum(monkeypatch):
+    monkeypatch.setattr(outbox_module.random, "uniform", lambda low, high: high)
+    outbox = EmailOutbox(retry_base_seconds=30, retry_max_seconds=200, max_attempts=6)
+
+    delays = []
+    for attempts in range(1, 7):
+        retry_at = outbox._retry_at(attempts)
+        delays.append(None if retry_at is None else round((retry_at - datetime.utcnow()).total_seconds()))
+
+    assert delays == [30, 60, 120, 200, 200, None]
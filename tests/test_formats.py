@@ -0,0 +1,43 @@
+import struct
+
+from src.utilities.extraction.doc_reader import CFB_SIGNATURE
+from src.utilities.extraction.formats import sniff_format
+
+END_OF_CHAIN = 0xFFFFFFFE
+FREE_SECT = 0xFFFFFFFF
+FAT_SECT = 0xFFFFFFFD
+
+
+def _directory_entry(name: str, entry_type: int) -> bytes:
+    encoded = (name + "\x00").encode("utf-16-le")
+    entry = bytearray(128)
+    entry[:len(encoded)] = encoded
+    struct.pack_into("<HB", entry, 64, len(encoded), entry_type)
+    struct.pack_into("<IQ", entry, 116, END_OF_CHAIN, 0)
+    return bytes(entry)
+
+
+def _compound_file(stream_name: str) -> bytes:
+    """
+    A version 3 compound file holding one empty stream: sector 0 is the FAT, sector 1 the directory.
+    """
+    header = bytearray(512)
+    header[:8] = CFB_SIGNATURE
+    struct.pack_into("<HHHH", header, 0x18, 0x3E, 3, 0xFFFE, 9)
+    struct.pack_into("<H", header, 0x20, 6)
+    struct.pack_into("<IIIIIIII", header, 0x2C, 1, 1, 0, 4096, END_OF_CHAIN, 0, END_OF_CHAIN, 0)
+    struct.pack_into("<109I", header, 0x4C, 0, *([FREE_SECT] * 108))
+    fat = struct.pack("<128I", FAT_SECT, END_OF_CHAIN, *([FREE_SECT] * 126))
+    directory = _directory_entry("Root Entry", 5) + _directory_entry(stream_name, 2) + bytes(256)
+    return bytes(header) + fat + directory
+
+
+def test_word_compound_file_is_doc():
+    data = _compound_file("WordDocument")
+    assert sniff_format(data[:2048], lambda: data) == "doc"
+
+
+def test_other_compound_files_are_not_doc():
+    for stream_name in ("Workbook", "PowerPoint Document", "__properties_version1.0"):
+        data = _compound_file(stream_name)
+        assert sniff_format(data[:2048], lambda: data) is None
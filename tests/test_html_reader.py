@@ -0,0 +1,19 @@
+from src.utilities.extraction.html_reader import read_html_text
+
+
+def test_invalid_utf8_byte_does_not_fail():
+    assert read_html_text(b"<p>ok \xff bad</p>") == "ok \xff bad"
+
+
+def test_undeclared_cp1252_page():
+    assert read_html_text(b"<p>2019 \x96 2020</p>") == "2019 – 2020"
+
+
+def test_latin1_page_served_as_utf8():
+    text = read_html_text(b"<p>caf\xe9 cr\xe8me</p>", content_type="text/html; charset=utf-8")
+    assert text == "caf\xe9 cr\xe8me"
+
+
+def test_declared_charset_is_still_used():
+    html = '<meta charset="utf-8"><p>naïve</p>'.encode("utf-8")
+    assert read_html_text(html) == "naïve"
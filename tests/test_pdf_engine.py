@@ -0,0 +1,17 @@
+from src.utilities.extraction.excerpt import PAGE_SEPARATOR
+from src.utilities.extraction.options import ExtractionOptions
+from src.utilities.extraction.pdf_engine import PDFExtractionEngine
+
+
+def test_join_stops_at_first_incomplete_range():
+    chunks = [["p1", "p2"], ["p3"], ["p5", "p6"]]
+    page_ranges = [[0, 1], [2, 3], [4, 5]]
+    result = PDFExtractionEngine._join(chunks, page_ranges, 6, ExtractionOptions(time_budget_ms=100))
+    assert result.text == PAGE_SEPARATOR.join(["p1", "p2", "p3"])
+    assert result.partial
+
+
+def test_join_keeps_complete_ranges():
+    result = PDFExtractionEngine._join([["p1"], ["p2"]], [[0], [1]], 2, ExtractionOptions())
+    assert result.text == PAGE_SEPARATOR.join(["p1", "p2"])
+    assert not result.partial
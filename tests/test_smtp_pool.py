@@ -0,0 +1,69 @@
+import asyncio
+from email.message import EmailMessage
+
+from src.utilities.email.smtp_pool import SMTPConnectionPool
+
+
+def _pool(port: int, size: int = 1) -> SMTPConnectionPool:
+    return SMTPConnectionPool(
+        size=size, server="127.0.0.1", port=port, username="", password="", use_tls=False, timeout=5
+    )
+
+
+def _message(to_email: str) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = "no-reply@test.com"
+    message["To"] = to_email
+    message["Subject"] = "Hello"
+    message.set_content("Hello")
+    return message
+
+
+def test_send_reuses_the_connection(smtp_server):
+    async def send_all():
+        pool = _pool(smtp_server.port)
+        try:
+            for index in range(3):
+                await pool.send(_message(f"user{index}@test.com"))
+        finally:
+            await pool.close()
+
+    asyncio.run(send_all())
+    handler = smtp_server.handler
+    assert [message["To"] for message in handler.messages] == [f"user{index}@test.com" for index in range(3)]
+    assert len(set(handler.sessions)) == 1
+
+
+def test_send_reconnects_when_the_server_closed_the_connection(start_smtp_server):
+    first = start_smtp_server()
+
+    async def send_across_restart():
+        pool = _pool(first.port)
+        try:
+            await pool.send(_message("before@test.com"))
+            # Stopping the server drops the idle connection the pool still holds.
+            first.stop()
+            second = start_smtp_server(first.port)
+            await pool.send(_message("after@test.com"))
+            return second
+        finally:
+            await pool.close()
+
+    second = asyncio.run(send_across_restart())
+    assert [message["To"] for message in first.handler.messages] == ["before@test.com"]
+    assert [message["To"] for message in second.handler.messages] == ["after@test.com"]
+
+
+def test_concurrent_sends_stay_within_the_pool_size(smtp_server):
+    async def send_concurrently():
+        pool = _pool(smtp_server.port, size=2)
+        try:
+            await asyncio.gather(*(pool.send(_message(f"user{index}@test.com")) for index in range(6)))
+            return len(pool._idle)
+        finally:
+            await pool.close()
+
+    assert asyncio.run(send_concurrently()) == 2
+    handler = smtp_server.handler
+    assert len(handler.messages) == 6
+    assert len(set(handler.sessions)) == 2